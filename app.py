@@ -2,7 +2,9 @@
 PawPal+ Streamlit app"""
 
 import streamlit as st
-from pawpal_system import Owner, Pet, Task, Scheduler
+from pawpal_system import Owner
+from pawpal_service import ScheduleService
+from pawpal_storage import SQLiteStore
 
 st.set_page_config(page_title="PawPal+", page_icon="🐾", layout="centered")
 
@@ -15,21 +17,50 @@ Welcome to the PawPal+ starter app.
 """
 )
 
-#Initialize Owner in session state
-if 'owner' not in st.session_state:
-    st.session_state.owner = Owner(name="Jordan")
+@st.cache_resource
+def get_store() -> SQLiteStore:
+    """Shared SQLite store, opened once per server process."""
+    return SQLiteStore("pawpal.db")
 
-owner = st.session_state.owner
-scheduler = Scheduler(owner=owner)
+@st.cache_resource
+def get_service() -> ScheduleService:
+    """
+    One schedule service per server process, so every caregiver's session
+    shares the same owner, loading saved data if there is any.
+    """
+    store = get_store()
+    saved_owner = store.load_owner("Jordan")
+    if saved_owner is None:
+        saved_owner = Owner(name="Jordan")
+        store.save(saved_owner)
+    # pets stay lazy: each one's tasks are read on first use, under the service's locks
+    return ScheduleService(saved_owner, store)
+
+store = get_store()
+service = get_service()
+owner = service.owner
+scheduler = service.scheduler
+# immutable copy for this render; other sessions may change the owner meanwhile
+snapshot = service.snapshot()
+# counted in the database, so rendering the page does not load every pet's tasks
+task_counts = service.read(store.task_counts, owner)
+pending_total = sum(pending for pending, _ in task_counts.values())
+completed_total = sum(completed for _, completed in task_counts.values())
+has_tasks = pending_total + completed_total > 0
 
 
 #owner info
 st.subheader("Owner Information")
-col1, col2 = st.columns(2)
+col1, col2, col3 = st.columns(3)
 with col1:
     st.metric("Owner Name", owner.name)
 with col2:
-    st.metric("Number of Pets", len(owner.pets))
+    st.metric("Number of Pets", len(snapshot.pets))
+with col3:
+    if len(service.history.states) > 1 and st.button("↩️ Undo last change"):
+        service.undo()
+        service.flush()
+        st.rerun()
 st.divider()
 
 #Add a pet
@@ -44,16 +75,20 @@ with col3:
 
 if st.button("Add Pet"):
     # Create Pet object and add to Owner
-    new_pet = Pet(name=pet_name, species=species, age=age)
-    owner.add_pet(new_pet)
-    st.success(f"Added {pet_name} ({species}, age {age}) to {owner.name}'s pets!")
-    st.rerun()
+    try:
+        service.add_pet(pet_name, species, age)
+    except ValueError as error:
+        # pet names are unique per owner
+        st.error(str(error))
+    else:
+        st.success(f"Added {pet_name} ({species}, age {age}) to {owner.name}'s pets!")
+        service.flush()
+        st.rerun()
 
-if owner.pets:
+if snapshot.pets:
     st.write("### Current Pets:")
-    for pet in owner.get_all_pets():
-        pending_count = len(pet.get_all_tasks())
-        completed_count = len([t for t in pet.get_all_tasks() if t.completion_status])
+    for pet in snapshot.pets:
+        pending_count, completed_count = task_counts.get(pet.name, (0, 0))
         st.write(
             (
                 f"- {pet.name} ({pet.species}, {pet.age} years old) - "
@@ -68,11 +103,11 @@ st.divider()
 # Add tasks for a pet
 st.subheader("📝 Add Tasks for a Pet")
 
-if owner.pets:
-    pet_names = [pet.name for pet in owner.get_all_pets()]
+if snapshot.pets:
+    pet_names = [pet.name for pet in snapshot.pets]
     selected_pet_name = st.selectbox("Select Pet", pet_names, key="task_pet_select")
 
-    col1, col2, col3 = st.columns(3)
+    col1, col2, col3, col4 = st.columns(4)
     with col1:
         task_description = st.text_input(
             "Task description",
@@ -83,22 +118,23 @@ if owner.pets:
     with col3:
         frequency = st.selectbox("Frequency", ["daily", "weekly", "monthly"],
                                  index=0, key="new_task_freq")
+    with col4:
+        task_duration = st.number_input("Duration (min)", min_value=0, max_value=600,
+                                        value=0, key="new_task_duration")
 
     if st.button("Add Task", type="primary"):
-        SELECTED_PET = None
-        for pet in owner.get_all_pets():
-            if pet.name == selected_pet_name:
-                SELECTED_PET = pet
-                break
+        SELECTED_PET = snapshot.pet(selected_pet_name)
 
         if SELECTED_PET:
-            new_task = Task(
-                description=task_description,
-                time=task_time.strftime('%H:%M'),
-                frequency=frequency
+            service.add_task(
+                SELECTED_PET.pet_id,
+                task_description,
+                task_time.strftime('%H:%M'),
+                frequency,
+                duration=task_duration or None
             )
-            SELECTED_PET.add_task(new_task)
             st.success(f"✅ Added task '{task_description}' to {selected_pet_name}!")
+            service.flush()
             st.rerun()
 else:
     st.warning("⚠️ Add a pet first before creating tasks.")
@@ -108,13 +144,13 @@ st.divider()
 # view all tasks
 st.subheader("📋 All Tasks")
 
-if owner.pets:
+if snapshot.pets:
     # Filtering options
     col1, col2 = st.columns(2)
     with col1:
         filter_pet = st.selectbox(
             "Filter by Pet",
-            ["All Pets"] + [pet.name for pet in owner.get_all_pets()],
+            ["All Pets"] + [pet.name for pet in snapshot.pets],
             key="filter_pet"
         )
     with col2:
@@ -124,52 +160,30 @@ if owner.pets:
             key="filter_status"
         )
 
-    # Apply filters
-    if filter_pet == "All Pets":
-        filtered_tasks = owner.get_all_tasks()
-        DISPLAY_BY_PET = True
-    else:
-        filtered_tasks = scheduler.filter_tasks(pet_name=filter_pet)
-        DISPLAY_BY_PET = False
-
-    if filter_status == "Pending":
-        filtered_tasks = [t for t in filtered_tasks if not t.completion_status]
-    elif filter_status == "Completed":
-        filtered_tasks = [t for t in filtered_tasks if t.completion_status]
-
-    # Sort tasks by time
-    sorted_tasks = scheduler.sort_by_time(filtered_tasks)
-
-    if sorted_tasks:
-        if DISPLAY_BY_PET:
-            # Group by pet
-            for pet in owner.get_all_pets():
-                pet_tasks = [t for t in sorted_tasks if t.parent_pet == pet]
-                if pet_tasks:
-                    st.write(f"**{pet.name}'s Tasks:**")
-                    for task in pet_tasks:
-                        STATUS_ICON = "✅" if task.completion_status else "⏳"
-                        col1, col2, col3 = st.columns([1, 3, 1])
-                        with col1:
-                            st.write(f"{STATUS_ICON} **{task.time}**")
-                        with col2:
-                            st.write(f"{task.description} ({task.frequency})")
-                        with col3:
-                            if not task.completion_status:
-                                if st.button("✓ Complete", key=f"complete_{id(task)}"):
-                                    task.mark_complete()
-                                    st.success(
-                                        (
-                                            f"Task '{task.description}' "
-                                            f" completed! Next occurrence created."
-                                        )
-                                    )
-                                    st.rerun()
-                    st.write("")
-        else:
-            # Single pet view
-            st.write(f"**{filter_pet}'s Tasks:**")
-            for task in sorted_tasks:
+    # Page through the filtered tasks; the cursor stack lets "Previous" step back
+    PAGE_SIZE = 20
+    status_filter = {"All": None, "Pending": False, "Completed": True}[filter_status]
+    pet_filter = None if filter_pet == "All Pets" else filter_pet
+    if st.session_state.get('task_page_filters') != (pet_filter, status_filter):
+        st.session_state.task_page_filters = (pet_filter, status_filter)
+        st.session_state.task_page_cursors = [None]
+    cursors = st.session_state.task_page_cursors
+    page = service.read(
+        scheduler.task_page,
+        limit=PAGE_SIZE,
+        cursor=cursors[-1],
+        completion_status=status_filter,
+        pet_name=pet_filter
+    )
+    if not page.groups and len(cursors) > 1:
+        # the page emptied (e.g. its last tasks were removed); go back one
+        cursors.pop()
+        st.rerun()
+
+    if page.groups:
+        for pet, pet_tasks in page.groups:
+            st.write(f"**{pet.name}'s Tasks:**")
+            for task in pet_tasks:
                 STATUS_ICON = "✅" if task.completion_status else "⏳"
                 col1, col2, col3 = st.columns([1, 3, 1])
                 with col1:
@@ -178,12 +192,26 @@ if owner.pets:
                     st.write(f"{task.description} ({task.frequency})")
                 with col3:
                     if not task.completion_status:
-                        if st.button("✓ Complete", key=f"complete_{id(task)}"):
-                            task.mark_complete()
+                        if st.button("✓ Complete", key=f"complete_{task.task_id}"):
+                            service.complete_task(pet.pet_id, task.task_id)
                             st.success(
                                 (f"Task '{task.description}' completed! Next occurrence created.")
                             )
+                            service.flush()
                             st.rerun()
+            st.write("")
+
+        col1, col2, col3 = st.columns([1, 3, 1])
+        with col1:
+            if len(cursors) > 1 and st.button("← Previous", key="task_page_prev"):
+                cursors.pop()
+                st.rerun()
+        with col2:
+            st.caption(f"Page {len(cursors)}")
+        with col3:
+            if page.next_cursor is not None and st.button("Next →", key="task_page_next"):
+                cursors.append(page.next_cursor)
+                st.rerun()
     else:
         st.info("No tasks match your filters.")
 else:
@@ -194,16 +222,22 @@ st.divider()
 # conflict warnings
 st.subheader("⚠️ Conflict Detection")
 
-if owner.pets and owner.get_all_tasks():
-    warnings = scheduler.conflict_warnings()
+if not has_tasks:
+    st.info("Add tasks to check for conflicts.")
+elif st.button("Check for Conflicts"):
+    # owner-wide query: loads every pet's tasks
+    warnings = service.read(scheduler.conflict_warnings)
     if warnings:
         st.warning("**Scheduling Conflicts Detected:**")
         for warning in warnings:
             st.write(f"• {warning}")
     else:
         st.success("✅ No scheduling conflicts detected!")
-else:
-    st.info("Add tasks to check for conflicts.")
+    for first, second in service.read(scheduler.detect_overlaps):
+        st.write(
+            f"• Overlap: {first.description} ({first.time}) runs into "
+            f"{second.description} ({second.time})"
+        )
 
 st.divider()
 
@@ -213,10 +247,10 @@ st.subheader("📅 Daily Schedule")
 col1, col2 = st.columns(2)
 with col1:
     if st.button("Generate Daily Schedule", type="primary"):
-        if not owner.pets:
+        if not snapshot.pets:
             st.warning("⚠️ Please add at least one pet first.")
         else:
-            daily_schedule = scheduler.generate_daily_schedule()
+            daily_schedule = service.read(scheduler.generate_daily_schedule)
 
             if any(daily_schedule.values()):
                 st.success("📅 Daily Schedule Generated!")
@@ -244,13 +278,14 @@ with col1:
 
 with col2:
     if st.button("Show Overdue Tasks"):
-        overdue_tasks = scheduler.get_overdue_tasks()
+        overdue_tasks = service.read(scheduler.get_overdue_tasks)
         if overdue_tasks:
             st.warning(f"⚠️ {len(overdue_tasks)} Overdue Tasks Found!")
-            sorted_overdue = scheduler.sort_by_time(overdue_tasks)
-            for task in sorted_overdue:
+            # already ordered by due date, then time
+            for task in overdue_tasks:
+                due = f"{task.due_date.isoformat()} " if task.due_date else ""
                 st.write(
-                    ( f"• **{task.time}** - {task.description} "
+                    ( f"• **{due}{task.time}** - {task.description} "
                      f"({task.parent_pet.name if task.parent_pet else 'Unknown'})"
                     )
                 )
@@ -259,35 +294,54 @@ with col2:
 
 st.divider()
 
+# week calendar
+st.subheader("🗓️ This Week")
+
+if not has_tasks:
+    st.info("Add tasks to see your week.")
+elif st.button("Show This Week"):
+    # one pass over the tasks fills all seven day buckets
+    for day, day_tasks in service.read(scheduler.week_view).items():
+        with st.expander(f"{day.strftime('%A %d %b')} - {len(day_tasks)} tasks"):
+            for task in day_tasks:
+                st.write(
+                    f"• **{task.time}** - {task.description} "
+                    f"({task.parent_pet.name if task.parent_pet else 'Unknown'}, {task.frequency})"
+                )
+
+st.divider()
+
 # task statistics
 st.subheader("📊 Task Statistics")
 
-if owner.get_all_tasks():
+if has_tasks:
     col1, col2, col3 = st.columns(3)
 
-    all_tasks = owner.get_all_tasks()
-    pending_tasks = [t for t in all_tasks if not t.completion_status]
-    completed_tasks = [t for t in all_tasks if t.completion_status]
-
     with col1:
-        st.metric("Total Tasks", len(all_tasks))
+        st.metric("Total Tasks", pending_total + completed_total)
     with col2:
-        st.metric("Pending", len(pending_tasks))
+        st.metric("Pending", pending_total)
     with col3:
-        st.metric("Completed", len(completed_tasks))
-
-    # Frequency breakdown
-    st.write("**Tasks by Frequency:**")
-    freq_col1, freq_col2, freq_col3 = st.columns(3)
-    with freq_col1:
-        daily_count = len(scheduler.get_tasks_by_frequency("daily"))
-        st.metric("Daily", daily_count)
-    with freq_col2:
-        weekly_count = len(scheduler.get_tasks_by_frequency("weekly"))
-        st.metric("Weekly", weekly_count)
-    with freq_col3:
-        monthly_count = len(scheduler.get_tasks_by_frequency("monthly"))
-        st.metric("Monthly", monthly_count)
+        st.metric("Completed", completed_total)
+
+    if st.button("Show Breakdown"):
+        # the running counters cover every task, so this loads all pets
+        stats = service.read(scheduler.stats)
+
+        # Frequency breakdown
+        st.write("**Tasks by Frequency:**")
+        freq_col1, freq_col2, freq_col3 = st.columns(3)
+        with freq_col1:
+            st.metric("Daily", service.read(stats.count, frequency="daily"))
+        with freq_col2:
+            st.metric("Weekly", service.read(stats.count, frequency="weekly"))
+        with freq_col3:
+            st.metric("Monthly", service.read(stats.count, frequency="monthly"))
+
+        # Rolling completion rate per pet
+        st.write("**Completions per day (last 7 days):**")
+        for pet in snapshot.pets:
+            st.write(f"- {pet.name}: {service.read(stats.completion_rate, pet):.1f}")
 else:
     st.info("No task statistics available yet.")
 
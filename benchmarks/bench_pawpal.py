@@ -0,0 +1,237 @@
+"""
+Benchmark harness for Scheduler and model hot paths.
+
+Usage:
+    python -m benchmarks.bench_pawpal --pets 200 --tasks 20 --save baseline.json
+    python -m benchmarks.bench_pawpal --pets 200 --tasks 20 --compare baseline.json
+    python -m benchmarks.bench_pawpal --owners 50 --pets 20 --tasks 10
+"""
+
+import argparse
+import json
+import platform
+import random
+import time
+import tracemalloc
+from datetime import date, datetime
+from typing import Callable, Dict, List, Optional
+
+from pawpal_fleet import build_report
+from pawpal_planner import DailyPlanner
+from pawpal_system import Owner, Pet, Task, Scheduler
+
+SPECIES = ["dog", "cat", "bird", "other"]
+DESCRIPTIONS = ["Walk", "Feed", "Meds", "Groom", "Play", "Litter box", "Brush teeth"]
+FREQUENCIES = ["daily"] * 6 + ["weekly"] * 3 + ["monthly"]
+# (mean minute, spread) for the morning and evening rush plus a flat daytime band
+TIME_PEAKS = [(7 * 60 + 30, 45), (18 * 60, 60)]
+
+
+def random_time(rng: random.Random) -> str:
+    """Pick a realistic 'HH:MM': mostly morning/evening peaks, some spread over the day."""
+    if rng.random() < 0.8:
+        mean, spread = rng.choice(TIME_PEAKS)
+        minute = int(rng.gauss(mean, spread))
+    else:
+        minute = rng.randrange(6 * 60, 22 * 60)
+    minute = min(max(minute, 0), 24 * 60 - 1)
+    # owners tend to pick round times
+    minute -= minute % rng.choice([1, 5, 15, 30])
+    return f"{minute // 60:02d}:{minute % 60:02d}"
+
+
+def make_fleet(
+    seed: int = 0,
+    owners: int = 1,
+    pets: int = 10,
+    tasks: int = 10,
+    completed_ratio: float = 0.2
+) -> List[Owner]:
+    """Build a deterministic synthetic fleet of owners with pets and tasks."""
+    rng = random.Random(seed)
+    fleet = []
+    today = date.today()
+    for owner_number in range(owners):
+        owner = Owner(name=f"Owner {owner_number}")
+        for pet_number in range(pets):
+            pet = Pet(name=f"Pet {owner_number}-{pet_number}",
+                      species=rng.choice(SPECIES), age=rng.randrange(1, 18))
+            pet.add_tasks(
+                Task(
+                    description=rng.choice(DESCRIPTIONS),
+                    time=random_time(rng),
+                    frequency=rng.choice(FREQUENCIES),
+                    completion_status=rng.random() < completed_ratio,
+                    duration=rng.choice([None, 5, 10, 15, 30, 45]),
+                    due_date=today,
+                )
+                for _ in range(tasks)
+            )
+            owner.add_pet(pet)
+        fleet.append(owner)
+    return fleet
+
+
+def _time_call(function: Callable, repeat: int, setup: Optional[Callable] = None) -> Dict:
+    """Run function repeat times; return best/mean seconds and peak traced bytes."""
+    timings = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+    if setup is not None:
+        setup()
+    tracemalloc.start()
+    function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "best_s": min(timings),
+        "mean_s": sum(timings) / len(timings),
+        "peak_bytes": peak,
+    }
+
+
+def run_benchmarks(
+    seed: int = 0,
+    pets: int = 100,
+    tasks: int = 20,
+    repeat: int = 5,
+    owners: int = 1
+) -> Dict:
+    """
+    Time every Scheduler query, day planning and the main model mutations on
+    the first synthetic owner, plus the nightly report across all owners.
+    """
+    results: Dict[str, Dict] = {}
+    started = time.perf_counter()
+    tracemalloc.start()
+    fleet = make_fleet(seed, owners=owners, pets=pets, tasks=tasks)
+    _, build_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    results["build_fleet"] = {
+        "best_s": time.perf_counter() - started, "mean_s": time.perf_counter() - started,
+        "peak_bytes": build_peak,
+    }
+
+    owner = fleet[0]
+    scheduler = Scheduler(owner)
+    planner = DailyPlanner(owner)
+    first_pet = owner.pets[0].name
+    now = datetime.now().replace(hour=12, minute=0)
+    today = date.today()
+    queries = {
+        "detect_conflicts": scheduler.detect_conflicts,
+        "conflict_warnings": scheduler.conflict_warnings,
+        "detect_overlaps": scheduler.detect_overlaps,
+        "get_tasks_by_frequency": lambda: scheduler.get_tasks_by_frequency("daily"),
+        "get_overdue_tasks": lambda: scheduler.get_overdue_tasks(now=now),
+        "tasks_between": lambda: scheduler.tasks_between("07:00", "09:00"),
+        "get_tasks_for_pet": lambda: scheduler.get_tasks_for_pet(first_pet),
+        "generate_daily_schedule": scheduler.generate_daily_schedule,
+        "filter_tasks": lambda: scheduler.filter_tasks(completion_status=False),
+        "filter_tasks_by_pet": lambda: scheduler.filter_tasks(pet_name=first_pet),
+        "sort_by_time": lambda: scheduler.sort_by_time(owner.tasks),
+        "occurrences_30_days": lambda: sum(
+            1 for _ in scheduler.occurrences(today, date.fromordinal(today.toordinal() + 30))
+        ),
+        "pet_task_counts": scheduler.pet_task_counts,
+        "schedule_for_range_90_days": lambda: scheduler.schedule_for_range(
+            today, date.fromordinal(today.toordinal() + 89)
+        ),
+    }
+    for name, query in queries.items():
+        # cold timings: drop memoized results before every run
+        results[name] = _time_call(query, repeat, setup=scheduler.clear_cache)
+    results["cached_detect_conflicts"] = _time_call(scheduler.detect_conflicts, repeat)
+    results["plan_day"] = _time_call(lambda: planner.plan(today), repeat)
+    results["plan_day_refined"] = _time_call(lambda: planner.plan(today, refine=True), repeat)
+    results["fleet_reports"] = _time_call(
+        lambda: [build_report(member, now) for member in fleet], repeat
+    )
+
+    def recurrence_chain():
+        pending = scheduler.filter_tasks(completion_status=False)[:200]
+        for task in pending:
+            task.mark_complete()
+    results["mark_complete_chain_200"] = _time_call(recurrence_chain, 1)
+    results["complete_tasks_200"] = _time_call(
+        lambda: scheduler.complete_tasks(scheduler.filter_tasks(completion_status=False)[:200]), 1
+    )
+
+    def add_and_remove():
+        pet = owner.pets[-1]
+        added = [Task(description="Bench", time="10:00", frequency="daily") for _ in range(200)]
+        for task in added:
+            pet.add_task(task)
+        for task in added:
+            pet.remove_task(task)
+    results["add_remove_200"] = _time_call(add_and_remove, repeat)
+
+    return {
+        "meta": {
+            "seed": seed, "owners": owners, "pets": pets, "tasks_per_pet": tasks, "repeat": repeat,
+            "python": platform.python_version(), "timestamp": datetime.now().isoformat(),
+        },
+        "results": results,
+    }
+
+
+def compare(baseline: Dict, current: Dict, threshold: float = 1.25) -> List[str]:
+    """Return a line per benchmark whose best time grew by more than threshold."""
+    regressions = []
+    for name, stats in current["results"].items():
+        before = baseline["results"].get(name)
+        if before is None or before["best_s"] <= 0:
+            continue
+        ratio = stats["best_s"] / before["best_s"]
+        if ratio > threshold:
+            regressions.append(
+                f"{name}: {before['best_s'] * 1e3:.3f} ms -> {stats['best_s'] * 1e3:.3f} ms "
+                f"({ratio:.2f}x)"
+            )
+    return regressions
+
+
+def format_report(report: Dict) -> str:
+    """Render results as an aligned text table."""
+    lines = [f"{'benchmark':<28}{'best ms':>12}{'mean ms':>12}{'peak KiB':>12}"]
+    for name, stats in report["results"].items():
+        lines.append(
+            f"{name:<28}{stats['best_s'] * 1e3:>12.3f}{stats['mean_s'] * 1e3:>12.3f}"
+            f"{stats['peak_bytes'] / 1024:>12.1f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point; returns 1 when --compare finds regressions."""
+    parser = argparse.ArgumentParser(description="Benchmark PawPal+ scheduler hot paths.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--owners", type=int, default=1)
+    parser.add_argument("--pets", type=int, default=100, help="pets per owner")
+    parser.add_argument("--tasks", type=int, default=20, help="tasks per pet")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--save", help="write results as a JSON baseline")
+    parser.add_argument("--compare", help="compare against a JSON baseline")
+    parser.add_argument("--threshold", type=float, default=1.25)
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(args.seed, args.pets, args.tasks, args.repeat, args.owners)
+    print(format_report(report))
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as handle:
+            regressions = compare(json.load(handle), report, args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,99 @@
+"""
+Multi-threaded load test for ScheduleService.
+
+Usage:
+    python -m benchmarks.load_service --threads 8 --pets 50 --operations 2000
+"""
+
+import argparse
+import random
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from benchmarks.bench_pawpal import DESCRIPTIONS, make_fleet, random_time
+from pawpal_service import ScheduleService, StaleVersionError
+
+
+def _worker(service: ScheduleService, seed: int, operations: int) -> Counter:
+    """Run a mixed read/write workload; return counts per outcome."""
+    rng = random.Random(seed)
+    counts: Counter = Counter()
+    for _ in range(operations):
+        snapshot = service.snapshot()
+        pet = rng.choice(snapshot.pets)
+        roll = rng.random()
+        try:
+            if roll < 0.5:
+                counts["reads"] += sum(1 for task in pet.tasks if not task.completed)
+                counts["snapshot"] += 1
+            elif roll < 0.75:
+                service.add_task(
+                    pet.pet_id, rng.choice(DESCRIPTIONS), random_time(rng), "daily",
+                    expected_version=pet.version,
+                )
+                counts["add_task"] += 1
+            else:
+                pending = [task.task_id for task in pet.tasks if not task.completed]
+                if not pending:
+                    continue
+                service.complete_task(
+                    pet.pet_id, rng.choice(pending), expected_version=pet.version
+                )
+                counts["complete_task"] += 1
+        except StaleVersionError:
+            counts["stale"] += 1
+    return counts
+
+
+def run_load_test(
+    threads: int = 8,
+    pets: int = 50,
+    tasks: int = 20,
+    operations: int = 2000,
+    seed: int = 0
+) -> Dict:
+    """
+    Drive one ScheduleService from several threads and report throughput.
+    Also checks that the owner's indexes still agree with the pets' task lists.
+    """
+    owner = make_fleet(seed, owners=1, pets=pets, tasks=tasks)[0]
+    service = ScheduleService(owner)
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        results = list(executor.map(
+            _worker, [service] * threads, range(seed, seed + threads), [operations] * threads
+        ))
+    elapsed = time.perf_counter() - started
+    totals: Counter = sum(results, Counter())
+    completed_ops = sum(totals[name] for name in ("snapshot", "add_task", "complete_task"))
+    return {
+        "threads": threads,
+        "seconds": elapsed,
+        "ops_per_second": completed_ops / elapsed if elapsed else 0.0,
+        "counts": dict(totals),
+        "consistent": len(owner.task_index) == len(owner.tasks),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point; returns 1 if the indexes ended up inconsistent."""
+    parser = argparse.ArgumentParser(description="Load test the PawPal+ schedule service.")
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--pets", type=int, default=50)
+    parser.add_argument("--tasks", type=int, default=20, help="tasks per pet")
+    parser.add_argument("--operations", type=int, default=2000, help="operations per thread")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    report = run_load_test(args.threads, args.pets, args.tasks, args.operations, args.seed)
+    print(f"{report['threads']} threads: {report['ops_per_second']:.0f} ops/s "
+          f"in {report['seconds']:.2f}s")
+    for name, count in sorted(report["counts"].items()):
+        print(f"  {name:<14}{count:>10}")
+    return 0 if report["consistent"] else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
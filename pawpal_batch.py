@@ -0,0 +1,153 @@
+"""
+Vectorized batch scheduling over many owners using NumPy arrays.
+"""
+
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from pawpal_system import Owner, Task
+
+NO_MINUTE = -1
+NO_DUE_DATE = 0
+
+
+class BatchScheduler:
+    """
+    Read-only snapshot of many owners' tasks held as NumPy columns.
+    Filters, sorts, overdue checks and same-minute conflict counts run as array
+    operations; results come back as the original Task objects. Build a new
+    snapshot after the owners change.
+    """
+
+    def __init__(self, owners: Iterable[Owner]):
+        """Snapshot every task of every owner into arrays."""
+        self.owners: List[Owner] = list(owners)
+        self.pets = [pet for owner in self.owners for pet in owner.pets]
+        pet_owner = [
+            owner_index for owner_index, owner in enumerate(self.owners) for _ in owner.pets
+        ]
+        tasks: List[Task] = []
+        pet_index: List[int] = []
+        for index, pet in enumerate(self.pets):
+            tasks.extend(pet.tasks)
+            pet_index.extend([index] * len(pet.tasks))
+
+        self.frequency_names: List[str] = []
+        codes: Dict[str, int] = {}
+        count = len(tasks)
+        self.tasks = np.empty(count, dtype=object)
+        self.tasks[:] = tasks
+        self.minute = np.fromiter(
+            (NO_MINUTE if task.minute is None else task.minute for task in tasks),
+            dtype=np.int16, count=count,
+        )
+        self.frequency = np.fromiter(
+            (codes.setdefault(task.frequency, len(codes)) for task in tasks),
+            dtype=np.int32, count=count,
+        )
+        self.frequency_names = list(codes)
+        self.completed = np.fromiter(
+            (task.completion_status for task in tasks), dtype=bool, count=count
+        )
+        self.due = np.fromiter(
+            (NO_DUE_DATE if task.due_date is None else task.due_date.toordinal()
+             for task in tasks),
+            dtype=np.int32, count=count,
+        )
+        self.pet = np.asarray(pet_index, dtype=np.int32)
+        self.owner = np.asarray(pet_owner, dtype=np.int32)[self.pet] if count else self.pet
+
+    def __len__(self) -> int:
+        """Return the number of tasks in the snapshot."""
+        return len(self.tasks)
+
+    def mask(
+        self,
+        frequency: Optional[str] = None,
+        completion_status: Optional[bool] = None,
+        pet_name: Optional[str] = None
+    ) -> np.ndarray:
+        """Return a boolean mask selecting tasks that match every given filter."""
+        selected = np.ones(len(self), dtype=bool)
+        if frequency is not None:
+            if frequency not in self.frequency_names:
+                return np.zeros(len(self), dtype=bool)
+            selected &= self.frequency == self.frequency_names.index(frequency)
+        if completion_status is not None:
+            selected &= self.completed == bool(completion_status)
+        if pet_name is not None:
+            pet_ids = [index for index, pet in enumerate(self.pets) if pet.name == pet_name]
+            selected &= np.isin(self.pet, pet_ids)
+        return selected
+
+    def filter_tasks(
+        self,
+        completion_status: Optional[bool] = None,
+        pet_name: Optional[str] = None
+    ) -> List[Task]:
+        """Filter tasks by completion status and/or pet name."""
+        return self.tasks[self.mask(completion_status=completion_status,
+                                    pet_name=pet_name)].tolist()
+
+    def get_tasks_by_frequency(self, frequency: str) -> List[Task]:
+        """Return all tasks with the specified frequency."""
+        return self.tasks[self.mask(frequency=frequency)].tolist()
+
+    def sort_by_time(self, selected: Optional[np.ndarray] = None) -> List[Task]:
+        """Return the selected tasks (default all) ordered by time of day."""
+        indices = np.flatnonzero(selected) if selected is not None else np.arange(len(self))
+        order = indices[np.argsort(self.minute[indices], kind="stable")]
+        return self.tasks[order].tolist()
+
+    def get_overdue_tasks(self, now: Optional[datetime] = None) -> List[Task]:
+        """
+        Return pending tasks overdue at now, ordered like Scheduler.get_overdue_tasks:
+        tasks due on an earlier date (by date, then time), then tasks due today
+        or undated whose time has passed (by time).
+        """
+        now = now or datetime.now()
+        today = now.date().toordinal()
+        current = now.hour * 60 + now.minute
+        pending = ~self.completed
+        earlier = pending & (self.due != NO_DUE_DATE) & (self.due < today)
+        due_today = (
+            pending & ((self.due == NO_DUE_DATE) | (self.due == today))
+            & (self.minute >= 0) & (self.minute < current)
+        )
+        indices = np.flatnonzero(earlier | due_today)
+        days = np.where(earlier[indices], self.due[indices], today)
+        order = indices[np.lexsort((self.minute[indices], days))]
+        return self.tasks[order].tolist()
+
+    def generate_daily_schedule(self) -> Dict[str, Dict[str, List[Task]]]:
+        """Return {owner name: {pet name: pending daily tasks sorted by time}}."""
+        schedule = {
+            owner.name: {pet.name: [] for pet in owner.pets} for owner in self.owners
+        }
+        indices = np.flatnonzero(self.mask(frequency="daily", completion_status=False))
+        order = indices[np.lexsort((self.minute[indices], self.pet[indices]))]
+        pets = self.pet[order]
+        boundaries = np.flatnonzero(np.diff(pets)) + 1
+        for group in np.split(order, boundaries):
+            if len(group):
+                pet = self.pets[self.pet[group[0]]]
+                schedule[pet.owner.name][pet.name] = self.tasks[group].tolist()
+        return schedule
+
+    def conflict_counts(self) -> Dict[str, Dict[str, int]]:
+        """
+        Count pending tasks sharing a minute, per owner.
+        Returns {owner name: {'HH:MM': count}} for minutes with two or more tasks.
+        """
+        selected = ~self.completed & (self.minute >= 0)
+        keys = self.owner[selected].astype(np.int64) * 1440 + self.minute[selected]
+        values, counts = np.unique(keys, return_counts=True)
+        result: Dict[str, Dict[str, int]] = {}
+        for key, count in zip(values[counts > 1].tolist(), counts[counts > 1].tolist()):
+            owner_index, minute = divmod(key, 1440)
+            result.setdefault(self.owners[owner_index].name, {})[
+                f"{minute // 60:02d}:{minute % 60:02d}"
+            ] = count
+        return result
@@ -0,0 +1,461 @@
+"""
+Append-only domain event log for PawPal+ with binary segments, replay and
+snapshot plus log-tail recovery.
+"""
+
+import glob
+import json
+import math
+import os
+import struct
+import threading
+import time
+from datetime import date, datetime
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from pawpal_system import Owner, Pet, Task, TaskListener
+
+
+class PetAdded(NamedTuple):
+    """A pet joined the owner."""
+    pet_id: int
+    age: int
+    name: str
+    species: str
+
+
+class PetUpdated(NamedTuple):
+    """A pet was renamed or its species or age changed; carries the new values."""
+    pet_id: int
+    age: int
+    name: str
+    species: str
+
+
+class PetRemoved(NamedTuple):
+    """A pet left the owner (its TaskRemoved events come first)."""
+    pet_id: int
+
+
+class TaskFields(NamedTuple):
+    """Every persisted field of a task."""
+    pet_id: int
+    task_id: int
+    completed: bool
+    duration: Optional[int]
+    due_date: Optional[date]
+    completed_at: Optional[datetime]
+    priority: int
+    window: Optional[Tuple[int, int]]
+    description: str
+    time: str
+    frequency: str
+
+
+class TaskAdded(NamedTuple):
+    """A task was added by a caller."""
+    task: TaskFields
+
+
+class OccurrenceCreated(NamedTuple):
+    """A recurring task's completion generated its next occurrence."""
+    source_id: int
+    task: TaskFields
+
+
+class TaskUpdated(NamedTuple):
+    """A task was edited or reset; carries the new field values."""
+    task: TaskFields
+
+
+class TaskCompleted(NamedTuple):
+    """A task was marked complete."""
+    pet_id: int
+    task_id: int
+    completed_at: Optional[datetime]
+
+
+class TaskRemoved(NamedTuple):
+    """A task was removed (deleted, archived, or its pet was removed)."""
+    pet_id: int
+    task_id: int
+
+
+# record header: sequence number, wall-clock timestamp, event kind, payload length
+_RECORD = struct.Struct('<QdBI')
+# pet_id, task_id, completed, duration, due ordinal, completed_at, priority, window, string lengths
+_TASK = struct.Struct('<qqBiidihhIII')
+# pet_id, age (any real number), name and species lengths
+_PET = struct.Struct('<qdII')
+_IDS = struct.Struct('<qq')
+_COMPLETED = struct.Struct('<qqd')
+_SOURCE = struct.Struct('<q')
+KINDS = [
+    PetAdded, PetRemoved, TaskAdded, OccurrenceCreated, TaskUpdated, TaskCompleted, TaskRemoved,
+    PetUpdated,
+]
+_KIND_CODES = {kind: code for code, kind in enumerate(KINDS)}
+
+
+def task_fields(task: Task) -> TaskFields:
+    """Capture a live task's fields."""
+    return TaskFields(
+        task.parent_pet.pet_id, task.task_id, task.completion_status, task.duration,
+        task.due_date, task.completed_at, task.priority, task.window,
+        task.description, task.time, str(task.frequency),
+    )
+
+
+def _timestamp(value: Optional[datetime]) -> float:
+    """Encode an optional datetime as a float (NaN for None)."""
+    return value.timestamp() if value is not None else math.nan
+
+
+def _datetime(value: float) -> Optional[datetime]:
+    """Decode a float written by _timestamp."""
+    return None if math.isnan(value) else datetime.fromtimestamp(value)
+
+
+def _encode_task(fields: TaskFields) -> bytes:
+    """Pack task fields into bytes."""
+    strings = [s.encode('utf-8') for s in (fields.description, fields.time, fields.frequency)]
+    window = fields.window or (-1, -1)
+    return _TASK.pack(
+        fields.pet_id, fields.task_id, fields.completed,
+        -1 if fields.duration is None else fields.duration,
+        fields.due_date.toordinal() if fields.due_date else 0,
+        _timestamp(fields.completed_at), fields.priority, window[0], window[1],
+        *(len(s) for s in strings),
+    ) + b''.join(strings)
+
+
+def _decode_task(payload: bytes, offset: int = 0) -> TaskFields:
+    """Unpack task fields written by _encode_task."""
+    (pet_id, task_id, completed, duration, due, completed_at, priority,
+     window_start, window_end, *lengths) = _TASK.unpack_from(payload, offset)
+    offset += _TASK.size
+    strings = []
+    for length in lengths:
+        strings.append(payload[offset:offset + length].decode('utf-8'))
+        offset += length
+    return TaskFields(
+        pet_id, task_id, bool(completed), None if duration < 0 else duration,
+        date.fromordinal(due) if due else None, _datetime(completed_at), priority,
+        None if window_start < 0 else (window_start, window_end), *strings,
+    )
+
+
+def encode_event(event) -> Tuple[int, bytes]:
+    """Return (kind code, payload) for an event."""
+    kind = type(event)
+    if kind in (PetAdded, PetUpdated):
+        strings = [event.name.encode('utf-8'), event.species.encode('utf-8')]
+        payload = _PET.pack(event.pet_id, event.age, *(len(s) for s in strings)) + b''.join(strings)
+    elif kind is PetRemoved:
+        payload = _IDS.pack(event.pet_id, -1)
+    elif kind is OccurrenceCreated:
+        payload = _SOURCE.pack(event.source_id) + _encode_task(event.task)
+    elif kind in (TaskAdded, TaskUpdated):
+        payload = _encode_task(event.task)
+    elif kind is TaskCompleted:
+        payload = _COMPLETED.pack(event.pet_id, event.task_id, _timestamp(event.completed_at))
+    elif kind is TaskRemoved:
+        payload = _IDS.pack(event.pet_id, event.task_id)
+    else:
+        raise TypeError(f"Not a PawPal+ event: {event!r}")
+    return _KIND_CODES[kind], payload
+
+
+def decode_event(code: int, payload: bytes):
+    """Rebuild an event from its kind code and payload."""
+    kind = KINDS[code]
+    if kind in (PetAdded, PetUpdated):
+        pet_id, age, name_length, species_length = _PET.unpack_from(payload)
+        name = payload[_PET.size:_PET.size + name_length].decode('utf-8')
+        species = payload[_PET.size + name_length:
+                          _PET.size + name_length + species_length].decode('utf-8')
+        return kind(pet_id, int(age) if age.is_integer() else age, name, species)
+    if kind is PetRemoved:
+        return PetRemoved(_IDS.unpack_from(payload)[0])
+    if kind is OccurrenceCreated:
+        return OccurrenceCreated(_SOURCE.unpack_from(payload)[0], _decode_task(payload, _SOURCE.size))
+    if kind in (TaskAdded, TaskUpdated):
+        return kind(_decode_task(payload))
+    if kind is TaskCompleted:
+        pet_id, task_id, completed_at = _COMPLETED.unpack_from(payload)
+        return TaskCompleted(pet_id, task_id, _datetime(completed_at))
+    return TaskRemoved(*_IDS.unpack_from(payload))
+
+
+def _segments(directory: str) -> List[str]:
+    """Segment files in sequence order."""
+    return sorted(glob.glob(os.path.join(directory, "events-*.log")))
+
+
+def _snapshots(directory: str) -> List[str]:
+    """Snapshot files in sequence order."""
+    return sorted(glob.glob(os.path.join(directory, "snapshot-*.json")))
+
+
+def read_segment(path: str) -> Iterator[Tuple[int, float, object]]:
+    """Yield (seq, timestamp, event) from one segment, stopping at a torn tail."""
+    with open(path, 'rb') as handle:
+        data = handle.read()
+    offset = 0
+    while offset + _RECORD.size <= len(data):
+        seq, timestamp, code, length = _RECORD.unpack_from(data, offset)
+        offset += _RECORD.size
+        if offset + length > len(data):
+            return
+        yield seq, timestamp, decode_event(code, data[offset:offset + length])
+        offset += length
+
+
+def read_events(directory: str, after: int = 0) -> Iterator[Tuple[int, float, object]]:
+    """Yield (seq, timestamp, event) for every logged event with seq > after."""
+    for path in _segments(directory):
+        for record in read_segment(path):
+            if record[0] > after:
+                yield record
+
+
+def apply_event(owner: Owner, event) -> None:
+    """Replay one event onto owner."""
+    kind = type(event)
+    if kind is PetAdded:
+        owner.add_pet(Pet(event.name, event.species, event.age, pet_id=event.pet_id))
+    elif kind is PetUpdated:
+        pet = owner.get_pet_by_id(event.pet_id)
+        pet.name, pet.species, pet.age = event.name, event.species, event.age
+    elif kind is PetRemoved:
+        owner.remove_pet(owner.get_pet_by_id(event.pet_id))
+    elif kind is TaskCompleted:
+        task = owner.get_pet_by_id(event.pet_id).get_task(event.task_id)
+        task.completion_status = True
+        task.completed_at = event.completed_at
+        task._reindex()
+    elif kind is TaskRemoved:
+        pet = owner.get_pet_by_id(event.pet_id)
+        pet.remove_task(pet.get_task(event.task_id))
+    elif kind is TaskUpdated:
+        fields = event.task
+        task = owner.get_pet_by_id(fields.pet_id).get_task(fields.task_id)
+        task.description, task.duration, task.priority = (
+            fields.description, fields.duration, fields.priority
+        )
+        task.window, task.completed_at = fields.window, fields.completed_at
+        task.completion_status = fields.completed
+        # the property setters refresh the owner's indexes
+        task.time, task.frequency, task.due_date = fields.time, fields.frequency, fields.due_date
+    else:
+        task = _build_task(event.task)
+        if kind is OccurrenceCreated:
+            task.source_id = event.source_id
+        owner.get_pet_by_id(event.task.pet_id).add_task(task)
+
+
+def _build_task(fields: TaskFields) -> Task:
+    """Create a live task from logged fields."""
+    task = Task(
+        description=fields.description,
+        time=fields.time,
+        frequency=fields.frequency,
+        completion_status=fields.completed,
+        duration=fields.duration,
+        due_date=fields.due_date,
+        task_id=fields.task_id,
+        priority=fields.priority,
+    )
+    task.completed_at = fields.completed_at
+    task.window = fields.window
+    return task
+
+
+def recover(directory: str) -> Tuple[Owner, int]:
+    """
+    Rebuild an owner from the newest snapshot plus the events logged after it.
+    Returns (owner, last sequence number). Rebuild time is bounded by the
+    snapshot size and the log tail, which checkpoint() keeps short.
+    """
+    snapshots = _snapshots(directory)
+    if not snapshots:
+        raise ValueError(f"No snapshot found in {directory}.")
+    with open(snapshots[-1], encoding='utf-8') as handle:
+        state = json.load(handle)
+    owner = Owner(name=state["owner"])
+    for pet_state in state["pets"]:
+        pet = Pet(pet_state["name"], pet_state["species"], pet_state["age"],
+                  pet_id=pet_state["pet_id"])
+        pet.add_tasks(_build_task(_fields_from_json(row)) for row in pet_state["tasks"])
+        owner.add_pet(pet)
+    last = state["seq"]
+    for seq, _, event in read_events(directory, after=last):
+        apply_event(owner, event)
+        last = seq
+    return owner, last
+
+
+def _fields_to_json(fields: TaskFields) -> Dict:
+    """TaskFields as JSON-friendly values."""
+    row = fields._asdict()
+    row["due_date"] = fields.due_date.isoformat() if fields.due_date else None
+    row["completed_at"] = fields.completed_at.timestamp() if fields.completed_at else None
+    return row
+
+
+def _fields_from_json(row: Dict) -> TaskFields:
+    """Inverse of _fields_to_json."""
+    row = dict(row)
+    row["due_date"] = date.fromisoformat(row["due_date"]) if row["due_date"] else None
+    row["completed_at"] = (
+        datetime.fromtimestamp(row["completed_at"]) if row["completed_at"] else None
+    )
+    row["window"] = tuple(row["window"]) if row["window"] else None
+    return TaskFields(**row)
+
+
+class EventLog(TaskListener):
+    """
+    Records an owner's mutations as domain events.
+    Listener hooks are translated into PetAdded, PetUpdated, PetRemoved,
+    TaskAdded, OccurrenceCreated (tasks with a source_id), TaskCompleted,
+    TaskUpdated and TaskRemoved, appended to binary segment files in directory and
+    passed to subscriber callbacks as (seq, event). checkpoint() writes a
+    snapshot and drops the segments it covers, so recover() only replays
+    the tail. Lazy pets loading their stored tasks are not logged.
+    """
+
+    def __init__(self, owner: Owner, directory: str, segment_bytes: int = 1 << 20):
+        """Attach to owner, continuing any log already in directory."""
+        self.owner = owner
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self._lock = threading.Lock()
+        self._subscribers: List[Callable] = []
+        os.makedirs(directory, exist_ok=True)
+        self.last_seq = self._last_logged_seq()
+        self._file = None
+        self._completed = {
+            task.task_id
+            for pet in owner.pets if pet.is_loaded
+            for task in pet.tasks if task.completion_status
+        }
+        if not _snapshots(directory):
+            self.checkpoint()
+        owner.subscribe(self, replay=False)
+
+    def subscribe(self, callback: Callable) -> None:
+        """Call callback(seq, event) for every event appended from now on."""
+        self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable) -> None:
+        """Stop calling callback."""
+        self._subscribers.remove(callback)
+
+    def append(self, event) -> int:
+        """Write one event and notify subscribers; return its sequence number."""
+        code, payload = encode_event(event)
+        with self._lock:
+            self.last_seq += 1
+            seq = self.last_seq
+            if self._file is None or self._file.tell() >= self.segment_bytes:
+                self._roll(seq)
+            self._file.write(_RECORD.pack(seq, time.time(), code, len(payload)) + payload)
+            self._file.flush()
+        for callback in list(self._subscribers):
+            callback(seq, event)
+        return seq
+
+    def checkpoint(self) -> str:
+        """Snapshot the owner at the current sequence number and drop covered segments."""
+        with self._lock:
+            state = {
+                "seq": self.last_seq,
+                "owner": self.owner.name,
+                "pets": [
+                    {
+                        "pet_id": pet.pet_id, "name": pet.name,
+                        "species": pet.species, "age": pet.age,
+                        "tasks": [_fields_to_json(task_fields(task)) for task in pet.tasks],
+                    }
+                    for pet in self.owner.pets
+                ],
+            }
+            path = os.path.join(self.directory, f"snapshot-{self.last_seq:012d}.json")
+            with open(path + ".tmp", "w", encoding="utf-8") as handle:
+                json.dump(state, handle)
+            os.replace(path + ".tmp", path)
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            for old in _segments(self.directory) + _snapshots(self.directory)[:-1]:
+                os.remove(old)
+            return path
+
+    def close(self) -> None:
+        """Detach from the owner and close the current segment."""
+        self.owner.unsubscribe(self)
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def _roll(self, seq: int) -> None:
+        """Start a new segment whose first record is seq."""
+        if self._file is not None:
+            self._file.close()
+        self._file = open(os.path.join(self.directory, f"events-{seq:012d}.log"), 'ab')
+
+    def _last_logged_seq(self) -> int:
+        """Highest sequence number already on disk."""
+        last = 0
+        snapshots = _snapshots(self.directory)
+        if snapshots:
+            last = int(os.path.basename(snapshots[-1])[len("snapshot-"):-len(".json")])
+        segments = _segments(self.directory)
+        if segments:
+            for seq, _, _ in read_segment(segments[-1]):
+                last = max(last, seq)
+        return last
+
+    # TaskListener hooks: translate index events into domain events
+
+    def pet_added(self, pet: Pet) -> None:
+        """Log PetAdded."""
+        self.append(PetAdded(pet.pet_id, pet.age, pet.name, pet.species))
+
+    def pet_changed(self, pet: Pet) -> None:
+        """Log PetUpdated."""
+        self.append(PetUpdated(pet.pet_id, pet.age, pet.name, pet.species))
+
+    def pet_removed(self, pet: Pet) -> None:
+        """Log PetRemoved."""
+        self.append(PetRemoved(pet.pet_id))
+
+    def task_added(self, task: Task) -> None:
+        """Log TaskAdded, or OccurrenceCreated for generated occurrences."""
+        if task.completion_status:
+            self._completed.add(task.task_id)
+        if task.source_id is not None:
+            self.append(OccurrenceCreated(task.source_id, task_fields(task)))
+        else:
+            self.append(TaskAdded(task_fields(task)))
+
+    def tasks_loaded(self, pet: Pet, tasks) -> None:
+        """Stored tasks are not new; only note which are already complete."""
+        self._completed.update(task.task_id for task in tasks if task.completion_status)
+
+    def task_removed(self, task: Task) -> None:
+        """Log TaskRemoved."""
+        self._completed.discard(task.task_id)
+        self.append(TaskRemoved(task.parent_pet.pet_id, task.task_id))
+
+    def task_changed(self, task: Task) -> None:
+        """Log TaskCompleted for a new completion, else TaskUpdated."""
+        if task.completion_status and task.task_id not in self._completed:
+            self._completed.add(task.task_id)
+            self.append(TaskCompleted(task.parent_pet.pet_id, task.task_id, task.completed_at))
+            return
+        if not task.completion_status:
+            self._completed.discard(task.task_id)
+        self.append(TaskUpdated(task_fields(task)))
@@ -0,0 +1,190 @@
+"""
+Fleet-wide scheduling: nightly Scheduler reports for many owners across processes.
+"""
+
+import itertools
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from pawpal_system import ConflictEngine, Owner
+
+# (owner name, pet names, task rows); each task row is (task_id, pet position,
+# description, time, minute or -1, frequency, completed, due date ordinal or 0)
+OwnerRows = Tuple[str, Tuple[str, ...], Tuple[tuple, ...]]
+
+
+class OwnerReport(NamedTuple):
+    """Plain-data scheduling results for one owner, safe to send between processes."""
+    owner: str
+    daily_schedule: Dict[str, List[Tuple[str, str]]]
+    conflicts: Dict[str, List[List[Tuple[str, str]]]]
+    overdue: List[Tuple[str, str, str]]
+
+
+def owner_rows(owner: Owner) -> OwnerRows:
+    """
+    Flatten an owner into the compact tuples the report kernel reads.
+    Rows are left in pet order; the worker sorts them, so the parent only
+    reads attributes.
+    """
+    pets = owner.pets
+    return (
+        owner.name,
+        tuple(pet.name for pet in pets),
+        tuple(
+            (task.task_id, position, task.description, task.time,
+             _minute_or_invalid(task.minute), str(task.frequency), task.completion_status,
+             task.due_date.toordinal() if task.due_date else 0)
+            for position, pet in enumerate(pets)
+            for task in pet.tasks
+        ),
+    )
+
+
+def _minute_or_invalid(minute: Optional[int]) -> int:
+    """Minute of day, or -1 for an invalid time."""
+    return -1 if minute is None else minute
+
+
+class _RowTask:
+    """The Task fields ConflictEngine reads, for one pending row; hashed by identity like Task."""
+    __slots__ = ("time", "parent_pet", "completion_status", "description")
+
+    def __init__(self, time: str, pet: int, description: str):
+        """Wrap one pending row; parent_pet is the pet's position."""
+        self.time = time
+        self.parent_pet = pet
+        self.completion_status = False
+        self.description = description
+
+
+def report_from_rows(rows: OwnerRows, now: datetime) -> OwnerReport:
+    """
+    Compute the nightly report from compact rows in one pass plus sorts.
+    Rows are replayed in task_id (creation) order, the order an owner
+    rebuilt from storage adds them. Conflicts come from Scheduler's own
+    ConflictEngine. The daily schedule and overdue list follow
+    generate_daily_schedule and get_overdue_tasks, with ties broken by
+    task order.
+    """
+    name, pet_names, tasks = rows
+    today = now.date().toordinal()
+    now_minute = now.hour * 60 + now.minute
+    schedule: Dict[str, List[Tuple[str, str]]] = {pet: [] for pet in pet_names}
+    engine = ConflictEngine(max_changes=0)
+    earlier, later_today = [], []
+    for order, (_, pet, description, time, minute, frequency, completed, due) in enumerate(
+        sorted(tasks)
+    ):
+        if completed:
+            continue
+        pet_name = pet_names[pet]
+        if frequency == "daily":
+            schedule[pet_name].append((time, description))
+        engine.task_added(_RowTask(time, pet, description))
+        if due and due < today:
+            earlier.append((due, minute, order, (pet_name, time, description)))
+        elif 0 <= minute < now_minute and (not due or due == today):
+            later_today.append((minute, order, (pet_name, time, description)))
+    for entries in schedule.values():
+        entries.sort(key=lambda entry: entry[0])
+
+    conflicts = {
+        time: [[(pet_names[task.parent_pet], task.description) for task in group]
+               for group in groups]
+        for time, groups in engine.conflicts().items()
+    }
+    earlier.sort(key=lambda entry: entry[:3])
+    later_today.sort(key=lambda entry: entry[:2])
+    overdue = [entry[-1] for entry in earlier] + [entry[-1] for entry in later_today]
+    return OwnerReport(name, schedule, conflicts, overdue)
+
+
+def build_report(owner: Owner, now: datetime) -> OwnerReport:
+    """Run the nightly queries for one owner and flatten the results."""
+    return report_from_rows(owner_rows(owner), now)
+
+
+def _run_shard(shard: tuple, now: datetime) -> List[OwnerReport]:
+    """Worker entry point: report on one shard of owner rows, reading them from a store if needed."""
+    if shard[0] == "rows":
+        return [report_from_rows(rows, now) for rows in shard[1]]
+
+    from pawpal_storage import SQLiteStore
+    store = SQLiteStore(shard[1])
+    try:
+        return [report_from_rows(rows, now) for rows in store.owner_rows(shard[2])]
+    finally:
+        store.close()
+
+
+class FleetScheduler:
+    """
+    Produces schedules, conflict reports and overdue scans for many owners.
+    Owners are split into shards of shard_size and processed by a
+    ProcessPoolExecutor. Workers never rebuild Owner objects: they receive
+    compact per-task tuples, or read them straight from a SQLite store; results stream back as shards finish, with at most
+    two shards per worker in flight so large inputs are never fully buffered.
+    """
+
+    def __init__(
+        self,
+        owners: Optional[Iterable[Owner]] = None,
+        shard_size: int = 100,
+        max_workers: Optional[int] = None
+    ):
+        """Create a fleet scheduler over an iterable (or generator) of owners."""
+        self._owners = owners if owners is not None else ()
+        self._store_path: Optional[str] = None
+        self._owner_names: Iterable[str] = ()
+        self.shard_size = shard_size
+        self.max_workers = max_workers
+
+    @classmethod
+    def from_store(
+        cls,
+        path: str,
+        owner_names: Iterable[str],
+        shard_size: int = 100,
+        max_workers: Optional[int] = None
+    ) -> "FleetScheduler":
+        """Create a fleet scheduler whose workers load owners from a SQLite store."""
+        fleet = cls(shard_size=shard_size, max_workers=max_workers)
+        fleet._store_path = path
+        fleet._owner_names = owner_names
+        return fleet
+
+    def _shards(self) -> Iterator[tuple]:
+        """Yield picklable shard descriptions."""
+        if self._store_path is not None:
+            names = iter(self._owner_names)
+            while True:
+                chunk = list(itertools.islice(names, self.shard_size))
+                if not chunk:
+                    return
+                yield ("store", self._store_path, chunk)
+        owners = iter(self._owners)
+        while True:
+            chunk = list(itertools.islice(owners, self.shard_size))
+            if not chunk:
+                return
+            yield ("rows", [owner_rows(owner) for owner in chunk])
+
+    def run(self, now: Optional[datetime] = None) -> Iterator[OwnerReport]:
+        """Yield an OwnerReport per owner, in shard completion order."""
+        now = now or datetime.now()
+        workers = self.max_workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            window = 2 * workers
+            shards = self._shards()
+            in_flight = set()
+            for shard in itertools.islice(shards, window):
+                in_flight.add(executor.submit(_run_shard, shard, now))
+            while in_flight:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for shard in itertools.islice(shards, len(done)):
+                    in_flight.add(executor.submit(_run_shard, shard, now))
+                for future in done:
+                    yield from future.result()
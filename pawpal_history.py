@@ -0,0 +1,295 @@
+"""
+Persistent, structurally shared snapshots of an owner with undo and diffing.
+"""
+
+import threading
+from collections import deque
+from datetime import date, datetime
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from pawpal_system import Owner, Pet, Task, TaskListener
+
+
+class TaskSnapshot(NamedTuple):
+    """Immutable copy of a task's fields."""
+    task_id: int
+    description: str
+    time: str
+    frequency: str
+    completed: bool
+    due_date: Optional[date]
+    duration: Optional[int]
+    priority: int
+    completed_at: Optional[datetime] = None
+    window: Optional[Tuple[int, int]] = None
+
+
+class PetSnapshot(NamedTuple):
+    """
+    Immutable copy of a pet and its tasks at one pet version.
+    tasks is None while a lazy pet's tasks are still in storage.
+    """
+    pet_id: int
+    name: str
+    species: str
+    age: int
+    version: int
+    tasks: Optional[Tuple[TaskSnapshot, ...]]
+
+
+class ScheduleSnapshot(NamedTuple):
+    """Immutable view of the whole owner at one owner version."""
+    version: int
+    pets: Tuple[PetSnapshot, ...]
+
+    def pet(self, name: str) -> Optional[PetSnapshot]:
+        """Return the snapshot of the pet with this name, or None."""
+        return next((pet for pet in self.pets if pet.name == name), None)
+
+
+class Change(NamedTuple):
+    """
+    One difference between two snapshots. kind is pet_added, pet_removed,
+    pet_changed, task_added, task_removed or task_changed; task_id is None
+    for pet changes, and before/after are the snapshots on either side.
+    """
+    kind: str
+    pet_id: int
+    task_id: Optional[int]
+    before: object
+    after: object
+
+
+def snapshot_pet(pet: Pet) -> PetSnapshot:
+    """Copy one pet and its tasks into snapshot tuples, without loading a lazy pet."""
+    if not pet.is_loaded:
+        return PetSnapshot(pet.pet_id, pet.name, pet.species, pet.age, pet.version, None)
+    return PetSnapshot(
+        pet.pet_id, pet.name, pet.species, pet.age, pet.version,
+        tuple(
+            TaskSnapshot(
+                task.task_id, task.description, task.time, str(task.frequency),
+                task.completion_status, task.due_date, task.duration, task.priority,
+                task.completed_at, task.window,
+            )
+            for task in pet.tasks
+        ),
+    )
+
+
+def diff(old: ScheduleSnapshot, new: ScheduleSnapshot) -> List[Change]:
+    """
+    Return the changes that turn old into new. Pets shared between the two
+    snapshots are skipped by identity, so the cost follows what changed.
+    """
+    changes = []
+    new_pets = {pet.pet_id: pet for pet in new.pets}
+    old_ids = set()
+    for before in old.pets:
+        old_ids.add(before.pet_id)
+        after = new_pets.get(before.pet_id)
+        if after is None:
+            changes.append(Change("pet_removed", before.pet_id, None, before, None))
+            continue
+        if after is before:
+            continue
+        if (before.name, before.species, before.age) != (after.name, after.species, after.age):
+            changes.append(Change("pet_changed", before.pet_id, None, before, after))
+        if before.tasks is None or after.tasks is None:
+            continue
+        new_tasks = {task.task_id: task for task in after.tasks}
+        for task in before.tasks:
+            updated = new_tasks.pop(task.task_id, None)
+            if updated is None:
+                changes.append(Change("task_removed", before.pet_id, task.task_id, task, None))
+            elif updated != task:
+                changes.append(Change("task_changed", before.pet_id, task.task_id, task, updated))
+        for task in new_tasks.values():
+            changes.append(Change("task_added", before.pet_id, task.task_id, None, task))
+    for after in new.pets:
+        if after.pet_id not in old_ids:
+            changes.append(Change("pet_added", after.pet_id, None, None, after))
+    return changes
+
+
+class SnapshotHistory(TaskListener):
+    """
+    Keeps a bounded history of immutable owner snapshots.
+    Listener events only mark pets dirty; commit() then builds the next
+    snapshot by re-copying the dirty pets and sharing every other pet
+    snapshot with the previous version. Readers can hold a snapshot for as
+    long as they like at no copy cost. undo() moves the live owner back to
+    the previous snapshot by applying the diff between the two.
+    Lazy pets are recorded without their tasks; when one loads, the stored
+    tasks are filled into every snapshot that shared the unloaded copy.
+    """
+
+    def __init__(self, owner: Owner, limit: int = 100):
+        """Start recording owner, keeping at most limit snapshots."""
+        self.owner = owner
+        self._lock = threading.RLock()
+        self._dirty: Dict[int, None] = {}
+        self._restoring = False
+        self._states = deque(
+            [ScheduleSnapshot(owner.version, tuple(snapshot_pet(pet) for pet in owner.pets))],
+            maxlen=max(limit, 2),
+        )
+        owner.subscribe(self, replay=False)
+
+    @property
+    def current(self) -> ScheduleSnapshot:
+        """
+        The latest committed snapshot. Reading never commits, so a mutation
+        in progress is not captured half done; writers call commit().
+        """
+        return self._states[-1]
+
+    @property
+    def states(self) -> Tuple[ScheduleSnapshot, ...]:
+        """Committed snapshots, oldest first."""
+        return tuple(self._states)
+
+    def commit(self) -> ScheduleSnapshot:
+        """Record the owner's current state as a new snapshot and return it."""
+        with self._lock:
+            previous = self._states[-1]
+            if not self._dirty:
+                return previous
+            dirty, self._dirty = self._dirty, {}
+            shared = {pet.pet_id: pet for pet in previous.pets}
+            pets = []
+            for pet in self.owner.pets:
+                snapshot = shared.get(pet.pet_id)
+                if snapshot is None or pet.pet_id in dirty:
+                    snapshot = snapshot_pet(pet)
+                pets.append(snapshot)
+            state = ScheduleSnapshot(self.owner.version, tuple(pets))
+            self._states.append(state)
+            return state
+
+    def undo(self) -> ScheduleSnapshot:
+        """Restore the live owner to the previous snapshot and return it."""
+        with self._lock:
+            self.commit()
+            if len(self._states) < 2:
+                raise ValueError("Nothing to undo.")
+            current = self._states.pop()
+            changes = diff(current, self._states[-1])
+            self._restoring = True
+            try:
+                self._apply(changes)
+            finally:
+                self._restoring = False
+            # re-copy the restored pets so their versions match the live ones,
+            # then let the fresh snapshot take the target's place
+            self._dirty = {change.pet_id: None for change in changes}
+            if not self._dirty:
+                return self._states[-1]
+            restored = self.commit()
+            del self._states[-2]
+            return restored
+
+    def close(self) -> None:
+        """Stop recording."""
+        self.owner.unsubscribe(self)
+
+    def _apply(self, changes: List[Change]) -> None:
+        """Mutate the live owner according to changes."""
+        owner = self.owner
+        for change in changes:
+            if change.kind == "pet_added":
+                snapshot = change.after
+                pet = Pet(snapshot.name, snapshot.species, snapshot.age, pet_id=snapshot.pet_id)
+                pet.add_tasks(self._build_task(task) for task in snapshot.tasks or ())
+                owner.add_pet(pet)
+                continue
+            pet = owner.get_pet_by_id(change.pet_id)
+            if change.kind == "pet_removed":
+                owner.remove_pet(pet)
+            elif change.kind == "pet_changed":
+                pet.name, pet.species, pet.age = (
+                    change.after.name, change.after.species, change.after.age
+                )
+            elif change.kind == "task_added":
+                pet.add_task(self._build_task(change.after))
+            elif change.kind == "task_removed":
+                pet.remove_task(pet.get_task(change.task_id))
+            else:
+                self._restore_task(pet.get_task(change.task_id), change.after)
+
+    @staticmethod
+    def _build_task(snapshot: TaskSnapshot) -> Task:
+        """Recreate a live task from its snapshot."""
+        task = Task(
+            description=snapshot.description,
+            time=snapshot.time,
+            frequency=snapshot.frequency,
+            completion_status=snapshot.completed,
+            duration=snapshot.duration,
+            due_date=snapshot.due_date,
+            task_id=snapshot.task_id,
+            priority=snapshot.priority,
+        )
+        task.completed_at = snapshot.completed_at
+        task.window = snapshot.window
+        return task
+
+    @staticmethod
+    def _restore_task(task: Task, snapshot: TaskSnapshot) -> None:
+        """Copy snapshot fields back onto a live task."""
+        task.description = snapshot.description
+        task.duration = snapshot.duration
+        task.priority = snapshot.priority
+        task.window = snapshot.window
+        task.completed_at = snapshot.completed_at
+        task.completion_status = snapshot.completed
+        # the property setters refresh the owner's indexes
+        task.time = snapshot.time
+        task.frequency = snapshot.frequency
+        task.due_date = snapshot.due_date
+
+    # TaskListener hooks: remember which pets need re-copying
+
+    def tasks_loaded(self, pet: Pet, tasks) -> None:
+        """Replace the pet's unloaded snapshot with its stored tasks in every state."""
+        with self._lock:
+            unloaded = next(
+                (snapshot for snapshot in self._states[-1].pets if snapshot.pet_id == pet.pet_id),
+                None,
+            )
+            if unloaded is None or unloaded.tasks is not None:
+                return
+            loaded = snapshot_pet(pet)._replace(version=unloaded.version)
+            for position, state in enumerate(self._states):
+                if any(p is unloaded for p in state.pets):
+                    pets = tuple(loaded if p is unloaded else p for p in state.pets)
+                    self._states[position] = state._replace(pets=pets)
+
+    def _touch(self, pet: Optional[Pet]) -> None:
+        """Mark a pet dirty unless an undo is being applied."""
+        if pet is not None and not self._restoring:
+            self._dirty[pet.pet_id] = None
+
+    def pet_added(self, pet: Pet) -> None:
+        """Track a new pet."""
+        self._touch(pet)
+
+    def pet_removed(self, pet: Pet) -> None:
+        """Track a removed pet."""
+        self._touch(pet)
+
+    def pet_changed(self, pet: Pet) -> None:
+        """Track a renamed or edited pet."""
+        self._touch(pet)
+
+    def task_added(self, task: Task) -> None:
+        """Track the pet of a new task."""
+        self._touch(task.parent_pet)
+
+    def task_removed(self, task: Task) -> None:
+        """Track the pet of a removed task."""
+        self._touch(task.parent_pet)
+
+    def task_changed(self, task: Task) -> None:
+        """Track the pet of a changed task."""
+        self._touch(task.parent_pet)
@@ -0,0 +1,234 @@
+"""
+Bulk import and export of owners, pets and tasks as CSV or JSON Lines.
+"""
+
+import csv
+import itertools
+import json
+import re
+from datetime import date
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO
+
+from pawpal_system import Frequency, Owner, Pet, Task, format_minutes
+
+FIELDS = [
+    "owner", "pet", "species", "age", "description", "time", "frequency",
+    "completed", "duration", "due_date", "priority", "window_start", "window_end",
+]
+TIME_PATTERN = re.compile(r"(?:[01]\d|2[0-3]):[0-5]\d")
+FREQUENCIES = frozenset(frequency.value for frequency in Frequency)
+COMPLETED_VALUES = frozenset({"None", "", "0", "1", "False", "True", "false", "true"})
+
+
+def export_rows(owners: Iterable[Owner]) -> Iterator[dict]:
+    """Yield one flat row per task; pets without tasks get a row with no description."""
+    for owner in owners:
+        for pet in owner.pets:
+            base = {"owner": owner.name, "pet": pet.name, "species": pet.species, "age": pet.age}
+            if not pet.tasks:
+                yield dict(base, description="", time="", frequency="", completed="",
+                           duration="", due_date="", priority="", window_start="",
+                           window_end="")
+            for task in pet.tasks:
+                yield dict(
+                    base,
+                    description=task.description,
+                    time=task.time,
+                    frequency=str(task.frequency),
+                    completed=int(task.completion_status),
+                    duration=task.duration or "",
+                    due_date=task.due_date.isoformat() if task.due_date else "",
+                    priority=task.priority,
+                    window_start=format_minutes(task.window[0]) if task.window else "",
+                    window_end=format_minutes(task.window[1]) if task.window else "",
+                )
+
+
+def export_csv(owners: Iterable[Owner], out: TextIO) -> int:
+    """Write owners to a CSV stream; returns the number of rows written."""
+    writer = csv.DictWriter(out, fieldnames=FIELDS)
+    writer.writeheader()
+    count = 0
+    for row in export_rows(owners):
+        writer.writerow(row)
+        count += 1
+    return count
+
+
+def export_jsonl(owners: Iterable[Owner], out: TextIO) -> int:
+    """Write owners as JSON Lines; returns the number of rows written."""
+    count = 0
+    for row in export_rows(owners):
+        out.write(json.dumps(row) + "\n")
+        count += 1
+    return count
+
+
+def import_csv(
+    source: TextIO,
+    chunk_size: int = 10000,
+    strict_frequency: bool = False
+) -> Dict[str, Owner]:
+    """Load owners from a CSV stream produced by export_csv."""
+    return load_rows(csv.DictReader(source), chunk_size, strict_frequency)
+
+
+def import_jsonl(
+    source: TextIO,
+    chunk_size: int = 10000,
+    strict_frequency: bool = False
+) -> Dict[str, Owner]:
+    """Load owners from a JSON Lines stream produced by export_jsonl."""
+    rows = (json.loads(line) for line in source if line.strip())
+    return load_rows(rows, chunk_size, strict_frequency)
+
+
+def load_rows(
+    rows: Iterable[dict],
+    chunk_size: int = 10000,
+    strict_frequency: bool = False
+) -> Dict[str, Owner]:
+    """
+    Build owners from flat rows, reading and validating chunk_size rows at a time.
+    Tasks are collected on detached pets and pets are attached to their owners
+    only at the end, so owner indexes are built in a single pass.
+    Raises ValueError naming the first bad row (1-based) of a chunk.
+    """
+    pets: Dict[tuple, Pet] = {}
+    pending: Dict[tuple, List[Task]] = {}
+    rows = iter(rows)
+    offset = 0
+    while True:
+        chunk = list(itertools.islice(rows, chunk_size))
+        if not chunk:
+            break
+        _validate_chunk(chunk, offset, strict_frequency)
+        for row in chunk:
+            key = (row["owner"], row["pet"])
+            pet = pets.get(key)
+            if pet is None:
+                pet = pets[key] = Pet(
+                    name=row["pet"], species=row["species"], age=int(row["age"] or 0)
+                )
+                pending[key] = []
+            if row["description"]:
+                pending[key].append(_task_from_row(row))
+        offset += len(chunk)
+
+    owners: Dict[str, Owner] = {}
+    for key, pet in pets.items():
+        if key[0] not in owners:
+            owners[key[0]] = Owner(name=key[0])
+        pet.add_tasks(pending[key])
+        owners[key[0]].add_pet(pet)
+    return owners
+
+
+def _validate_chunk(chunk: List[dict], offset: int, strict_frequency: bool) -> None:
+    """Check every row in a chunk before any of it is loaded."""
+    bad_ages = [
+        position for position, row in enumerate(chunk)
+        if row.get("age") not in (None, "") and not str(row["age"]).isdigit()
+    ]
+    if bad_ages:
+        row = chunk[bad_ages[0]]
+        raise ValueError(f"Row {offset + bad_ages[0] + 1}: invalid age '{row['age']}'.")
+    task_rows = [(position, row) for position, row in enumerate(chunk) if row["description"]]
+    bad_times = [
+        position for position, row in task_rows
+        if not TIME_PATTERN.fullmatch(str(row["time"]))
+    ]
+    if bad_times:
+        row = chunk[bad_times[0]]
+        raise ValueError(
+            f"Row {offset + bad_times[0] + 1}: invalid time '{row['time']}', expected 'HH:MM'."
+        )
+    bad_windows = [
+        position for position, row in task_rows
+        if (row.get("window_start") or row.get("window_end")) and not (
+            TIME_PATTERN.fullmatch(str(row.get("window_start")))
+            and TIME_PATTERN.fullmatch(str(row.get("window_end")))
+            and str(row["window_start"]) < str(row["window_end"])
+        )
+    ]
+    if bad_windows:
+        row = chunk[bad_windows[0]]
+        raise ValueError(
+            f"Row {offset + bad_windows[0] + 1}: invalid window "
+            f"'{row.get('window_start')}'-'{row.get('window_end')}', expected 'HH:MM' bounds."
+        )
+    bad_priorities = [
+        position for position, row in task_rows
+        if row.get("priority") not in (None, "") and not str(row["priority"]).lstrip("-").isdigit()
+    ]
+    if bad_priorities:
+        row = chunk[bad_priorities[0]]
+        raise ValueError(
+            f"Row {offset + bad_priorities[0] + 1}: invalid priority '{row['priority']}'."
+        )
+    bad_durations = [
+        position for position, row in task_rows
+        if row.get("duration") not in (None, "") and not str(row["duration"]).isdigit()
+    ]
+    if bad_durations:
+        row = chunk[bad_durations[0]]
+        raise ValueError(
+            f"Row {offset + bad_durations[0] + 1}: invalid duration '{row['duration']}', "
+            "expected whole minutes."
+        )
+    bad_dates = [
+        position for position, row in task_rows
+        if row.get("due_date") and not _is_date(str(row["due_date"]))
+    ]
+    if bad_dates:
+        row = chunk[bad_dates[0]]
+        raise ValueError(
+            f"Row {offset + bad_dates[0] + 1}: invalid due date '{row['due_date']}', "
+            "expected 'YYYY-MM-DD'."
+        )
+    bad_completed = [
+        position for position, row in task_rows
+        if str(row.get("completed")) not in COMPLETED_VALUES
+    ]
+    if bad_completed:
+        row = chunk[bad_completed[0]]
+        raise ValueError(
+            f"Row {offset + bad_completed[0] + 1}: invalid completed flag '{row['completed']}'."
+        )
+    if strict_frequency:
+        bad_frequencies = [
+            position for position, row in task_rows if row["frequency"] not in FREQUENCIES
+        ]
+        if bad_frequencies:
+            row = chunk[bad_frequencies[0]]
+            raise ValueError(
+                f"Row {offset + bad_frequencies[0] + 1}: "
+                f"unsupported frequency '{row['frequency']}'."
+            )
+
+
+def _is_date(value: str) -> bool:
+    """Return True if value is an ISO 'YYYY-MM-DD' date."""
+    try:
+        date.fromisoformat(value)
+    except ValueError:
+        return False
+    return True
+
+
+def _task_from_row(row: dict) -> Task:
+    """Create a detached Task from a validated row."""
+    duration: Optional[str] = row.get("duration")
+    due_date = row.get("due_date")
+    priority = row.get("priority")
+    window_start = row.get("window_start")
+    return Task(
+        description=row["description"],
+        time=row["time"],
+        frequency=row["frequency"],
+        completion_status=str(row.get("completed")) in ("1", "True", "true"),
+        duration=int(duration) if duration not in (None, "") else None,
+        due_date=date.fromisoformat(due_date) if due_date else None,
+        priority=int(priority) if priority not in (None, "") else 0,
+        window=(window_start, row["window_end"]) if window_start else None,
+    )
@@ -0,0 +1,211 @@
+"""
+Opt-in instrumentation for Scheduler queries and model mutations.
+"""
+
+import bisect
+import cProfile
+import functools
+import io
+import json
+import pstats
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from pawpal_system import Owner, Pet, Scheduler, Task
+
+# upper bounds in seconds; the last bucket catches everything slower
+LATENCY_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, float("inf"))
+
+TARGETS = {
+    Scheduler: [
+        "conflict_warnings", "detect_conflicts", "detect_overlaps", "get_tasks_by_frequency",
+        "get_overdue_tasks", "tasks_between", "get_tasks_for_pet", "generate_daily_schedule",
+        "sort_by_time", "mark_tasks_complete", "complete_tasks", "filter_tasks", "occurrences",
+        "completion_history", "pet_task_counts", "plan_day", "task_page",
+    ],
+    Owner: ["add_pet", "remove_pet", "get_all_tasks", "get_all_pets", "apply_retention"],
+    Pet: ["add_task", "add_tasks", "remove_task", "get_all_tasks", "get_pending_tasks"],
+    Task: ["mark_complete", "reset_status"],
+}
+
+
+def count_tasks(result) -> int:
+    """Number of tasks in a query result (lists, dicts of lists, nested lists)."""
+    if isinstance(result, Task):
+        return 1
+    if isinstance(result, dict):
+        return sum(count_tasks(value) for value in result.values())
+    if isinstance(result, (list, tuple)):
+        if result and isinstance(result[0], Task):
+            return len(result)
+        return sum(count_tasks(item) for item in result)
+    return 0
+
+
+class MethodStats:
+    """Call count, latency histogram, tasks returned and cache hits for one method."""
+    __slots__ = ("calls", "total_seconds", "buckets", "tasks_returned", "cache_hits")
+
+    def __init__(self):
+        """Initialize empty counters."""
+        self.calls = 0
+        self.total_seconds = 0.0
+        self.buckets = [0] * len(LATENCY_BUCKETS)
+        self.tasks_returned = 0
+        self.cache_hits = 0
+
+    def to_dict(self) -> Dict:
+        """Return the counters as plain data."""
+        return {
+            "calls": self.calls,
+            "total_seconds": self.total_seconds,
+            "tasks_returned": self.tasks_returned,
+            "cache_hits": self.cache_hits,
+            "buckets": {str(bound): count for bound, count in zip(LATENCY_BUCKETS, self.buckets)},
+        }
+
+
+class Instrumentation:
+    """
+    Records call counts, latency histograms, tasks returned and cache hits
+    for the methods in TARGETS. enable() swaps in timing wrappers on the
+    classes and disable() restores the originals, so there is no overhead at
+    all while disabled. Tasks returned is the size of a call's result (or of
+    the tasks passed to a mutation), not the number of tasks it read. Cache
+    hits count Scheduler calls answered from the memo without running the
+    query, so a method's tasks returned per miss shows what a fresh query
+    produces.
+    """
+
+    def __init__(self, targets: Optional[Dict[type, List[str]]] = None):
+        """Create an (initially disabled) recorder for targets."""
+        self.targets = targets if targets is not None else TARGETS
+        self._stats: Dict[str, MethodStats] = {}
+        self._originals: Dict[Tuple[type, str], Callable] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Return True while wrappers are installed."""
+        return bool(self._originals)
+
+    def enable(self) -> None:
+        """Install timing wrappers on every target method."""
+        if self.enabled:
+            return
+        for cls, names in self.targets.items():
+            for name in names:
+                original = cls.__dict__.get(name)
+                if original is None:
+                    continue
+                self._originals[(cls, name)] = original
+                setattr(cls, name, self._wrap(f"{cls.__name__}.{name}", original))
+
+    def disable(self) -> None:
+        """Restore the original methods."""
+        for (cls, name), original in self._originals.items():
+            setattr(cls, name, original)
+        self._originals.clear()
+
+    def reset(self) -> None:
+        """Clear recorded statistics."""
+        with self._lock:
+            self._stats.clear()
+
+    def __enter__(self) -> "Instrumentation":
+        """Enable for the duration of a with block."""
+        self.enable()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Disable at the end of a with block."""
+        self.disable()
+
+    def _wrap(self, label: str, original: Callable) -> Callable:
+        """Build the timing wrapper for one method."""
+        @functools.wraps(original)
+        def wrapper(*args, **kwargs):
+            scheduler = args[0] if args and isinstance(args[0], Scheduler) else None
+            hits = scheduler.cache_hits if scheduler is not None else 0
+            started = time.perf_counter()
+            result = original(*args, **kwargs)
+            elapsed = time.perf_counter() - started
+            returned = count_tasks(result)
+            if not returned and len(args) > 1:
+                returned = count_tasks(args[1])
+            hit = scheduler is not None and scheduler.cache_hits > hits
+            self._record(label, elapsed, returned, hit)
+            return result
+        return wrapper
+
+    def _record(self, label: str, elapsed: float, returned: int, hit: bool = False) -> None:
+        """Add one call to the statistics."""
+        with self._lock:
+            stats = self._stats.get(label)
+            if stats is None:
+                stats = self._stats[label] = MethodStats()
+            stats.calls += 1
+            stats.total_seconds += elapsed
+            stats.buckets[bisect.bisect_left(LATENCY_BUCKETS, elapsed)] += 1
+            stats.tasks_returned += returned
+            stats.cache_hits += hit
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """Return {'Class.method': counters} for every method called so far."""
+        with self._lock:
+            return {label: stats.to_dict() for label, stats in sorted(self._stats.items())}
+
+    def to_json(self) -> str:
+        """Return the snapshot as JSON."""
+        return json.dumps(self.snapshot(), indent=2)
+
+    def prometheus(self) -> str:
+        """
+        Return the snapshot in the Prometheus text exposition format.
+        Each metric family is written as one block: its TYPE line, then all
+        of its samples.
+        """
+        with self._lock:
+            items = sorted(self._stats.items())
+            lines = ["# TYPE pawpal_calls_total counter"]
+            lines.extend(
+                f'pawpal_calls_total{{method="{label}"}} {stats.calls}' for label, stats in items
+            )
+            lines.append("# TYPE pawpal_tasks_returned_total counter")
+            lines.extend(
+                f'pawpal_tasks_returned_total{{method="{label}"}} {stats.tasks_returned}'
+                for label, stats in items
+            )
+            lines.append("# TYPE pawpal_cache_hits_total counter")
+            lines.extend(
+                f'pawpal_cache_hits_total{{method="{label}"}} {stats.cache_hits}'
+                for label, stats in items
+            )
+            lines.append("# TYPE pawpal_latency_seconds histogram")
+            for label, stats in items:
+                cumulative = 0
+                for bound, count in zip(LATENCY_BUCKETS, stats.buckets):
+                    cumulative += count
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    lines.append(
+                        f'pawpal_latency_seconds_bucket{{method="{label}",le="{le}"}} {cumulative}'
+                    )
+                lines.append(f'pawpal_latency_seconds_sum{{method="{label}"}} {stats.total_seconds}')
+                lines.append(f'pawpal_latency_seconds_count{{method="{label}"}} {stats.calls}')
+        return "\n".join(lines) + "\n"
+
+
+def profile(call: Callable, *args, sort: str = "cumulative", limit: int = 25, **kwargs):
+    """
+    Run a single scheduling call under cProfile.
+    Returns (result, report text with the top `limit` entries by `sort`).
+    """
+    profiler = cProfile.Profile()
+    result = profiler.runcall(call, *args, **kwargs)
+    out = io.StringIO()
+    pstats.Stats(profiler, stream=out).sort_stats(sort).print_stats(limit)
+    return result, out.getvalue()
+
+
+instrumentation = Instrumentation()
@@ -0,0 +1,201 @@
+"""
+Daily plan optimizer: assigns start times to tasks within owner availability.
+"""
+
+import bisect
+import time as clock
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import List, NamedTuple, Optional, Tuple
+
+from pawpal_system import MINUTES_PER_DAY, Owner, Scheduler, Task, TimeSlot
+
+
+class PlannedTask(NamedTuple):
+    """A task placed in the plan. delay is minutes after its preferred time (negative = early)."""
+    task: Task
+    slot: TimeSlot
+    delay: int
+
+    @property
+    def start(self) -> str:
+        """Planned start as 'HH:MM'."""
+        return self.slot.start.strftime('%H:%M')
+
+
+@dataclass
+class Plan:
+    """Result of planning one day."""
+    day: date
+    assignments: List[PlannedTask] = field(default_factory=list)
+    unscheduled: List[Task] = field(default_factory=list)
+    cost: float = 0.0
+
+    @property
+    def total_lateness(self) -> int:
+        """Sum of minutes tasks start after their preferred time."""
+        return sum(max(0, planned.delay) for planned in self.assignments)
+
+
+class DailyPlanner:
+    """
+    Greedy planner with optional local-search refinement.
+    Tasks are placed one at a time (highest priority first) into the owner's
+    free time, at the first free start at or after their preferred time or the
+    latest one before it, whichever costs less. Cost is priority-weighted
+    lateness, with earliness discounted and unplaceable tasks penalised.
+    Refinement swaps neighbours in the placement order while that lowers the cost.
+    """
+
+    def __init__(
+        self,
+        owner: Owner,
+        default_duration: int = 15,
+        earliness_weight: float = 0.5,
+        unscheduled_penalty: float = 10_000.0
+    ):
+        """Create a planner for owner."""
+        self.owner = owner
+        self.default_duration = default_duration
+        self.earliness_weight = earliness_weight
+        self.unscheduled_penalty = unscheduled_penalty
+
+    def plan(
+        self,
+        day: Optional[date] = None,
+        refine: bool = False,
+        max_passes: int = 5,
+        time_limit: float = 0.05
+    ) -> Plan:
+        """Plan the pending tasks that occur on day (default today)."""
+        day = day or date.today()
+        tasks = [
+            occurrence.task
+            for occurrence in Scheduler(self.owner).occurrences(day, day)
+            if occurrence.task.minute is not None
+        ]
+        order = sorted(tasks, key=lambda task: (-task.priority, task.minute, task.task_id))
+        free = self._free_intervals()
+        cost, placements = self._greedy(order, free)
+
+        if refine:
+            deadline = clock.perf_counter() + time_limit
+            for _ in range(max_passes):
+                improved = False
+                for position in range(len(order) - 1):
+                    if clock.perf_counter() > deadline:
+                        break
+                    order[position], order[position + 1] = order[position + 1], order[position]
+                    candidate_cost, candidate = self._greedy(order, free)
+                    if candidate_cost < cost:
+                        cost, placements, improved = candidate_cost, candidate, True
+                    else:
+                        order[position], order[position + 1] = (
+                            order[position + 1], order[position]
+                        )
+                if not improved or clock.perf_counter() > deadline:
+                    break
+
+        midnight = datetime(day.year, day.month, day.day)
+        plan = Plan(day=day, cost=cost)
+        for task, start in placements:
+            if start is None:
+                plan.unscheduled.append(task)
+                continue
+            begin = midnight + timedelta(minutes=start)
+            slot = TimeSlot(begin, begin + timedelta(minutes=self._duration(task)))
+            plan.assignments.append(PlannedTask(task, slot, start - task.minute))
+        plan.assignments.sort(key=lambda planned: planned.slot.start)
+        return plan
+
+    def _free_intervals(self) -> List[Tuple[int, int]]:
+        """Owner availability (times of day, valid on any date) as sorted, merged intervals."""
+        if self.owner.availability is None:
+            return [(0, MINUTES_PER_DAY)]
+        intervals = sorted(
+            (start, end) for start, end in self.owner.availability if start < end
+        )
+        merged: List[Tuple[int, int]] = []
+        for start, end in intervals:
+            if merged and start <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+            else:
+                merged.append((start, end))
+        return merged
+
+    def _duration(self, task: Task) -> int:
+        """Minutes a task occupies."""
+        return task.duration or self.default_duration
+
+    def _greedy(self, order: List[Task], free: List[Tuple[int, int]]):
+        """Place tasks in order; return (cost, [(task, start or None)])."""
+        starts = [interval[0] for interval in free]
+        ends = [interval[1] for interval in free]
+        placements = []
+        cost = 0.0
+        for task in order:
+            duration = self._duration(task)
+            earliest, latest = task.window or (0, MINUTES_PER_DAY)
+            weight = task.priority + 1
+            if latest - earliest < duration:
+                # the task cannot fit in its own window
+                cost += weight * self.unscheduled_penalty
+                placements.append((task, None))
+                continue
+            preferred = min(max(task.minute, earliest), latest - duration)
+            best = None
+            late = self._first_fit(starts, ends, duration, max(preferred, earliest), latest)
+            if late is not None:
+                best = (weight * (late - task.minute), late)
+            early = self._last_fit(starts, ends, duration, earliest, preferred)
+            if early is not None:
+                early_cost = weight * self.earliness_weight * (task.minute - early)
+                if best is None or early_cost < best[0]:
+                    best = (early_cost, early)
+            if best is None:
+                cost += weight * self.unscheduled_penalty
+                placements.append((task, None))
+                continue
+            cost += max(best[0], 0.0)
+            self._occupy(starts, ends, best[1], best[1] + duration)
+            placements.append((task, best[1]))
+        return cost, placements
+
+    @staticmethod
+    def _first_fit(starts, ends, duration, low, high) -> Optional[int]:
+        """Earliest start >= low whose block fits in free time and ends by high."""
+        position = bisect.bisect_right(ends, low)
+        while position < len(starts):
+            start = max(starts[position], low)
+            if start + duration > high:
+                return None
+            if start + duration <= ends[position]:
+                return start
+            position += 1
+        return None
+
+    @staticmethod
+    def _last_fit(starts, ends, duration, low, high) -> Optional[int]:
+        """Latest start in [low, high] whose block fits in free time."""
+        position = bisect.bisect_right(starts, high) - 1
+        while position >= 0:
+            start = min(ends[position] - duration, high)
+            if start < low:
+                return None
+            if start >= starts[position]:
+                return start
+            position -= 1
+        return None
+
+    @staticmethod
+    def _occupy(starts, ends, start, end) -> None:
+        """Remove [start, end) from the free interval containing it."""
+        position = bisect.bisect_right(starts, start) - 1
+        free_start, free_end = starts[position], ends[position]
+        del starts[position], ends[position]
+        if end < free_end:
+            starts.insert(position, end)
+            ends.insert(position, free_end)
+        if free_start < start:
+            starts.insert(position, free_start)
+            ends.insert(position, start)
@@ -0,0 +1,174 @@
+"""
+Asyncio reminder dispatcher driven by task due times.
+"""
+
+import asyncio
+import heapq
+import itertools
+import threading
+from abc import ABC, abstractmethod
+from datetime import date, datetime, time as dt_time
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional
+
+from pawpal_system import Owner, Task, TaskListener
+
+
+class Reminder(NamedTuple):
+    """A reminder that a pending task is due."""
+    owner: str
+    pet: str
+    description: str
+    due: datetime
+    task: Task
+
+
+class ReminderSink(ABC):
+    """Destination for reminders (email, push, chat...). Subclasses implement send."""
+
+    @abstractmethod
+    async def send(self, reminder: Reminder) -> None:
+        """Deliver one reminder."""
+
+
+class ListSink(ReminderSink):
+    """Local sink that keeps reminders in a list; useful for tests and demos."""
+
+    def __init__(self):
+        """Initialize an empty sink."""
+        self.reminders: List[Reminder] = []
+
+    async def send(self, reminder: Reminder) -> None:
+        """Record the reminder."""
+        self.reminders.append(reminder)
+
+
+class ReminderDispatcher(TaskListener):
+    """
+    Keeps a heap of upcoming pending task times across all watched owners.
+    run() sleeps until the earliest due time (or until an earlier task is
+    added) and sends a Reminder to every sink. Heap entries are invalidated
+    lazily, and recurrences created by mark_complete are armed automatically
+    because they arrive as task_added events.
+    """
+
+    def __init__(
+        self,
+        sinks: Iterable[ReminderSink],
+        clock: Callable[[], datetime] = datetime.now
+    ):
+        """Create a dispatcher that sends to sinks, reading the time from clock."""
+        self.sinks = list(sinks)
+        self.clock = clock
+        self._heap: List[tuple] = []
+        self._armed: Dict[Task, datetime] = {}
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+        self._wake = asyncio.Event()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._running = False
+
+    def watch(self, owner: Owner) -> None:
+        """Arm reminders for an owner's pending tasks and follow its changes."""
+        owner.subscribe(self, replay=True)
+
+    def next_due(self) -> Optional[datetime]:
+        """Return the earliest armed due time, or None."""
+        with self._lock:
+            self._drop_stale()
+            return self._heap[0][0] if self._heap else None
+
+    def __len__(self) -> int:
+        """Return the number of armed reminders."""
+        return len(self._armed)
+
+    # TaskListener hooks
+
+    def task_added(self, task: Task) -> None:
+        """Arm a reminder for a pending task with a valid time."""
+        if task.completion_status or task.minute is None:
+            return
+        day = task.due_date or date.today()
+        due = datetime.combine(day, dt_time(task.minute // 60, task.minute % 60))
+        with self._lock:
+            if self._armed.get(task) == due:
+                return
+            self._armed[task] = due
+            heapq.heappush(self._heap, (due, next(self._sequence), task))
+            earliest = self._heap[0][2] is task
+        if earliest:
+            self._notify()
+
+    def task_removed(self, task: Task) -> None:
+        """Disarm a removed task; its heap entry is skipped later."""
+        with self._lock:
+            self._armed.pop(task, None)
+
+    def task_changed(self, task: Task) -> None:
+        """Re-arm or disarm a task after its status or time changed."""
+        self.task_removed(task)
+        self.task_added(task)
+
+    # event loop side
+
+    async def run(self) -> None:
+        """Dispatch reminders until stop() is called."""
+        self._loop = asyncio.get_running_loop()
+        self._running = True
+        while self._running:
+            self._wake.clear()
+            due = self.next_due()
+            if due is None:
+                await self._wake.wait()
+                continue
+            delay = (due - self.clock()).total_seconds()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            for reminder in self._pop_due():
+                for sink in self.sinks:
+                    await sink.send(reminder)
+
+    def stop(self) -> None:
+        """Ask run() to return."""
+        self._running = False
+        self._notify()
+
+    def _pop_due(self) -> List[Reminder]:
+        """Remove and return every reminder whose time has come."""
+        now = self.clock()
+        reminders = []
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                due, _, task = heapq.heappop(self._heap)
+                if self._armed.get(task) != due:
+                    continue
+                del self._armed[task]
+                pet = task.parent_pet
+                owner = getattr(pet, 'owner', None)
+                reminders.append(Reminder(
+                    getattr(owner, 'name', ''), getattr(pet, 'name', ''),
+                    task.description, due, task,
+                ))
+        return reminders
+
+    def _drop_stale(self) -> None:
+        """Pop heap entries that no longer match an armed task. Caller holds the lock."""
+        while self._heap and self._armed.get(self._heap[0][2]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+
+    def _notify(self) -> None:
+        """Wake run(), even when called from another thread."""
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            self._wake.set()
+        else:
+            loop.call_soon_threadsafe(self._wake.set)
@@ -0,0 +1,185 @@
+"""
+Shared schedule service: one Owner graph mutated safely by many caregivers.
+"""
+
+import threading
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+from pawpal_history import ScheduleSnapshot, SnapshotHistory
+from pawpal_system import CompletionSummary, Owner, Pet, Scheduler, Task
+
+
+class StaleVersionError(ValueError):
+    """Raised when a mutation's expected_version no longer matches the pet."""
+
+
+class ScheduleService:
+    """
+    Owns an Owner/Pet/Task graph shared by many clients (threads).
+    Each mutation takes its pet's lock for validation and for building new
+    objects, then a short commit lock while it touches the pet and the
+    owner's shared indexes. Lock order is always pet lock, then commit lock.
+    Mutations can pass expected_version (the pet version the client last
+    read) to fail with StaleVersionError instead of overwriting a concurrent
+    change. Every mutation commits one structurally shared snapshot to the
+    service's SnapshotHistory, so snapshot() is a plain attribute read and
+    undo() reverts the last mutation as a whole. undo() takes only the commit
+    lock, so mutations check their pet again once they hold it.
+    """
+
+    def __init__(self, owner: Owner, store=None, history_limit: int = 100):
+        """Serve owner; when a store is given, flush() writes pending changes to it."""
+        self.owner = owner
+        self.store = store
+        self.scheduler = Scheduler(owner)
+        self.history = SnapshotHistory(owner, limit=history_limit)
+        self._commit_lock = threading.RLock()
+        self._locks_guard = threading.Lock()
+        self._pet_locks: Dict[int, threading.Lock] = {}
+
+    def _pet_lock(self, pet_id: int) -> threading.Lock:
+        """Return the lock guarding one pet, creating it on first use."""
+        lock = self._pet_locks.get(pet_id)
+        if lock is None:
+            with self._locks_guard:
+                lock = self._pet_locks.setdefault(pet_id, threading.Lock())
+        return lock
+
+    def _pet(self, pet_id: int, expected_version: Optional[int]) -> Tuple[Pet, int]:
+        """Look up a pet, check the caller's expected version, and return (pet, version seen)."""
+        pet = self.owner.get_pet_by_id(pet_id)
+        if pet is None:
+            raise ValueError(f"Pet id {pet_id} not found.")
+        version = pet.version
+        if expected_version is not None and version != expected_version:
+            raise StaleVersionError(
+                f"Pet '{pet.name}' is at version {version}, expected {expected_version}."
+            )
+        return pet, version
+
+    def _recheck(self, pet: Pet, version: int) -> None:
+        """Under the commit lock, fail if an undo removed or changed the pet after _pet()."""
+        if self.owner.get_pet_by_id(pet.pet_id) is not pet:
+            raise ValueError(f"Pet id {pet.pet_id} not found.")
+        if pet.version != version:
+            raise StaleVersionError(
+                f"Pet '{pet.name}' is at version {pet.version}, expected {version}."
+            )
+
+    # mutations
+
+    def add_pet(self, name: str, species: str, age: int) -> Pet:
+        """Create and register a pet; names must be unique."""
+        pet = Pet(name=name, species=species, age=age)
+        with self._commit_lock:
+            self.owner.add_pet(pet)
+            self.history.commit()
+        return pet
+
+    def remove_pet(self, pet_id: int, expected_version: Optional[int] = None) -> None:
+        """Remove a pet and all of its tasks."""
+        with self._pet_lock(pet_id):
+            pet, version = self._pet(pet_id, expected_version)
+            with self._commit_lock:
+                self._recheck(pet, version)
+                pet.load()  # so undo can bring the tasks back
+                self.owner.remove_pet(pet)
+                self.history.commit()
+        with self._locks_guard:
+            self._pet_locks.pop(pet_id, None)
+
+    def add_task(
+        self,
+        pet_id: int,
+        description: str,
+        time: str,
+        frequency: str,
+        expected_version: Optional[int] = None,
+        **fields
+    ) -> Task:
+        """Create a task for a pet; extra keyword fields are passed to Task."""
+        with self._pet_lock(pet_id):
+            pet, version = self._pet(pet_id, expected_version)
+            task = Task(description=description, time=time, frequency=frequency, **fields)
+            with self._commit_lock:
+                self._recheck(pet, version)
+                pet.add_task(task)
+                self.history.commit()
+            return task
+
+    def remove_task(
+        self,
+        pet_id: int,
+        task_id: int,
+        expected_version: Optional[int] = None
+    ) -> None:
+        """Remove one task from a pet."""
+        with self._pet_lock(pet_id):
+            pet, version = self._pet(pet_id, expected_version)
+            task = pet.get_task(task_id)
+            if task is None:
+                raise ValueError(f"Task id {task_id} not found on pet '{pet.name}'.")
+            with self._commit_lock:
+                self._recheck(pet, version)
+                pet.remove_task(task)
+                self.history.commit()
+
+    def complete_tasks(
+        self,
+        pet_id: int,
+        task_ids: List[int],
+        expected_version: Optional[int] = None,
+        now: Optional[datetime] = None
+    ) -> CompletionSummary:
+        """Complete tasks of one pet in bulk (see Scheduler.complete_tasks)."""
+        with self._pet_lock(pet_id):
+            pet, version = self._pet(pet_id, expected_version)
+            tasks = []
+            for task_id in task_ids:
+                task = pet.get_task(task_id)
+                if task is None:
+                    raise ValueError(f"Task id {task_id} not found on pet '{pet.name}'.")
+                tasks.append(task)
+            with self._commit_lock:
+                self._recheck(pet, version)
+                summary = self.scheduler.complete_tasks(tasks, now=now)
+                self.history.commit()
+                return summary
+
+    def complete_task(
+        self,
+        pet_id: int,
+        task_id: int,
+        expected_version: Optional[int] = None,
+        now: Optional[datetime] = None
+    ) -> CompletionSummary:
+        """Complete a single task."""
+        return self.complete_tasks(pet_id, [task_id], expected_version, now)
+
+    def flush(self) -> int:
+        """Write pending changes to the store, if any; return rows touched."""
+        if self.store is None:
+            return 0
+        with self._commit_lock:
+            return self.store.flush()
+
+    # reads
+
+    def read(self, query: Callable, *args, **kwargs):
+        """
+        Run a Scheduler (or any owner) query while no commit is in progress.
+        Memoized queries make this short, but it does wait for writers; use
+        snapshot() for reads that must never block.
+        """
+        with self._commit_lock:
+            return query(*args, **kwargs)
+
+    def snapshot(self) -> ScheduleSnapshot:
+        """Return the latest immutable snapshot; unchanged pets are shared between versions."""
+        return self.history.current
+
+    def undo(self) -> ScheduleSnapshot:
+        """Revert the most recent mutation and return the restored snapshot."""
+        with self._commit_lock:
+            return self.history.undo()
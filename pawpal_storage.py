@@ -0,0 +1,387 @@
+"""
+SQLite persistence for PawPal+ owners, pets and tasks.
+"""
+
+import os
+import sqlite3
+import threading
+from datetime import date, datetime
+from typing import Dict, List, Optional, Tuple
+
+from pawpal_system import Owner, Pet, Task, TaskListener, ids
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS owners (
+    name TEXT PRIMARY KEY
+);
+CREATE TABLE IF NOT EXISTS pets (
+    pet_id INTEGER PRIMARY KEY,
+    owner TEXT NOT NULL,
+    name TEXT NOT NULL,
+    species TEXT,
+    age INTEGER
+);
+CREATE TABLE IF NOT EXISTS tasks (
+    task_id INTEGER PRIMARY KEY,
+    pet_id INTEGER NOT NULL,
+    owner TEXT NOT NULL,
+    description TEXT NOT NULL,
+    time TEXT NOT NULL,
+    minute INTEGER,
+    frequency TEXT NOT NULL,
+    completed INTEGER NOT NULL,
+    duration INTEGER,
+    due_date TEXT,
+    completed_at REAL,
+    priority INTEGER NOT NULL DEFAULT 0,
+    window_start INTEGER,
+    window_end INTEGER
+);
+CREATE TABLE IF NOT EXISTS id_blocks (
+    next_id INTEGER NOT NULL
+);
+"""
+# columns added after the first release, created on older databases when opened
+MIGRATIONS = {
+    "priority": "ALTER TABLE tasks ADD COLUMN priority INTEGER NOT NULL DEFAULT 0",
+    "window_start": "ALTER TABLE tasks ADD COLUMN window_start INTEGER",
+    "window_end": "ALTER TABLE tasks ADD COLUMN window_end INTEGER",
+}
+INDEXES = """
+CREATE INDEX IF NOT EXISTS pets_by_owner ON pets (owner);
+CREATE INDEX IF NOT EXISTS tasks_by_pet ON tasks (pet_id);
+CREATE INDEX IF NOT EXISTS tasks_by_frequency ON tasks (owner, frequency, completed);
+CREATE INDEX IF NOT EXISTS tasks_by_minute ON tasks (owner, completed, minute);
+"""
+
+
+class SQLiteStore(TaskListener):
+    """
+    SQLite-backed storage for owners, pets and tasks.
+    The store subscribes to each owner it saves or loads and records which
+    pets and tasks changed; flush() writes only those rows in one transaction.
+    Loaded pets fetch their tasks lazily on first access.
+    While open, a file-backed store is the id allocator's block source: new
+    pet and task ids come from blocks reserved in the id_blocks table, so
+    several processes sharing one database never issue the same id. Stores
+    on the same file share that role; opening a store on a second file while
+    the first is open raises ValueError. In-memory stores cannot be shared
+    and leave the allocator alone.
+    """
+
+    def __init__(self, path: str = ":memory:", batch_size: int = 500):
+        """Open (or create) the database at path."""
+        self.path = path
+        self.batch_size = batch_size
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.RLock()
+        self._dirty_pets: Dict[int, Pet] = {}
+        self._deleted_pets: Dict[int, None] = {}
+        self._dirty_tasks: Dict[int, Task] = {}
+        self._deleted_tasks: Dict[int, None] = {}
+        with self._lock, self._conn:
+            self._conn.executescript(SCHEMA)
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(tasks)")}
+            for column, statement in MIGRATIONS.items():
+                if column not in columns:
+                    self._conn.execute(statement)
+            self._conn.executescript(INDEXES)
+            for table, column in (("pets", "pet_id"), ("tasks", "task_id")):
+                (max_id,) = self._conn.execute(f"SELECT MAX({column}) FROM {table}").fetchone()
+                if max_id is not None:
+                    ids.reserve(max_id)
+            if self._conn.execute("SELECT 1 FROM id_blocks").fetchone() is None:
+                self._conn.execute("INSERT INTO id_blocks VALUES (0)")
+        self._shared = path not in ("", ":memory:")
+        if self._shared:
+            try:
+                ids.claim_block_source(os.path.realpath(path), self.reserve_ids)
+            except ValueError:
+                self._conn.close()
+                raise
+
+    def reserve_ids(self, count: int, floor: int = 0) -> int:
+        """
+        Reserve count consecutive ids, all >= floor, that no other
+        connection will be given; return the first. The counter update and
+        read happen in one write transaction, so processes are serialized.
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE id_blocks SET next_id = MAX(next_id, ?) + ?", (floor, count)
+            )
+            (end,) = self._conn.execute("SELECT next_id FROM id_blocks").fetchone()
+        return end - count
+
+    def save(self, owner: Owner) -> int:
+        """Persist a new owner with all of its pets and tasks, then track it."""
+        with self._lock:
+            with self._conn:
+                self._conn.execute("INSERT OR IGNORE INTO owners (name) VALUES (?)", (owner.name,))
+            owner.subscribe(self, replay=True)
+            return self.flush()
+
+    def load_owner(self, name: str) -> Optional[Owner]:
+        """
+        Load an owner and its pets without their tasks.
+        Each pet's tasks are read from the database on first access.
+        """
+        with self._lock:
+            if self._conn.execute("SELECT 1 FROM owners WHERE name = ?", (name,)).fetchone() is None:
+                return None
+            owner = Owner(name=name)
+            rows = self._conn.execute(
+                "SELECT pet_id, name, species, age FROM pets WHERE owner = ? ORDER BY pet_id",
+                (name,),
+            ).fetchall()
+            for pet_id, pet_name, species, age in rows:
+                owner.add_pet(Pet.lazy(pet_name, species, age, pet_id, self._load_pet_tasks))
+            owner.subscribe(self, replay=False)
+            return owner
+
+    def owner_names(self) -> List[str]:
+        """Return the names of all stored owners."""
+        with self._lock:
+            return [row[0] for row in self._conn.execute("SELECT name FROM owners ORDER BY name")]
+
+    def flush(self) -> int:
+        """Write all pending changes in a single transaction; return rows touched."""
+        with self._lock:
+            pet_rows = [
+                (pet.pet_id, pet.owner.name, pet.name, pet.species, pet.age)
+                for pet in self._dirty_pets.values() if pet.owner is not None
+            ]
+            task_rows = [
+                self._task_row(task) for task in self._dirty_tasks.values()
+                if task.parent_pet is not None and task.parent_pet.owner is not None
+            ]
+            deleted_pets = [(pet_id,) for pet_id in self._deleted_pets]
+            deleted_tasks = [(task_id,) for task_id in self._deleted_tasks]
+            with self._conn:
+                self._execute_batched("DELETE FROM tasks WHERE task_id = ?", deleted_tasks)
+                self._execute_batched("DELETE FROM tasks WHERE pet_id = ?", deleted_pets)
+                self._execute_batched("DELETE FROM pets WHERE pet_id = ?", deleted_pets)
+                self._execute_batched(
+                    "INSERT OR REPLACE INTO pets VALUES (?, ?, ?, ?, ?)", pet_rows
+                )
+                self._execute_batched(
+                    "INSERT OR REPLACE INTO tasks (task_id, pet_id, owner, description, time, "
+                    "minute, frequency, completed, duration, due_date, completed_at, priority, "
+                    "window_start, window_end) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    task_rows,
+                )
+            self._dirty_pets.clear()
+            self._deleted_pets.clear()
+            self._dirty_tasks.clear()
+            self._deleted_tasks.clear()
+            return len(pet_rows) + len(task_rows) + len(deleted_pets) + len(deleted_tasks)
+
+    def find_tasks(
+        self,
+        owner: Owner,
+        frequency: Optional[str] = None,
+        completion_status: Optional[bool] = None,
+        start_minute: Optional[int] = None,
+        end_minute: Optional[int] = None
+    ) -> List[Task]:
+        """
+        Answer Scheduler-style queries from the database indexes.
+        Only the pets that own matching tasks are loaded; results are ordered
+        by time. Pending changes are flushed first.
+        """
+        clauses, params = ["owner = ?"], [owner.name]
+        if frequency is not None:
+            clauses.append("frequency = ?")
+            params.append(str(frequency))
+        if completion_status is not None:
+            clauses.append("completed = ?")
+            params.append(int(completion_status))
+        if start_minute is not None:
+            clauses.append("minute >= ?")
+            params.append(start_minute)
+        if end_minute is not None:
+            clauses.append("minute < ?")
+            params.append(end_minute)
+        with self._lock:
+            self.flush()
+            rows = self._conn.execute(
+                f"SELECT task_id, pet_id FROM tasks WHERE {' AND '.join(clauses)} "
+                "ORDER BY minute, task_id",
+                params,
+            ).fetchall()
+        tasks = []
+        for task_id, pet_id in rows:
+            pet = owner.get_pet_by_id(pet_id)
+            task = pet.get_task(task_id) if pet is not None else None
+            if task is not None:
+                tasks.append(task)
+        return tasks
+
+    def task_counts(self, owner: Owner) -> Dict[str, Tuple[int, int]]:
+        """
+        Return {pet name: (pending count, completed count)} like
+        Scheduler.pet_task_counts, without loading lazy pets: their counts
+        come from one grouped query on tasks_by_pet, the rest from memory.
+        A lazy pet's tasks cannot change before it loads, so no flush is needed.
+        """
+        lazy = [pet for pet in owner.pets if not pet.is_loaded]
+        stored: Dict[int, Tuple[int, int]] = {}
+        if lazy:
+            marks = ", ".join("?" * len(lazy))
+            with self._lock:
+                stored = {
+                    pet_id: (total - completed, completed)
+                    for pet_id, total, completed in self._conn.execute(
+                        f"SELECT pet_id, COUNT(*), SUM(completed) FROM tasks "
+                        f"WHERE pet_id IN ({marks}) GROUP BY pet_id",
+                        [pet.pet_id for pet in lazy],
+                    )
+                }
+        counts = {}
+        for pet in owner.pets:
+            if pet.is_loaded:
+                completed = sum(1 for task in pet.tasks if task.completion_status)
+                counts[pet.name] = (len(pet.tasks) - completed, completed)
+            else:
+                counts[pet.name] = stored.get(pet.pet_id, (0, 0))
+        return counts
+
+    def owner_rows(self, names: List[str]) -> List[tuple]:
+        """
+        Read the named owners as compact (owner, pet names, task rows) tuples
+        without building any objects. Task rows are (task_id, pet position,
+        description, time, minute or -1, frequency, completed, due date
+        ordinal or 0), pets in load order and tasks by task_id. Unknown
+        owners are skipped.
+        """
+        marks = ", ".join("?" * len(names))
+        with self._lock:
+            self.flush()
+            pet_rows = self._conn.execute(
+                f"SELECT owner, pet_id, name FROM pets WHERE owner IN ({marks}) ORDER BY pet_id",
+                names,
+            ).fetchall()
+            task_rows = self._conn.execute(
+                "SELECT task_id, pet_id, description, time, minute, frequency, completed, due_date "
+                "FROM tasks "
+                f"WHERE owner IN ({marks}) ORDER BY task_id",
+                names,
+            ).fetchall()
+            found = {row[0] for row in self._conn.execute(
+                f"SELECT name FROM owners WHERE name IN ({marks})", names
+            )}
+        pets: Dict[str, List[str]] = {name: [] for name in names if name in found}
+        positions: Dict[int, tuple] = {}
+        for owner, pet_id, pet_name in pet_rows:
+            positions[pet_id] = (owner, len(pets[owner]))
+            pets[owner].append(pet_name)
+        tasks: Dict[str, List[tuple]] = {name: [] for name in pets}
+        for task_id, pet_id, description, time, minute, frequency, completed, due in task_rows:
+            owner, position = positions[pet_id]
+            tasks[owner].append((
+                task_id, position, description, time, -1 if minute is None else minute,
+                frequency, bool(completed),
+                date.fromisoformat(due).toordinal() if due else 0,
+            ))
+        return [(name, tuple(pets[name]), tuple(tasks[name])) for name in pets]
+
+    def close(self) -> None:
+        """Flush pending changes, stop serving id blocks and close the connection."""
+        self.flush()
+        if self._shared:
+            ids.release_block_source(self.reserve_ids)
+        self._conn.close()
+
+    # TaskListener hooks: record what needs writing on the next flush
+
+    def pet_added(self, pet: Pet) -> None:
+        """Track a new pet."""
+        with self._lock:
+            self._deleted_pets.pop(pet.pet_id, None)
+            self._dirty_pets[pet.pet_id] = pet
+
+    def pet_changed(self, pet: Pet) -> None:
+        """Schedule a pet row for rewriting after its name, species or age changed."""
+        with self._lock:
+            self._dirty_pets[pet.pet_id] = pet
+
+    def pet_removed(self, pet: Pet) -> None:
+        """Schedule a pet and its task rows for deletion."""
+        with self._lock:
+            self._dirty_pets.pop(pet.pet_id, None)
+            self._deleted_pets[pet.pet_id] = None
+
+    def task_added(self, task: Task) -> None:
+        """Track a new task."""
+        with self._lock:
+            self._deleted_tasks.pop(task.task_id, None)
+            self._dirty_tasks[task.task_id] = task
+
+    def task_removed(self, task: Task) -> None:
+        """Schedule a task row for deletion."""
+        with self._lock:
+            self._dirty_tasks.pop(task.task_id, None)
+            self._deleted_tasks[task.task_id] = None
+
+    def task_changed(self, task: Task) -> None:
+        """Track a modified task."""
+        with self._lock:
+            self._dirty_tasks[task.task_id] = task
+
+    def tasks_loaded(self, pet: Pet, tasks) -> None:
+        """Tasks read from disk are already stored; nothing to write."""
+
+    def _load_pet_tasks(self, pet: Pet) -> List[Task]:
+        """Lazy loader for a pet's tasks."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT task_id, description, time, frequency, completed, duration, due_date, "
+                "completed_at, priority, window_start, window_end "
+                "FROM tasks WHERE pet_id = ? ORDER BY task_id",
+                (pet.pet_id,),
+            ).fetchall()
+            tasks = []
+            for (task_id, description, time, frequency, completed, duration, due, done,
+                 priority, window_start, window_end) in rows:
+                task = Task(
+                    description=description,
+                    time=time,
+                    frequency=frequency,
+                    completion_status=bool(completed),
+                    parent_pet=pet,
+                    duration=duration,
+                    due_date=date.fromisoformat(due) if due else None,
+                    task_id=task_id,
+                    priority=priority,
+                )
+                task.completed_at = datetime.fromtimestamp(done) if done else None
+                if window_start is not None:
+                    task.window = (window_start, window_end)
+                tasks.append(task)
+            return tasks
+
+    def _execute_batched(self, sql: str, rows: list) -> None:
+        """Run executemany in chunks of batch_size."""
+        for start in range(0, len(rows), self.batch_size):
+            self._conn.executemany(sql, rows[start:start + self.batch_size])
+
+    @staticmethod
+    def _task_row(task: Task) -> tuple:
+        """Convert a task to a tasks table row."""
+        pet = task.parent_pet
+        return (
+            task.task_id,
+            pet.pet_id,
+            pet.owner.name,
+            task.description,
+            task.time,
+            task.minute,
+            str(task.frequency),
+            int(task.completion_status),
+            task.duration,
+            task.due_date.isoformat() if task.due_date else None,
+            task.completed_at.timestamp() if task.completed_at else None,
+            task.priority,
+            task.window[0] if task.window else None,
+            task.window[1] if task.window else None,
+        )
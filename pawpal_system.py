@@ -5,15 +5,218 @@
 """
 
 # PawPal+ Pet Care Scheduling Application Skeleton
-from dataclasses import dataclass
-from typing import List, Dict
-from datetime import datetime, timedelta
-from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import List, Dict, Iterator, NamedTuple, Optional, Tuple, Union
+from datetime import date, datetime, timedelta, time as dt_time
+from collections import OrderedDict, deque
+from enum import Enum
+from array import array
+import bisect
+import calendar
+import functools
+import heapq
+import inspect
+import itertools
+import struct
+import sys
+import threading
+from time import time_ns
+
+
+def parse_minutes(value: str) -> Optional[int]:
+    """Convert an 'HH:MM' string to minutes after midnight, or None if invalid."""
+    try:
+        hours, minutes = value.split(':')
+        hours, minutes = int(hours), int(minutes)
+    except (AttributeError, ValueError):
+        return None
+    if 0 <= hours < 24 and 0 <= minutes < 60:
+        return hours * 60 + minutes
+    return None
+
+
+MINUTES_PER_DAY = 24 * 60
+# shared int and 'HH:MM' objects for every minute of the day, so tasks never
+# allocate their own copies
+_MINUTES = tuple(range(MINUTES_PER_DAY))
+_TIME_STRINGS = tuple(f"{m // 60:02d}:{m % 60:02d}" for m in _MINUTES)
+
+
+def format_minutes(minute: int) -> str:
+    """Convert minutes after midnight (0-1439) to an 'HH:MM' string."""
+    return _TIME_STRINGS[minute]
+
+
+class Frequency(str, Enum):
+    """Supported recurrence frequencies. Members compare equal to their strings."""
+    DAILY = "daily"
+    WEEKLY = "weekly"
+    MONTHLY = "monthly"
+
+    def __str__(self) -> str:
+        """Return the plain frequency name."""
+        return self.value
+
+
+def intern_frequency(value: str) -> str:
+    """Return the Frequency member for value, or an interned copy of unknown strings."""
+    try:
+        return Frequency(value)
+    except ValueError:
+        return sys.intern(str(value))
+
+
+def add_months(day: date, months: int) -> date:
+    """Return day moved by whole months, clamped to the end of shorter months."""
+    month_index = day.month - 1 + months
+    year, month = day.year + month_index // 12, month_index % 12 + 1
+    return date(year, month, min(day.day, calendar.monthrange(year, month)[1]))
+
+
+def next_due_date(frequency: str, day: date) -> date:
+    """Return the date of the occurrence after day for a recurring frequency."""
+    if frequency == Frequency.DAILY:
+        return day + timedelta(days=1)
+    if frequency == Frequency.WEEKLY:
+        return day + timedelta(weeks=1)
+    if frequency == Frequency.MONTHLY:
+        return add_months(day, 1)
+    return day
+
+
+class Occurrence(NamedTuple):
+    """One dated occurrence of a task, produced by lazy recurrence expansion."""
+    date: date
+    time: str
+    task: "Task"
+
+
+class PageCursor(NamedTuple):
+    """Position of the last task on a page: its pet, time and id."""
+    pet_id: int
+    time: str
+    task_id: int
+
+
+class TaskPage(NamedTuple):
+    """One page of tasks grouped by pet, each group sorted by time."""
+    groups: List[Tuple["Pet", List["Task"]]]
+    next_cursor: Optional[PageCursor]
+
+    @property
+    def tasks(self) -> List["Task"]:
+        """The page's tasks in display order."""
+        return [task for _, tasks in self.groups for task in tasks]
+
+
+class IdAllocator:
+    """
+    Hands out integer ids for pets and tasks, block_size at a time.
+    Blocks come from a microsecond clock reading by default, which keeps a
+    restarted process counting above the ids it issued before but is only
+    unique within one process. Storage shared between processes claims the
+    block source (see SQLiteStore) so every process draws disjoint blocks;
+    only one database can be the source at a time. reserve() skips past ids
+    loaded from storage.
+    """
+
+    def __init__(self, block_size: int = 1024):
+        """Start with no block; the first allocate() draws one."""
+        self.block_size = block_size
+        self.block_source = None
+        self._lock = threading.Lock()
+        self._source_key: Optional[str] = None
+        self._claims: List = []
+        self._next = self._end = 0
+        self._floor = 0
+
+    def set_block_source(self, source) -> None:
+        """
+        Draw future blocks from source(size, floor), which must return the
+        first id of size ids that no other allocator will use, all >= floor.
+        None goes back to the clock.
+        """
+        with self._lock:
+            self._install(source)
+
+    def claim_block_source(self, key: str, source) -> None:
+        """
+        Draw blocks from source on behalf of the database named key. Claims
+        on the same key share one source and are counted; claiming another
+        key raises ValueError until every claim on the first is released,
+        since its blocks would not be disjoint from other users of that key.
+        """
+        with self._lock:
+            if self._claims and key != self._source_key:
+                raise ValueError(
+                    f"Ids are already drawn from '{self._source_key}'; "
+                    f"close it before opening '{key}'."
+                )
+            if not self._claims:
+                self._source_key = key
+                self._install(source)
+            self._claims.append(source)
+
+    def release_block_source(self, source) -> None:
+        """Drop one claim; the clock takes over again when the last one goes."""
+        with self._lock:
+            if source not in self._claims:
+                return
+            self._claims.remove(source)
+            if not self._claims:
+                self._source_key = None
+                self._install(None)
+            elif self.block_source == source:
+                self._install(self._claims[0])
+
+    def _install(self, source) -> None:
+        """Switch block sources; the next allocate() draws a fresh block."""
+        self.block_source = source
+        self._floor = max(self._floor, self._end)
+        self._next = self._end = 0
+
+    def allocate(self) -> int:
+        """Return a new id."""
+        with self._lock:
+            if self._next >= self._end:
+                self._refill()
+            value = self._next
+            self._next += 1
+            return value
+
+    def reserve(self, used_id: int) -> None:
+        """Make sure future ids are greater than used_id."""
+        with self._lock:
+            if used_id >= self._floor:
+                self._floor = used_id + 1
+                if self._next <= used_id:
+                    self._next = self._end = 0
+
+    def _refill(self) -> None:
+        """Start a new block above every id issued or reserved so far."""
+        floor = max(self._floor, self._end)
+        if self.block_source is None:
+            start = max(time_ns() // 1000, floor)
+        else:
+            start = self.block_source(self.block_size, floor)
+        self._next, self._end = start, start + self.block_size
+
+
+ids = IdAllocator()
+
 
 class Task:
     """
     Represents a single pet-related activity.
+    Stored compactly: the time is kept as a shared minute-of-day int (or the raw
+    string when it is not valid 'HH:MM') and the frequency as an interned value.
     """
+    __slots__ = (
+        "description", "_time", "_frequency", "completion_status",
+        "parent_pet", "duration", "completed_at", "_due_date", "task_id",
+        "priority", "window", "source_id",
+    )
+
     def __init__(
             self,
             description: str,
@@ -21,57 +224,173 @@ class Task:
             frequency: str,
             completion_status: bool = False,
             parent_pet=None,
+            duration: Optional[int] = None,
+            due_date: Optional[date] = None,
+            task_id: Optional[int] = None,
+            priority: int = 0,
+            window: Optional[Tuple[str, str]] = None,
         ):
-        """Initialize a Task object."""
+        """
+        Initialize a Task object. duration is in minutes.
+        due_date is the date of this occurrence; recurring tasks act as rules
+        anchored there (None means today). priority (higher is more important)
+        and window ('HH:MM' earliest start, 'HH:MM' latest end) guide the planner.
+        """
         self.description = description
-        self.time = time
-        self.frequency = frequency
+        self._time = self._encode_time(time)
+        self._frequency = intern_frequency(frequency)
         self.completion_status = completion_status
         self.parent_pet = parent_pet
+        self.duration = duration
+        self.completed_at: Optional[datetime] = None
+        self._due_date = due_date
+        self.task_id = ids.allocate() if task_id is None else task_id
+        self.priority = priority
+        # task_id of the task this one recurs from, for generated occurrences
+        self.source_id: Optional[int] = None
+        self.window: Optional[Tuple[int, int]] = None
+        if window is not None:
+            bounds = tuple(parse_minutes(bound) for bound in window)
+            if None in bounds or bounds[0] >= bounds[1]:
+                raise ValueError(f"Invalid window {window!r}, expected ('HH:MM', 'HH:MM').")
+            self.window = bounds
+
+    @staticmethod
+    def _encode_time(time: str):
+        """Return the shared minute int for a valid time, else the raw value."""
+        minute = parse_minutes(time)
+        return time if minute is None else _MINUTES[minute]
+
+    @property
+    def time(self) -> str:
+        """Scheduled time of day as 'HH:MM'."""
+        if type(self._time) is int:
+            return _TIME_STRINGS[self._time]
+        return self._time
+
+    @time.setter
+    def time(self, value: str) -> None:
+        """Change the scheduled time and refresh owner indexes."""
+        self._time = self._encode_time(value)
+        self._reindex()
+
+    @property
+    def minute(self) -> Optional[int]:
+        """Scheduled time as minutes after midnight, or None if the time is invalid."""
+        return self._time if type(self._time) is int else None
+
+    @property
+    def frequency(self) -> str:
+        """Recurrence frequency; a Frequency member for supported values."""
+        return self._frequency
 
+    @frequency.setter
+    def frequency(self, value: str) -> None:
+        """Change the frequency and refresh owner indexes."""
+        self._frequency = intern_frequency(value)
+        self._reindex()
+
+    @property
+    def due_date(self) -> Optional[date]:
+        """Date of this occurrence; None means today."""
+        return self._due_date
+
+    @due_date.setter
+    def due_date(self, value: Optional[date]) -> None:
+        """Change the due date and refresh owner indexes."""
+        self._due_date = value
+        self._reindex()
+
+    def time_slot(self, day: Optional[date] = None) -> Optional["TimeSlot"]:
+        """
+        Return the TimeSlot this task occupies on day (default today),
+        or None if its time is invalid. Tasks without a duration occupy one minute.
+        """
+        start_minute = self.minute
+        if start_minute is None:
+            return None
+        day = day or date.today()
+        start = datetime(day.year, day.month, day.day) + timedelta(minutes=start_minute)
+        return TimeSlot(start, start + timedelta(minutes=max(self.duration or 0, 1)))
+
+    def occurrence_dates(self, start: date, end: date) -> Iterator[date]:
+        """
+        Lazily yield the dates in [start, end] on which this task occurs.
+        Recurring tasks repeat from their due date; others occur once.
+        """
+        anchor = self.due_date or date.today()
+        frequency = self.frequency
+        if frequency == Frequency.MONTHLY:
+            months = max(0, (start.year - anchor.year) * 12 + start.month - anchor.month - 1)
+            for step in itertools.count(months):
+                day = add_months(anchor, step)
+                if day > end:
+                    return
+                if day >= start:
+                    yield day
+            return
+        if frequency in (Frequency.DAILY, Frequency.WEEKLY):
+            step = 1 if frequency == Frequency.DAILY else 7
+            day = anchor
+            if day < start:
+                day += timedelta(days=-(-(start - anchor).days // step) * step)
+            while day <= end:
+                yield day
+                day += timedelta(days=step)
+            return
+        if start <= anchor <= end:
+            yield anchor
 
     def mark_complete(self) -> None:
         """Mark this task as complete."""
         self.completion_status = True
+        self.completed_at = datetime.now()
+        self._reindex()
 
-        if self.frequency in ["daily", "weekly", "monthly"] and self.parent_pet is not None:
+        if isinstance(self.frequency, Frequency) and self.parent_pet is not None:
             self._create_next_occurrence()
 
+        owner = getattr(self.parent_pet, 'owner', None)
+        if owner is not None and owner.retention is not None:
+            owner.apply_retention(self.parent_pet)
+
     def _create_next_occurrence(self) -> None:
-        """Create a new task instance for the next occurrence with updated date/time."""
-        # Parse the current time (assume format 'HH:MM')
-        try:
-            now = datetime.now()
-            task_time = datetime.strptime(self.time, '%H:%M')
-            # Replace date with today for calculation
-            task_time = task_time.replace(year=now.year, month=now.month, day=now.day)
-        except ValueError:
-            # If time format is not as expected, fallback to just copying
-            task_time = now
-
-        if self.frequency == "daily":
-            next_time = task_time + timedelta(days=1)
-        elif self.frequency == "weekly":
-            next_time = task_time + timedelta(weeks=1)
-        elif self.frequency == "monthly":
-            # Add 1 month (approximate as 30 days)
-            next_time = task_time + timedelta(days=30)
-        else:
-            next_time = task_time
+        """Create a new task instance for the next occurrence at the same time of day."""
+        now = datetime.now()
+        self.parent_pet.add_task(self._next_occurrence(now.date(), now.strftime('%H:%M')))
 
-        # Format back to 'HH:MM' for time field
-        new_time_str = next_time.strftime('%H:%M')
+    def _next_occurrence(self, today: date, fallback_time: str) -> "Task":
+        """
+        Build (but do not attach) the task for the next occurrence.
+        An invalid time falls back to fallback_time; a missing due date to today.
+        """
         new_task = Task(
             description=self.description,
-            time=new_time_str,
+            time=self.time if self.minute is not None else fallback_time,
             frequency=self.frequency,
-            parent_pet=self.parent_pet
+            parent_pet=self.parent_pet,
+            duration=self.duration,
+            due_date=next_due_date(self.frequency, self.due_date or today),
+            priority=self.priority
         )
-        self.parent_pet.add_task(new_task)
+        new_task.window = self.window
+        new_task.source_id = self.task_id
+        return new_task
 
     def reset_status(self) -> None:
         """Reset this task's completion status to incomplete."""
         self.completion_status = False
+        self.completed_at = None
+        self._reindex()
+
+    def _reindex(self) -> None:
+        """Refresh this task's entries in the owning pet's owner index, if any."""
+        pet = self.parent_pet
+        if pet is None:
+            return
+        pet.version += 1
+        if pet.owner is not None:
+            pet.owner._reindex_task(self)
 
     def __str__(self) -> str:
         """Return string representation of the task."""
@@ -82,40 +401,864 @@ class Task:
         )
 
 
+class TaskColumns:
+    """
+    Struct-of-arrays store for bulk tasks such as historical occurrences.
+    Each attribute lives in a typed array, so a row costs a handful of bytes
+    instead of a Task object; rows are materialized back into Tasks on access.
+    """
+
+    def __init__(self):
+        """Initialize empty columns."""
+        self.descriptions: List[str] = []
+        self.minutes = array('h')       # -1 marks a time kept in raw_times
+        self.frequencies = array('B')   # index into frequency_names
+        self.statuses = array('b')
+        self.durations = array('H')     # 0 means no duration
+        self.pet_codes = array('l')     # index into pets, -1 for no pet
+        self.raw_times: Dict[int, str] = {}
+        self.frequency_names: List[str] = list(Frequency)
+        self.pets: List = []
+        self._frequency_codes = {name: code for code, name in enumerate(self.frequency_names)}
+        self._pet_codes: Dict[object, int] = {}
+
+    def append(self, task: Task) -> int:
+        """Store a task as a new row and return its row number."""
+        row = len(self.minutes)
+        self.descriptions.append(sys.intern(task.description))
+        minute = task.minute
+        if minute is None:
+            self.raw_times[row] = task.time
+            minute = -1
+        self.minutes.append(minute)
+        self.frequencies.append(self._code(self._frequency_codes, self.frequency_names,
+                                           task.frequency))
+        self.statuses.append(bool(task.completion_status))
+        self.durations.append(task.duration or 0)
+        pet = task.parent_pet
+        self.pet_codes.append(-1 if pet is None else self._code(self._pet_codes, self.pets, pet))
+        return row
+
+    def extend(self, tasks) -> None:
+        """Store many tasks."""
+        for task in tasks:
+            self.append(task)
+
+    def row(self, row: int) -> Task:
+        """Materialize a row as a detached Task (not added to its pet)."""
+        minute = self.minutes[row]
+        pet_code = self.pet_codes[row]
+        return Task(
+            description=self.descriptions[row],
+            time=self.raw_times[row] if minute < 0 else _TIME_STRINGS[minute],
+            frequency=self.frequency_names[self.frequencies[row]],
+            completion_status=bool(self.statuses[row]),
+            parent_pet=None if pet_code < 0 else self.pets[pet_code],
+            duration=self.durations[row] or None,
+        )
+
+    def nbytes(self) -> int:
+        """Approximate bytes used by the row columns (excluding shared strings)."""
+        arrays = (self.minutes, self.frequencies, self.statuses, self.durations, self.pet_codes)
+        return (
+            sum(column.itemsize * len(column) for column in arrays)
+            + 8 * len(self.descriptions)
+        )
+
+    @staticmethod
+    def _code(codes: dict, values: list, value) -> int:
+        """Return the small-int code for value, assigning a new one if needed."""
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(values)
+            values.append(value)
+        return code
+
+    def __getitem__(self, row: int) -> Task:
+        """Return row as a Task."""
+        return self.row(row)
+
+    def __iter__(self):
+        """Iterate over all rows as Tasks."""
+        return (self.row(row) for row in range(len(self)))
+
+    def __len__(self) -> int:
+        """Return the number of stored rows."""
+        return len(self.minutes)
+
+
+@dataclass
+class RetentionPolicy:
+    """
+    How many completed occurrences stay in a pet's live task list.
+    keep_last keeps the N most recently completed tasks per pet; keep_days
+    keeps tasks completed within the last D days. None disables a rule.
+    """
+    keep_last: Optional[int] = None
+    keep_days: Optional[int] = None
+
+
+@dataclass
+class CompletionSummary:
+    """Outcome of a bulk completion: what was completed, created and skipped."""
+    completed: List["Task"] = field(default_factory=list)
+    created: List["Task"] = field(default_factory=list)
+    skipped: List["Task"] = field(default_factory=list)
+    archived: int = 0
+
+
+class ArchivedTask(NamedTuple):
+    """A completed occurrence as stored in an archive."""
+    pet_name: Optional[str]
+    description: str
+    time: str
+    frequency: str
+    completed_at: Optional[datetime]
+
+
+class TaskArchive(TaskColumns):
+    """In-memory, append-only archive of completed tasks in columnar form."""
+
+    def __init__(self):
+        """Initialize an empty archive."""
+        super().__init__()
+        self.completed_at = array('d')  # POSIX timestamps, 0 when unknown
+
+    def append(self, task: Task) -> int:
+        """Archive a completed task."""
+        row = super().append(task)
+        self.completed_at.append(task.completed_at.timestamp() if task.completed_at else 0.0)
+        return row
+
+    def history(
+        self,
+        pet_name: Optional[str] = None,
+        since: Optional[datetime] = None
+    ) -> Iterator[ArchivedTask]:
+        """Yield archived tasks in archive order, optionally filtered by pet and time."""
+        since_ts = since.timestamp() if since else None
+        for row in range(len(self)):
+            timestamp = self.completed_at[row]
+            if since_ts is not None and timestamp < since_ts:
+                continue
+            pet_code = self.pet_codes[row]
+            name = None if pet_code < 0 else self.pets[pet_code].name
+            if pet_name is not None and name != pet_name:
+                continue
+            minute = self.minutes[row]
+            yield ArchivedTask(
+                name,
+                self.descriptions[row],
+                self.raw_times[row] if minute < 0 else _TIME_STRINGS[minute],
+                self.frequency_names[self.frequencies[row]],
+                datetime.fromtimestamp(timestamp) if timestamp else None,
+            )
+
+    def nbytes(self) -> int:
+        """Approximate bytes used by the archive columns."""
+        return super().nbytes() + self.completed_at.itemsize * len(self.completed_at)
+
+
+class FileTaskArchive:
+    """
+    Append-only on-disk archive of completed tasks.
+    Each record is a fixed binary header followed by UTF-8 strings, and history
+    queries stream the file instead of holding rows in memory.
+    """
+    # completed_at, minute (-1 = raw time follows), duration, then string lengths
+    _HEADER = struct.Struct('<dhHHHBB')
+
+    def __init__(self, path: str):
+        """Open (or create) the archive file at path."""
+        self.path = path
+        self._count = sum(1 for _ in self._records())
+        self._file = open(path, 'ab')
+
+    def append(self, task: Task) -> int:
+        """Append a completed task and return its record number."""
+        pet_name = getattr(task.parent_pet, 'name', '') or ''
+        fields = [s.encode('utf-8') for s in (
+            task.description, pet_name, str(task.frequency),
+            task.time if task.minute is None else '',
+        )]
+        header = self._HEADER.pack(
+            task.completed_at.timestamp() if task.completed_at else 0.0,
+            -1 if task.minute is None else task.minute,
+            task.duration or 0,
+            *(len(field) for field in fields),
+        )
+        self._file.write(header + b''.join(fields))
+        self._file.flush()
+        self._count += 1
+        return self._count - 1
+
+    def extend(self, tasks) -> None:
+        """Append many completed tasks."""
+        for task in tasks:
+            self.append(task)
+
+    def history(
+        self,
+        pet_name: Optional[str] = None,
+        since: Optional[datetime] = None
+    ) -> Iterator[ArchivedTask]:
+        """Stream archived tasks, optionally filtered by pet and time."""
+        since_ts = since.timestamp() if since else None
+        for timestamp, minute, description, name, frequency, raw_time in self._records():
+            if since_ts is not None and timestamp < since_ts:
+                continue
+            if pet_name is not None and name != pet_name:
+                continue
+            yield ArchivedTask(
+                name or None,
+                description,
+                raw_time if minute < 0 else _TIME_STRINGS[minute],
+                intern_frequency(frequency),
+                datetime.fromtimestamp(timestamp) if timestamp else None,
+            )
+
+    def _records(self):
+        """Yield decoded records from the file."""
+        try:
+            handle = open(self.path, 'rb')
+        except FileNotFoundError:
+            return
+        header_size = self._HEADER.size
+        with handle:
+            while True:
+                header = handle.read(header_size)
+                if len(header) < header_size:
+                    return
+                timestamp, minute, _, *lengths = self._HEADER.unpack(header)
+                strings = [handle.read(length).decode('utf-8') for length in lengths]
+                yield (timestamp, minute, *strings)
+
+    def close(self) -> None:
+        """Close the underlying file."""
+        self._file.close()
+
+    def __len__(self) -> int:
+        """Return the number of archived records."""
+        return self._count
+
+
+class TaskListener:
+    """
+    Base class for objects that follow an owner's task mutations.
+    Subscribe instances with Owner.subscribe; every hook is a no-op by default.
+    """
+
+    def pet_added(self, pet: "Pet") -> None:
+        """Called after a pet joins the owner, before its tasks are announced."""
+
+    def pet_removed(self, pet: "Pet") -> None:
+        """Called after a pet leaves the owner and its tasks were removed."""
+
+    def task_added(self, task: Task) -> None:
+        """Called after a task joins one of the owner's pets."""
+
+    def task_removed(self, task: Task) -> None:
+        """Called after a task leaves one of the owner's pets."""
+
+    def task_changed(self, task: Task) -> None:
+        """Called after a task's status or schedule changed."""
+
+    def pet_changed(self, pet: "Pet") -> None:
+        """Called after a pet's name, species or age changed."""
+
+    def tasks_loaded(self, pet: "Pet", tasks: Tuple[Task, ...]) -> None:
+        """
+        Called after a lazy pet fetched its stored tasks. These tasks are not
+        new, but by default each is announced through task_added so indexes
+        and counters pick them up.
+        """
+        for task in tasks:
+            self.task_added(task)
+
+
+class TaskIndex(TaskListener):
+    """
+    Secondary indexes over an owner's tasks.
+    Each index maps a key (frequency, status, (pet, status), time, ...) to an
+    insertion-ordered set of tasks, so lookups cost O(result) instead of a scan.
+    view() shares a tuple per bucket until that bucket changes, like Pet.tasks.
+    """
+
+    KEYS = {
+        "frequency": lambda task: task.frequency,
+        "status": lambda task: task.completion_status,
+        "time": lambda task: task.time,
+        "pet_status": lambda task: (task.parent_pet, task.completion_status),
+        "frequency_status": lambda task: (task.frequency, task.completion_status),
+        "due_status": lambda task: (task.due_date, task.completion_status),
+    }
+
+    def __init__(self):
+        """Initialize empty indexes."""
+        self._buckets = {name: {} for name in self.KEYS}
+        self._views = {name: {} for name in self.KEYS}
+        self._keys: Dict[Task, tuple] = {}
+
+    def add(self, task: Task) -> None:
+        """Index a task under all of its keys."""
+        if task in self._keys:
+            return
+        keys = tuple(key(task) for key in self.KEYS.values())
+        self._keys[task] = keys
+        for buckets, views, key in zip(self._buckets.values(), self._views.values(), keys):
+            buckets.setdefault(key, {})[task] = None
+            views.pop(key, None)
+
+    def remove(self, task: Task) -> None:
+        """Drop a task from all indexes."""
+        keys = self._keys.pop(task, None)
+        if keys is None:
+            return
+        for buckets, views, key in zip(self._buckets.values(), self._views.values(), keys):
+            self._discard(buckets, key, task)
+            views.pop(key, None)
+
+    def update(self, task: Task) -> None:
+        """Move a task between buckets after one of its attributes changed."""
+        old_keys = self._keys.get(task)
+        if old_keys is None:
+            return
+        new_keys = tuple(key(task) for key in self.KEYS.values())
+        for buckets, views, old, new in zip(
+            self._buckets.values(), self._views.values(), old_keys, new_keys
+        ):
+            if old != new:
+                self._discard(buckets, old, task)
+                buckets.setdefault(new, {})[task] = None
+                views.pop(old, None)
+                views.pop(new, None)
+        self._keys[task] = new_keys
+
+    task_added = add
+    task_removed = remove
+    task_changed = update
+
+    def lookup(self, name: str, key) -> List[Task]:
+        """Return the tasks stored under key in the named index."""
+        return list(self._buckets[name].get(key, ()))
+
+    def view(self, name: str, key) -> Tuple[Task, ...]:
+        """
+        Return the tasks under key as a read-only tuple, shared until the
+        bucket changes, so repeated reads do not copy and iterating it stays
+        safe while tasks are modified.
+        """
+        views = self._views[name]
+        view = views.get(key)
+        if view is None:
+            bucket = self._buckets[name].get(key)
+            if bucket is None:
+                return ()
+            view = views[key] = tuple(bucket)
+        return view
+
+    def count(self, name: str, key) -> int:
+        """Return how many tasks are stored under key in the named index."""
+        return len(self._buckets[name].get(key, ()))
+
+    def keys(self, name: str) -> List:
+        """Return the distinct keys present in the named index."""
+        return list(self._buckets[name])
+
+    @staticmethod
+    def _discard(buckets: dict, key, task: Task) -> None:
+        """Remove a task from one bucket, dropping the bucket when it empties."""
+        bucket = buckets[key]
+        del bucket[task]
+        if not bucket:
+            del buckets[key]
+
+    def __contains__(self, task: Task) -> bool:
+        """Return True if the task is indexed."""
+        return task in self._keys
+
+    def __len__(self) -> int:
+        """Return the number of indexed tasks."""
+        return len(self._keys)
+
+
+class TimeIndex(TaskListener):
+    """
+    Sorted minute-of-day index over pending tasks.
+    Distinct minutes are kept in a sorted list (at most 1440 entries) so range
+    queries are a bisect plus the size of the result.
+    """
+
+    def __init__(self):
+        """Initialize an empty time index."""
+        self._minutes: List[int] = []
+        self._buckets: Dict[int, Dict[Task, None]] = {}
+        self._task_minute: Dict[Task, int] = {}
+
+    def add(self, task: Task) -> None:
+        """Index a pending task with a valid time; other tasks are ignored."""
+        if task in self._task_minute or task.completion_status:
+            return
+        minute = task.minute
+        if minute is None:
+            return
+        bucket = self._buckets.get(minute)
+        if bucket is None:
+            bucket = self._buckets[minute] = {}
+            bisect.insort(self._minutes, minute)
+        bucket[task] = None
+        self._task_minute[task] = minute
+
+    def remove(self, task: Task) -> None:
+        """Drop a task from the index if present."""
+        minute = self._task_minute.pop(task, None)
+        if minute is None:
+            return
+        bucket = self._buckets[minute]
+        del bucket[task]
+        if not bucket:
+            del self._buckets[minute]
+            del self._minutes[bisect.bisect_left(self._minutes, minute)]
+
+    def update(self, task: Task) -> None:
+        """Re-evaluate a task after its status or time changed."""
+        self.remove(task)
+        self.add(task)
+
+    task_added = add
+    task_removed = remove
+    task_changed = update
+
+    def between(self, start: int, end: int) -> List[Task]:
+        """Return pending tasks with start <= minute < end, in time order."""
+        lo = bisect.bisect_left(self._minutes, start)
+        hi = bisect.bisect_left(self._minutes, end)
+        return [task for minute in self._minutes[lo:hi] for task in self._buckets[minute]]
+
+    def __len__(self) -> int:
+        """Return the number of indexed tasks."""
+        return len(self._task_minute)
+
+
+@dataclass(frozen=True)
+class ConflictChange:
+    """
+    One entry in the conflict change feed.
+    status is 'added' or 'resolved'; pet is None for cross-pet conflicts.
+    """
+    status: str
+    time: str
+    pet: object = None
+
+
+class ConflictEngine(TaskListener):
+    """
+    Incrementally maintained conflict groups for pending tasks.
+    Tasks are grouped per time and per (time, pet); each event only touches the
+    groups of the task involved, so adding or completing a task is O(1).
+    The change feed keeps the most recent max_changes entries.
+    """
+
+    def __init__(self, max_changes: int = 1024):
+        """Initialize empty conflict groups."""
+        self._by_time: Dict[str, Dict[Task, None]] = {}
+        self._by_time_pet: Dict[tuple, Dict[Task, None]] = {}
+        self._pet_counts: Dict[str, Dict[object, int]] = {}
+        self._task_keys: Dict[Task, tuple] = {}
+        self._active: Dict[tuple, None] = {}
+        self._changes = deque(maxlen=max_changes)
+
+    def task_added(self, task: Task) -> None:
+        """Place a pending task into its time groups."""
+        if task in self._task_keys or task.completion_status:
+            return
+        time, pet = task.time, task.parent_pet
+        self._task_keys[task] = (time, pet)
+        self._by_time.setdefault(time, {})[task] = None
+        self._by_time_pet.setdefault((time, pet), {})[task] = None
+        counts = self._pet_counts.setdefault(time, {})
+        counts[pet] = counts.get(pet, 0) + 1
+        self._refresh(time, pet)
+
+    def task_removed(self, task: Task) -> None:
+        """Take a task out of its time groups."""
+        keys = self._task_keys.pop(task, None)
+        if keys is None:
+            return
+        time, pet = keys
+        self._discard(self._by_time, time, task)
+        self._discard(self._by_time_pet, (time, pet), task)
+        counts = self._pet_counts[time]
+        counts[pet] -= 1
+        if not counts[pet]:
+            del counts[pet]
+            if not counts:
+                del self._pet_counts[time]
+        self._refresh(time, pet)
+
+    def task_changed(self, task: Task) -> None:
+        """Regroup a task after its status or time changed."""
+        self.task_removed(task)
+        self.task_added(task)
+
+    def conflicts(self) -> Dict[str, List[List[Task]]]:
+        """Return current conflicts as {time: [same-pet groups..., cross-pet group]}."""
+        result: Dict[str, List[List[Task]]] = {}
+        for key in sorted(self._active, key=lambda k: (k[1], k[0] == "cross")):
+            kind, time = key[0], key[1]
+            if kind == "pet":
+                group = self._by_time_pet[(time, key[2])]
+            else:
+                group = self._by_time[time]
+            result.setdefault(time, []).append(list(group))
+        return result
+
+    def drain_changes(self) -> List[ConflictChange]:
+        """Return conflicts added or resolved since the last call and clear the feed."""
+        changes = list(self._changes)
+        self._changes.clear()
+        return changes
+
+    def _refresh(self, time: str, pet) -> None:
+        """Re-check the two conflict keys a task event can affect."""
+        same_pet = len(self._by_time_pet.get((time, pet), ())) > 1
+        self._set_active(("pet", time, pet), same_pet, time, pet)
+        cross = len(self._pet_counts.get(time, ())) > 1
+        self._set_active(("cross", time), cross, time, None)
+
+    def _set_active(self, key: tuple, active: bool, time: str, pet) -> None:
+        """Record a conflict key as active or resolved and log transitions."""
+        if active and key not in self._active:
+            self._active[key] = None
+            self._changes.append(ConflictChange("added", time, pet))
+        elif not active and key in self._active:
+            del self._active[key]
+            self._changes.append(ConflictChange("resolved", time, pet))
+
+    @staticmethod
+    def _discard(groups: dict, key, task: Task) -> None:
+        """Remove a task from one group, dropping the group when it empties."""
+        group = groups[key]
+        del group[task]
+        if not group:
+            del groups[key]
+
+
+class TaskStats(TaskListener):
+    """
+    Running task counters maintained on every add, remove, complete and reset.
+    Each task is counted under every combination of (pet_id, frequency,
+    status) with None standing for "any", so count() is one dict lookup.
+    Completions are also kept per pet in a rolling window for completion-rate
+    dashboards; the window holds at most max_events entries per pet.
+    """
+
+    def __init__(self, window: timedelta = timedelta(days=7), max_events: int = 1024):
+        """Initialize empty counters with a rolling completion window."""
+        self.window = window
+        self.max_events = max_events
+        self._counts: Dict[tuple, int] = {}
+        self._task_keys: Dict[Task, tuple] = {}
+        self._completions: Dict[int, deque] = {}
+
+    @staticmethod
+    def _key(task: Task) -> tuple:
+        """The (pet_id, frequency, status) a task is counted under."""
+        pet = task.parent_pet
+        return (pet.pet_id if pet is not None else None, task.frequency, task.completion_status)
+
+    def _bump(self, key: tuple, delta: int) -> None:
+        """Add delta to all eight counters covering key."""
+        counts = self._counts
+        for pet_id in (key[0], None):
+            for frequency in (key[1], None):
+                for status in (key[2], None):
+                    slot = (pet_id, frequency, status)
+                    counts[slot] = counts.get(slot, 0) + delta
+
+    def task_added(self, task: Task) -> None:
+        """Count a new task."""
+        if task in self._task_keys:
+            return
+        key = self._task_keys[task] = self._key(task)
+        self._bump(key, 1)
+
+    def task_removed(self, task: Task) -> None:
+        """Stop counting a task."""
+        key = self._task_keys.pop(task, None)
+        if key is not None:
+            self._bump(key, -1)
+
+    def task_changed(self, task: Task) -> None:
+        """Move a task between counters and record completions and resets."""
+        old = self._task_keys.get(task)
+        if old is None:
+            return
+        new = self._key(task)
+        if new == old:
+            return
+        self._bump(old, -1)
+        self._bump(new, 1)
+        self._task_keys[task] = new
+        if new[2] and not old[2]:
+            self._record_completion(new[0], task)
+        elif old[2] and not new[2]:
+            self._forget_completion(new[0], task)
+
+    def pet_removed(self, pet: "Pet") -> None:
+        """Drop a removed pet's completion window."""
+        self._completions.pop(pet.pet_id, None)
+
+    def _record_completion(self, pet_id: Optional[int], task: Task) -> None:
+        """Append a completion to its pet's rolling window."""
+        events = self._completions.get(pet_id)
+        if events is None:
+            events = self._completions[pet_id] = deque(maxlen=self.max_events)
+        events.append((task.completed_at or datetime.now(), task))
+
+    def _forget_completion(self, pet_id: Optional[int], task: Task) -> None:
+        """Remove a reset task's completion from its pet's window."""
+        events = self._completions.get(pet_id, ())
+        for event in reversed(events):
+            if event[1] is task:
+                events.remove(event)
+                return
+
+    def count(
+        self,
+        status: Optional[bool] = None,
+        frequency: Optional[str] = None,
+        pet: Optional["Pet"] = None
+    ) -> int:
+        """Return how many tasks match every given filter, in O(1)."""
+        pet_id = pet.pet_id if pet is not None else None
+        return self._counts.get((pet_id, frequency, status), 0)
+
+    @property
+    def total(self) -> int:
+        """Number of counted tasks."""
+        return self._counts.get((None, None, None), 0)
+
+    @property
+    def pending(self) -> int:
+        """Number of pending tasks."""
+        return self._counts.get((None, None, False), 0)
+
+    @property
+    def completed(self) -> int:
+        """Number of completed tasks."""
+        return self._counts.get((None, None, True), 0)
+
+    def pet_counts(self, pet: "Pet") -> Tuple[int, int]:
+        """Return (pending, completed) for one pet."""
+        return (
+            self._counts.get((pet.pet_id, None, False), 0),
+            self._counts.get((pet.pet_id, None, True), 0),
+        )
+
+    def recent_completions(self, pet: "Pet", now: Optional[datetime] = None) -> int:
+        """
+        Return the pet's completions within the window ending at now.
+        Entries older than the window are dropped as they are passed, so
+        repeated calls cost amortized O(1).
+        """
+        events = self._completions.get(pet.pet_id)
+        if not events:
+            return 0
+        cutoff = (now or datetime.now()) - self.window
+        while events and events[0][0] < cutoff:
+            events.popleft()
+        return len(events)
+
+    def completion_rate(self, pet: "Pet", now: Optional[datetime] = None) -> float:
+        """Return the pet's average completions per day over the window."""
+        days = self.window / timedelta(days=1)
+        return self.recent_completions(pet, now) / days if days else 0.0
+
+    def __len__(self) -> int:
+        """Return the number of counted tasks."""
+        return len(self._task_keys)
+
+
 class Pet:
     """
     Represents a pet with associated tasks.
     """
+    __slots__ = (
+        "_name", "_species", "_age", "_tasks", "_loader", "owner", "pet_id", "version", "_view",
+    )
+
     def __init__(
             self,
             name: str,
             species: str,
-            age: int
+            age: int,
+            pet_id: Optional[int] = None
         ):
         """Initialize a Pet object."""
-        self.name = name
-        self.species = species
-        self.age = age
-        self.tasks: List[Task] = []
+        self._name = name
+        self._species = species
+        self._age = age
+        # keyed by task_id, in insertion order; None until a lazy pet loads
+        self._tasks: Optional[Dict[int, Task]] = {}
+        # cached tuple behind the tasks view; dropped when tasks are added or removed
+        self._view: Optional[Tuple[Task, ...]] = ()
+        self._loader = None
+        self.owner = None
+        self.pet_id = ids.allocate() if pet_id is None else pet_id
+        # bumped on every task mutation; used to invalidate cached queries
+        self.version = 0
+
+    @classmethod
+    def lazy(cls, name: str, species: str, age: int, pet_id: int, loader) -> "Pet":
+        """
+        Create a pet whose tasks are fetched by loader(pet) on first access.
+        Used by storage backends so pets can be listed without their tasks.
+        """
+        pet = cls(name, species, age, pet_id=pet_id)
+        pet._tasks = None
+        pet._view = None
+        pet._loader = loader
+        return pet
+
+    @property
+    def name(self) -> str:
+        """The pet's name, unique within its owner."""
+        return self._name
+
+    @name.setter
+    def name(self, value: str) -> None:
+        """Rename the pet, keeping the owner's name registry in step."""
+        if value == self._name:
+            return
+        if self.owner is not None:
+            self.owner._rename_pet(self, value)
+        self._name = value
+        self._changed()
+
+    @property
+    def species(self) -> str:
+        """The pet's species."""
+        return self._species
+
+    @species.setter
+    def species(self, value: str) -> None:
+        """Change the species and notify the owner's listeners."""
+        if value != self._species:
+            self._species = value
+            self._changed()
+
+    @property
+    def age(self) -> int:
+        """The pet's age in years."""
+        return self._age
+
+    @age.setter
+    def age(self, value: int) -> None:
+        """Change the age and notify the owner's listeners."""
+        if value != self._age:
+            self._age = value
+            self._changed()
+
+    def _changed(self) -> None:
+        """Bump the pet's version and tell the owner one of its fields changed."""
+        self.version += 1
+        if self.owner is not None:
+            self.owner._pet_changed(self)
+
+    @property
+    def tasks(self) -> Tuple[Task, ...]:
+        """
+        Read-only view of this pet's tasks, loaded on first access for lazy pets.
+        The tuple is shared until a task is added or removed, so reads do not
+        copy and iterating it stays safe while the pet is modified.
+        """
+        view = self._view
+        if view is None:
+            view = self._view = tuple(self._task_map().values())
+        return view
+
+    def _task_map(self) -> Dict[int, Task]:
+        """The task registry keyed by task_id, loading a lazy pet first."""
+        if self._tasks is None:
+            self._load_tasks()
+        return self._tasks
+
+    def get_task(self, task_id: int) -> Optional[Task]:
+        """Return the task with task_id, or None."""
+        return self._task_map().get(task_id)
+
+    @property
+    def is_loaded(self) -> bool:
+        """Return False while a lazy pet's tasks have not been fetched."""
+        return self._tasks is not None
+
+    def load(self) -> None:
+        """Fetch a lazy pet's tasks now; does nothing once they are in memory."""
+        if self._tasks is None:
+            self._load_tasks()
+
+    def _load_tasks(self) -> None:
+        """Fetch tasks through the loader and announce them to the owner."""
+        loader, self._loader = self._loader, None
+        self._tasks = {task.task_id: task for task in loader(self)}
+        self._view = None
+        for task in self._tasks.values():
+            task.parent_pet = self
+        if self.owner is not None:
+            self.owner._tasks_loaded(self)
+
+    def _loaded_tasks(self) -> Tuple[Task, ...]:
+        """Return tasks already in memory without triggering a lazy load."""
+        return self.tasks if self._tasks is not None else ()
 
     def add_task(self, task: Task) -> None:
         """Add a task to this pet's task list."""
         if not isinstance(task, Task):
             raise TypeError("Can only add Task objects.")
+        registry = self._task_map()
+        if task.task_id in registry:
+            raise ValueError(f"Task id {task.task_id} is already on this pet.")
         #set parent_pet reference for task
         task.parent_pet = self
-        self.tasks.append(task)
+        registry[task.task_id] = task
+        self._view = None
+        self.version += 1
+        if self.owner is not None:
+            self.owner._index_task(task)
+
+    def add_tasks(self, tasks) -> None:
+        """Add many tasks at once, announcing them to the owner in one pass."""
+        tasks = list(tasks)
+        registry = self._task_map()
+        for task in tasks:
+            if not isinstance(task, Task):
+                raise TypeError("Can only add Task objects.")
+            if task.task_id in registry:
+                raise ValueError(f"Task id {task.task_id} is already on this pet.")
+        for task in tasks:
+            task.parent_pet = self
+            registry[task.task_id] = task
+        self._view = None
+        self.version += 1
+        if self.owner is not None:
+            for task in tasks:
+                self.owner._index_task(task)
 
     def remove_task(self, task: Task) -> None:
         """Remove a task from this pet's task list."""
-        try:
-            self.tasks.remove(task)
-        except ValueError as exc:
-            raise ValueError("Task not found in pet's task list.") from exc
+        registry = self._task_map()
+        if registry.get(task.task_id) is not task:
+            raise ValueError("Task not found in pet's task list.")
+        del registry[task.task_id]
+        self._view = None
+        self.version += 1
+        if self.owner is not None:
+            self.owner._unindex_task(task)
 
     def get_all_tasks(self) -> List[Task]:
-        """Return all tasks for this pet."""
-        return self.tasks.copy()
+        """Return a new list of all tasks for this pet; read through tasks to avoid the copy."""
+        return list(self.tasks)
 
     def get_pending_tasks(self) -> List[Task]:
         """Return all pending tasks for this pet."""
@@ -129,55 +1272,393 @@ class Pet:
         )
 
 
+def day_minutes(block: Union["TimeSlot", Tuple[str, str]]) -> Tuple[int, int]:
+    """
+    Return a time block as (start, end) minutes of the day. A TimeSlot that
+    ends on a later date than it starts runs to midnight.
+    """
+    if isinstance(block, TimeSlot):
+        start = block.start.hour * 60 + block.start.minute
+        if block.end.date() > block.start.date():
+            return start, MINUTES_PER_DAY
+        return start, block.end.hour * 60 + block.end.minute
+    bounds = tuple(parse_minutes(bound) for bound in block)
+    if len(bounds) != 2 or None in bounds or bounds[0] >= bounds[1]:
+        raise ValueError(f"Invalid time block {block!r}, expected ('HH:MM', 'HH:MM').")
+    return bounds
+
+
 class Owner:
     """
     Manages multiple pets.
     """
-    def __init__(self, name: str):
-        """Initialize an Owner object."""
+    __slots__ = (
+        "name", "_pets", "_pets_by_name", "_unloaded", "_task_index", "_time_index",
+        "_conflict_engine", "_task_stats", "_listeners", "retention", "archive", "version",
+        "availability", "_pet_view", "_task_view",
+    )
+
+    def __init__(
+            self,
+            name: str,
+            retention: Optional[RetentionPolicy] = None,
+            archive=None,
+            availability: Optional[List[Union["TimeSlot", Tuple[str, str]]]] = None
+        ):
+        """
+        Initialize an Owner object.
+        With a retention policy, completed tasks beyond the policy are moved
+        from pets' task lists into archive (in memory unless one is given).
+        availability lists the time blocks the owner can do tasks in, as
+        TimeSlots or ('HH:MM', 'HH:MM') pairs; only their times of day are
+        kept, as (start, end) minutes, so they apply to every day. None means
+        the whole day.
+        """
         self.name = name
-        self.pets: List[Pet] = []
+        self.availability: Optional[List[Tuple[int, int]]] = (
+            None if availability is None else [day_minutes(block) for block in availability]
+        )
+        self.retention = retention
+        self.archive = archive if archive is not None else TaskArchive()
+        # registries by pet_id (insertion ordered) and by unique name
+        self._pets: Dict[int, Pet] = {}
+        self._pets_by_name: Dict[str, Pet] = {}
+        # lazy pets whose tasks are still on disk, by pet_id
+        self._unloaded: Dict[int, Pet] = {}
+        # cached tuples behind the pets and tasks views; None once stale
+        self._pet_view: Optional[Tuple[Pet, ...]] = ()
+        self._task_view: Optional[Tuple[Task, ...]] = ()
+        self._task_index = TaskIndex()
+        self._time_index = TimeIndex()
+        self._conflict_engine = ConflictEngine()
+        self._task_stats = TaskStats()
+        self._listeners: List[TaskListener] = [
+            self._task_index, self._time_index, self._conflict_engine, self._task_stats
+        ]
+        # bumped on every pet or task mutation; used to invalidate cached queries
+        self.version = 0
 
     def add_pet(self, pet: Pet) -> None:
         """Add a pet to this owner's list."""
         if not isinstance(pet, Pet):
             raise TypeError("Can only add Pet objects.")
-        self.pets.append(pet)
+        if pet.pet_id in self._pets:
+            raise ValueError(f"Pet id {pet.pet_id} already belongs to {self.name}.")
+        if pet.name in self._pets_by_name:
+            raise ValueError(f"{self.name} already has a pet named '{pet.name}'.")
+        self._pets[pet.pet_id] = pet
+        self._pets_by_name[pet.name] = pet
+        if not pet.is_loaded:
+            self._unloaded[pet.pet_id] = pet
+        self._pet_view = self._task_view = None
+        pet.owner = self
+        self.version += 1
+        for listener in self._listeners:
+            listener.pet_added(pet)
+        for task in pet._loaded_tasks():
+            self._index_task(task)
 
     def remove_pet(self, pet: Pet) -> None:
         """Remove a pet from this owner's list."""
-        try:
-            self.pets.remove(pet)
-        except ValueError as exc:
-            raise ValueError("Pet not found in owner's list.") from exc
+        if self._pets.get(pet.pet_id) is not pet:
+            raise ValueError("Pet not found in owner's list.")
+        del self._pets[pet.pet_id]
+        del self._pets_by_name[pet.name]
+        self._unloaded.pop(pet.pet_id, None)
+        self._pet_view = self._task_view = None
+        for task in pet._loaded_tasks():
+            self._unindex_task(task)
+        pet.owner = None
+        self.version += 1
+        for listener in self._listeners:
+            listener.pet_removed(pet)
+
+    # The owner-wide indexes only cover tasks in memory, so reading one first
+    # loads any lazy pets that are still pending.
+
+    @property
+    def task_index(self) -> TaskIndex:
+        """Secondary indexes over every task, loading lazy pets first."""
+        self._load_pending()
+        return self._task_index
+
+    @property
+    def time_index(self) -> TimeIndex:
+        """Minute-of-day index over pending tasks, loading lazy pets first."""
+        self._load_pending()
+        return self._time_index
+
+    @property
+    def conflict_engine(self) -> ConflictEngine:
+        """Incremental conflict groups, loading lazy pets first."""
+        self._load_pending()
+        return self._conflict_engine
+
+    @property
+    def task_stats(self) -> TaskStats:
+        """Running task counters, loading lazy pets first."""
+        self._load_pending()
+        return self._task_stats
+
+    def _load_pending(self) -> None:
+        """Load every lazy pet that has not fetched its tasks yet."""
+        while self._unloaded:
+            next(iter(self._unloaded.values())).load()
+
+    @property
+    def pets(self) -> Tuple[Pet, ...]:
+        """Read-only view of this owner's pets in the order they were added."""
+        view = self._pet_view
+        if view is None:
+            view = self._pet_view = tuple(self._pets.values())
+        return view
+
+    @property
+    def tasks(self) -> Tuple[Task, ...]:
+        """
+        Read-only view of every task across all pets, grouped by pet.
+        Like Pet.tasks, the tuple is rebuilt only after tasks or pets are
+        added or removed, so repeated reads do not copy.
+        """
+        view = self._task_view
+        if view is None:
+            view = self._task_view = tuple(
+                task for pet in self._pets.values() for task in pet.tasks
+            )
+        return view
+
+    def iter_tasks(
+        self,
+        status: Optional[bool] = None,
+        frequency: Optional[str] = None,
+        pet: Optional[Pet] = None
+    ) -> Iterator[Task]:
+        """
+        Lazily yield tasks matching every given filter.
+        Status and frequency filters read the index bucket views (which cover
+        loaded pets); otherwise the pet or owner tasks view is walked. Both
+        are shared tuples, so tasks can be modified while iterating.
+        """
+        if pet is not None and status is not None:
+            pet.load()
+            source = self._task_index.view("pet_status", (pet, status))
+        elif status is not None and frequency is not None:
+            source = self.task_index.view("frequency_status", (frequency, status))
+        elif status is not None:
+            source = self.task_index.view("status", status)
+        elif frequency is not None and pet is None:
+            source = self.task_index.view("frequency", frequency)
+        else:
+            source = pet.tasks if pet is not None else self.tasks
+        for task in source:
+            if frequency is not None and task.frequency != frequency:
+                continue
+            yield task
+
+    def get_pet(self, name: str) -> Optional[Pet]:
+        """Return the pet with this name, or None."""
+        return self._pets_by_name.get(name)
+
+    def get_pet_by_id(self, pet_id: int) -> Optional[Pet]:
+        """Return the pet with this pet_id, or None."""
+        return self._pets.get(pet_id)
+
+    def _rename_pet(self, pet: Pet, name: str) -> None:
+        """Move a pet to a new name in the registry; names stay unique."""
+        if name == pet.name:
+            return
+        if name in self._pets_by_name:
+            raise ValueError(f"{self.name} already has a pet named '{name}'.")
+        del self._pets_by_name[pet.name]
+        self._pets_by_name[name] = pet
+
+    def _pet_changed(self, pet: Pet) -> None:
+        """Notify listeners that a pet's own fields changed."""
+        self.version += 1
+        for listener in self._listeners:
+            listener.pet_changed(pet)
 
     def get_all_pets(self) -> List[Pet]:
-        """Return all pets owned by this owner."""
-        return self.pets.copy()
+        """Return a new list of all pets; read through pets to avoid the copy."""
+        return list(self.pets)
 
     def get_all_tasks(self) -> List[Task]:
-        """Return all tasks across all pets."""
-        tasks = []
-        for pet in self.pets:
-            tasks.extend(pet.get_all_tasks())
-        return tasks
+        """Return a new list of all tasks across all pets; read through tasks to avoid the copy."""
+        return list(self.tasks)
+
+    def apply_retention(self, pet: Optional[Pet] = None, now: Optional[datetime] = None) -> int:
+        """
+        Archive completed tasks that fall outside the retention policy.
+        Applies to one pet or all pets; returns the number of tasks archived.
+        """
+        policy = self.retention
+        if policy is None:
+            return 0
+        now = now or datetime.now()
+        cutoff = now - timedelta(days=policy.keep_days) if policy.keep_days is not None else None
+        archived = 0
+        for current in [pet] if pet is not None else list(self._pets.values()):
+            # the (pet, True) bucket is ordered by completion, oldest first
+            current.load()
+            completed = self._task_index.lookup("pet_status", (current, True))
+            excess = len(completed) - policy.keep_last if policy.keep_last is not None else 0
+            for position, task in enumerate(completed):
+                expired = (
+                    cutoff is not None and task.completed_at is not None
+                    and task.completed_at < cutoff
+                )
+                if position < excess or expired:
+                    self.archive.append(task)
+                    current.remove_task(task)
+                    archived += 1
+        return archived
+
+    def subscribe(self, listener: TaskListener, replay: bool = True) -> None:
+        """
+        Register a listener for task add/remove/change events.
+        With replay, the listener first receives pet_added and task_added for
+        existing pets and their loaded tasks.
+        """
+        if replay:
+            for pet in self._pets.values():
+                listener.pet_added(pet)
+                for task in pet._loaded_tasks():
+                    listener.task_added(task)
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener: TaskListener) -> None:
+        """Stop sending events to a listener."""
+        try:
+            self._listeners.remove(listener)
+        except ValueError as exc:
+            raise ValueError("Listener is not subscribed to this owner.") from exc
+
+    def _index_task(self, task: Task) -> None:
+        """Notify listeners that a task was added."""
+        self.version += 1
+        self._task_view = None
+        for listener in self._listeners:
+            listener.task_added(task)
+
+    def _unindex_task(self, task: Task) -> None:
+        """Notify listeners that a task was removed."""
+        self.version += 1
+        self._task_view = None
+        for listener in self._listeners:
+            listener.task_removed(task)
+
+    def _tasks_loaded(self, pet: Pet) -> None:
+        """Notify listeners that a lazy pet's stored tasks are now in memory."""
+        self._unloaded.pop(pet.pet_id, None)
+        self.version += 1
+        self._task_view = None
+        tasks = pet.tasks
+        for listener in self._listeners:
+            listener.tasks_loaded(pet, tasks)
+
+    def _reindex_task(self, task: Task) -> None:
+        """Notify listeners that a task changed."""
+        self.version += 1
+        for listener in self._listeners:
+            listener.task_changed(task)
+
+    def _reindex_tasks(self, tasks: List[Task]) -> None:
+        """Notify listeners that many tasks changed, bumping the version once."""
+        self.version += 1
+        for listener in self._listeners:
+            for task in tasks:
+                listener.task_changed(task)
 
     def __str__(self) -> str:
         """Return string representation of the owner."""
         return (
-            f"Owner(name='{self.name}', pets={len(self.pets)})"
+            f"Owner(name='{self.name}', pets={len(self._pets)})"
         )
 
 
+def _copy_result(value):
+    """Copy the list/dict containers of a cached result, leaving Tasks shared."""
+    if isinstance(value, list):
+        return [_copy_result(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _copy_result(item) for key, item in value.items()}
+    return value
+
+
+def memoized(method):
+    """
+    Cache a Scheduler query until the owner or pet data it reads changes.
+    Queries taking a pet_name are keyed on that pet's version; the rest on
+    the owner's version. Callers receive copies of the cached containers.
+    """
+    parameters = list(inspect.signature(method).parameters)[1:]
+    pet_position = parameters.index("pet_name") if "pet_name" in parameters else None
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        pet_name = kwargs.get("pet_name")
+        if pet_name is None and pet_position is not None and len(args) > pet_position:
+            pet_name = args[pet_position]
+        version = self._version_for(pet_name)
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] == version:
+            self._cache.move_to_end(key)
+            self.cache_hits += 1
+            return _copy_result(cached[1])
+        self.cache_misses += 1
+        result = method(self, *args, **kwargs)
+        self._cache[key] = (version, result)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return _copy_result(result)
+    return wrapper
+
+
 class Scheduler:
     """
     Manages scheduling for an owner's pets.
+    Query results and per-pet page lists are memoized per owner/pet version,
+    each with LRU eviction once more than cache_size entries are cached.
     """
 
-    def __init__(self, owner: Owner):
+    def __init__(self, owner: Owner, cache_size: int = 128):
         """Initialize a Scheduler object."""
         self.owner = owner
+        self.cache_size = cache_size
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._cache: OrderedDict = OrderedDict()
+        self._page_lists: OrderedDict = OrderedDict()
 
+    def _version_for(self, pet_name: Optional[str]):
+        """Return the version a query depends on: the named pet's or the owner's."""
+        if pet_name is None:
+            return self.owner.version
+        pet = self.owner.get_pet(pet_name)
+        return None if pet is None else (pet.pet_id, pet.version)
+
+    def clear_cache(self) -> None:
+        """Drop all memoized results."""
+        self._cache.clear()
+        self._page_lists.clear()
+
+    def stats(self) -> TaskStats:
+        """
+        Return the owner's running task counters. They are updated on every
+        mutation, so count(), total, pending, completed and pet_counts() are
+        O(1) reads with no caching involved.
+        """
+        return self.owner.task_stats
+
+    @memoized
+    def pet_task_counts(self) -> Dict[str, Tuple[int, int]]:
+        """Return {pet name: (pending count, completed count)} from the running counters."""
+        stats = self.owner.task_stats
+        return {pet.name: stats.pet_counts(pet) for pet in self.owner.pets}
+
+    @memoized
     def conflict_warnings(self) -> List[str]:
         """
         Lightweight conflict detection.
@@ -208,70 +1689,342 @@ class Scheduler:
                     )
         return warnings
 
+    @memoized
     def detect_conflicts(self) -> Dict[str, List[List[Task]]]:
         """
         Detects and returns scheduling conflicts for all pets.
         Returns a dict mapping time strings to lists of conflicting Task objects.
         Example: { '08:00': [ [Task1, Task2], [Task3, Task4] ] }
         """
-        all_tasks = self.owner.get_all_tasks()
-        time_pet_map = defaultdict(list)
-        time_map = defaultdict(list)
-        for task in all_tasks:
-            if not task.completion_status:
-                time_pet_map[(task.time, getattr(task.parent_pet, 'name', None))].append(task)
-                time_map[task.time].append(task)
-
-        conflicts = defaultdict(list)
-        # Same-pet conflicts
-        for (time), tasks in time_pet_map.items():
-            if len(tasks) > 1:
-                conflicts[time].append(tasks)
-        # Cross-pet conflicts
-        for time, tasks in time_map.items():
-            pet_names = {getattr(t.parent_pet, 'name', None) for t in tasks}
-            if len(tasks) > 1 and len(pet_names) > 1:
-                conflicts[time].append(tasks)
-        return dict(conflicts)
+        return self.owner.conflict_engine.conflicts()
 
+    def detect_overlaps(self, per_pet: bool = False) -> List[Tuple[Task, Task]]:
+        """
+        Return pairs of pending tasks whose time slots overlap.
+        By default all of the owner's tasks are checked together, since one
+        caregiver handles them; with per_pet only same-pet pairs are reported.
+        """
+        tasks = self.owner.time_index.between(0, MINUTES_PER_DAY)
+        if not per_pet:
+            return find_overlaps(tasks)
+        by_pet: Dict[Pet, List[Task]] = {}
+        for task in tasks:
+            by_pet.setdefault(task.parent_pet, []).append(task)
+        return [pair for pet_tasks in by_pet.values() for pair in find_overlaps(pet_tasks)]
+
+    def conflict_changes(self) -> List[ConflictChange]:
+        """Return conflicts added or resolved since the last call."""
+        return self.owner.conflict_engine.drain_changes()
+
+    def completion_history(
+        self,
+        pet_name: Optional[str] = None,
+        since: Optional[datetime] = None
+    ) -> List[ArchivedTask]:
+        """
+        Return completed tasks, oldest first: archived occurrences followed by
+        completed tasks still in the live lists.
+        """
+        history = list(self.owner.archive.history(pet_name=pet_name, since=since))
+        if pet_name is None:
+            completed = self.owner.task_index.lookup("status", True)
+        else:
+            completed = self.owner.task_index.lookup(
+                "pet_status", (self.owner.get_pet(pet_name), True)
+            )
+        for task in completed:
+            name = getattr(task.parent_pet, 'name', None)
+            if since is not None and (task.completed_at is None or task.completed_at < since):
+                continue
+            history.append(
+                ArchivedTask(name, task.description, task.time, task.frequency, task.completed_at)
+            )
+        return history
+
+    def occurrences(
+        self,
+        start_date: date,
+        end_date: date,
+        pet_name: Optional[str] = None
+    ) -> Iterator[Occurrence]:
+        """
+        Stream dated occurrences of pending tasks in [start_date, end_date],
+        ordered by date then time. Recurring tasks are expanded lazily, so
+        consumers only pay for the occurrences they actually read.
+        """
+        if pet_name is None:
+            tasks = self.owner.task_index.lookup("status", False)
+        else:
+            tasks = self.owner.task_index.lookup(
+                "pet_status", (self.owner.get_pet(pet_name), False)
+            )
+        streams = [self._expand(task, start_date, end_date) for task in tasks]
+        return heapq.merge(*streams, key=self._occurrence_key)
+
+    @staticmethod
+    def _expand(task: Task, start_date: date, end_date: date) -> Iterator[Occurrence]:
+        """Yield one task's occurrences in the window."""
+        for day in task.occurrence_dates(start_date, end_date):
+            yield Occurrence(day, task.time, task)
+
+    @staticmethod
+    def _occurrence_key(occurrence: Occurrence) -> Tuple[date, int]:
+        """Sort key for occurrences: date, then minute (invalid times first)."""
+        minute = occurrence.task.minute
+        return occurrence.date, -1 if minute is None else minute
+
+    def plan_day(self, day: Optional[date] = None, refine: bool = False) -> "Plan":
+        """
+        Assign start times to the day's pending tasks within the owner's
+        availability, minimising priority-weighted lateness.
+        """
+        from pawpal_planner import DailyPlanner
+        return DailyPlanner(self.owner).plan(day=day, refine=refine)
+
+    @memoized
     def get_tasks_by_frequency(self, frequency: str) -> List[Task]:
         """Return all tasks with the specified frequency."""
-        return [task for task in self.owner.get_all_tasks() if task.frequency == frequency]
-
-    def get_overdue_tasks(self) -> List[Task]:
-        """Return all overdue tasks that are pending."""
-        now = datetime.now().strftime('%H:%M')
-        return [
-            task for task in self.owner.get_all_tasks()
-            if not task.completion_status and task.time < now
-        ]
+        return self.owner.task_index.lookup("frequency", frequency)
 
+    def get_overdue_tasks(self, now: Optional[datetime] = None) -> List[Task]:
+        """
+        Return pending tasks that are overdue at now: everything due on an
+        earlier date (by date, then time), followed by today's tasks whose
+        time has passed. Tasks without a due date count as due today.
+        """
+        now = now or datetime.now()
+        today = now.date()
+        index = self.owner.task_index
+        past_dates = sorted(
+            due for due, completed in index.keys("due_status")
+            if not completed and due is not None and due < today
+        )
+        overdue = []
+        for due in past_dates:
+            overdue.extend(sorted(index.lookup("due_status", (due, False)), key=self._minute_key))
+        overdue.extend(
+            task for task in self.owner.time_index.between(0, now.hour * 60 + now.minute)
+            if (task.due_date or today) == today
+        )
+        return overdue
+
+    @staticmethod
+    def _minute_key(task: Task) -> int:
+        """Sort key for time of day, with invalid times first."""
+        minute = task.minute
+        return -1 if minute is None else minute
+
+    def schedule_for_range(
+        self,
+        start: date,
+        end: date,
+        pet_name: Optional[str] = None
+    ) -> Dict[date, List[Task]]:
+        """
+        Return {day: pending tasks occurring that day, in time order} for
+        every day in [start, end]. Tasks are sorted by time once and then
+        dropped into day buckets (daily and weekly tasks by integer stride),
+        so each bucket comes out ordered without a per-day sort.
+        """
+        if end < start:
+            raise ValueError("end must not be before start.")
+        span = (end - start).days + 1
+        buckets: List[List[Task]] = [[] for _ in range(span)]
+        pet = None
+        if pet_name is not None:
+            pet = self.owner.get_pet(pet_name)
+            if pet is None:
+                raise ValueError(f"Pet named '{pet_name}' not found.")
+        pending = sorted(self.owner.iter_tasks(status=False, pet=pet), key=self._minute_key)
+        today = date.today()
+        for task in pending:
+            frequency = task.frequency
+            if frequency == Frequency.DAILY or frequency == Frequency.WEEKLY:
+                step = 1 if frequency == Frequency.DAILY else 7
+                first = ((task.due_date or today) - start).days
+                if first < 0:
+                    first %= step
+                for offset in range(first, span, step):
+                    buckets[offset].append(task)
+            else:
+                for day in task.occurrence_dates(start, end):
+                    buckets[(day - start).days].append(task)
+        return {start + timedelta(days=offset): bucket for offset, bucket in enumerate(buckets)}
+
+    def week_view(self, day: Optional[date] = None) -> Dict[date, List[Task]]:
+        """Return schedule_for_range for the Monday-to-Sunday week containing day."""
+        day = day or date.today()
+        monday = day - timedelta(days=day.weekday())
+        return self.schedule_for_range(monday, monday + timedelta(days=6))
+
+    def month_view(self, year: int, month: int) -> Dict[date, List[Task]]:
+        """Return schedule_for_range for a calendar month."""
+        last = calendar.monthrange(year, month)[1]
+        return self.schedule_for_range(date(year, month, 1), date(year, month, last))
+
+    def tasks_between(
+        self,
+        start: Union[str, dt_time],
+        end: Union[str, dt_time]
+    ) -> List[Task]:
+        """
+        Return pending tasks scheduled in [start, end), sorted by time.
+        Bounds may be 'HH:MM' strings or datetime.time objects.
+        """
+        return self.owner.time_index.between(self._to_minutes(start), self._to_minutes(end))
+
+    @staticmethod
+    def _to_minutes(value: Union[str, dt_time]) -> int:
+        """Convert a time bound to minutes after midnight."""
+        if isinstance(value, dt_time):
+            return value.hour * 60 + value.minute
+        minutes = parse_minutes(value)
+        if minutes is None:
+            raise ValueError(f"Invalid time '{value}', expected 'HH:MM'.")
+        return minutes
+
+    @memoized
     def get_tasks_for_pet(self, pet_name: str) -> List[Task]:
         """Return all tasks for a specific pet by name."""
-        for pet in self.owner.get_all_pets():
-            if pet.name == pet_name:
-                return pet.get_all_tasks()
-        raise ValueError(f"Pet named '{pet_name}' not found.")
+        pet = self.owner.get_pet(pet_name)
+        if pet is None:
+            raise ValueError(f"Pet named '{pet_name}' not found.")
+        return list(pet.tasks)
 
+    @memoized
     def generate_daily_schedule(self) -> Dict[str, List[Task]]:
         """Generate a daily schedule mapping pet names to daily tasks."""
-        return {
-            pet.name: self.sort_by_time([
-                task for task in pet.get_all_tasks()
-                if task.frequency == "daily" and not task.completion_status
-            ])
-            for pet in self.owner.get_all_pets()
-        }
+        by_pet = {pet: [] for pet in self.owner.pets}
+        for task in self.owner.task_index.lookup("frequency_status", ("daily", False)):
+            by_pet[task.parent_pet].append(task)
+        return {pet.name: self.sort_by_time(tasks) for pet, tasks in by_pet.items()}
+
+    def task_page(
+        self,
+        limit: int = 20,
+        cursor: Optional[PageCursor] = None,
+        completion_status: Optional[bool] = None,
+        pet_name: Optional[str] = None
+    ) -> TaskPage:
+        """
+        Return up to limit tasks after cursor, grouped by pet in the owner's
+        pet order and sorted by time within each pet. Pass next_cursor back in
+        for the following page; it is None on the last page. Each pet's sorted
+        list is cached per pet version, so a page costs O(pets + limit) plus a
+        bisect instead of a scan of every task.
+        """
+        if limit < 1:
+            raise ValueError("limit must be at least 1.")
+        if pet_name is None:
+            pets = self.owner.pets
+        else:
+            pet = self.owner.get_pet(pet_name)
+            pets = [] if pet is None else [pet]
+        start = 0
+        if cursor is not None:
+            # a cursor whose pet was removed has nothing after it
+            start = next(
+                (position for position, pet in enumerate(pets) if pet.pet_id == cursor.pet_id),
+                len(pets),
+            )
+        groups: List[Tuple[Pet, List[Task]]] = []
+        remaining = limit
+        for position in range(start, len(pets)):
+            pet = pets[position]
+            keys, tasks = self._sorted_pet_tasks(pet, completion_status)
+            begin = 0
+            if cursor is not None and position == start:
+                begin = bisect.bisect_right(keys, (cursor.time, cursor.task_id))
+            chunk = tasks[begin:begin + remaining]
+            if chunk:
+                groups.append((pet, chunk))
+                remaining -= len(chunk)
+            if remaining == 0:
+                more = begin + len(chunk) < len(tasks) or any(
+                    self._sorted_pet_tasks(later, completion_status)[1]
+                    for later in pets[position + 1:]
+                )
+                last = chunk[-1]
+                next_cursor = PageCursor(pet.pet_id, last.time, last.task_id) if more else None
+                return TaskPage(groups, next_cursor)
+        return TaskPage(groups, None)
+
+    def _sorted_pet_tasks(
+        self,
+        pet: Pet,
+        completion_status: Optional[bool]
+    ) -> Tuple[List[Tuple[str, int]], List[Task]]:
+        """Return (sort keys, tasks) for one pet sorted by time, cached per pet version."""
+        tasks = pet.tasks  # loads a lazy pet before its version is read
+        key = (pet.pet_id, completion_status)
+        cached = self._page_lists.get(key)
+        if cached is not None and cached[0] == pet.version:
+            self._page_lists.move_to_end(key)
+            return cached[1], cached[2]
+        if completion_status is not None:
+            tasks = [task for task in tasks if task.completion_status == completion_status]
+        tasks = sorted(tasks, key=lambda task: (task.time, task.task_id))
+        keys = [(task.time, task.task_id) for task in tasks]
+        self._page_lists[key] = (pet.version, keys, tasks)
+        self._page_lists.move_to_end(key)
+        while len(self._page_lists) > self.cache_size:
+            self._page_lists.popitem(last=False)
+        return keys, tasks
 
     def sort_by_time(self, tasks: List[Task]) -> List[Task]:
         """Return a list of Task objects sorted by their time attribute (HH:MM)."""
         return sorted(tasks, key=lambda task: task.time)
 
-    def mark_tasks_complete(self, tasks: List[Task]) -> None:
+    def mark_tasks_complete(self, tasks: List[Task]) -> CompletionSummary:
         """Mark a list of tasks as complete."""
+        return self.complete_tasks(tasks)
+
+    def complete_tasks(
+        self,
+        tasks: List[Task],
+        now: Optional[datetime] = None
+    ) -> CompletionSummary:
+        """
+        Complete many tasks in one pass. The clock is read once, next
+        occurrences for recurring tasks are built together and appended per
+        pet with add_tasks, and each owner and pet version moves once rather
+        than once per task. Tasks that are already complete are skipped.
+        """
+        now = now or datetime.now()
+        today, fallback_time = now.date(), now.strftime('%H:%M')
+        summary = CompletionSummary()
+        by_pet: Dict[Pet, List[Task]] = {}
         for task in tasks:
-            task.mark_complete()
+            if task.completion_status:
+                summary.skipped.append(task)
+                continue
+            task.completion_status = True
+            task.completed_at = now
+            summary.completed.append(task)
+            if task.parent_pet is not None:
+                by_pet.setdefault(task.parent_pet, []).append(task)
+
+        by_owner: Dict[Owner, List[Task]] = {}
+        for pet, completed in by_pet.items():
+            pet.version += 1
+            if pet.owner is not None:
+                by_owner.setdefault(pet.owner, []).extend(completed)
+        for owner, completed in by_owner.items():
+            owner._reindex_tasks(completed)
 
+        for pet, completed in by_pet.items():
+            created = [
+                task._next_occurrence(today, fallback_time)
+                for task in completed if isinstance(task.frequency, Frequency)
+            ]
+            if created:
+                pet.add_tasks(created)
+                summary.created.extend(created)
+            if pet.owner is not None and pet.owner.retention is not None:
+                summary.archived += pet.owner.apply_retention(pet, now)
+        return summary
+
+    @memoized
     def filter_tasks(
         self,
         completion_status: bool = None,
@@ -281,23 +2034,53 @@ class Scheduler:
         Filter tasks by completion status and/or pet name.
         If a filter is None, it is ignored.
         """
-        if pet_name is not None:
-            tasks = [
-                task for pet in self.owner.get_all_pets() if pet.name == pet_name
-                for task in pet.get_all_tasks()
-            ]
-        else:
-            tasks = self.owner.get_all_tasks()
-        if completion_status is not None:
-            tasks = [task for task in tasks if task.completion_status == completion_status]
-        return tasks
+        index = self.owner.task_index
+        if pet_name is None:
+            if completion_status is None:
+                return list(self.owner.tasks)
+            return index.lookup("status", completion_status)
+        pet = self.owner.get_pet(pet_name)
+        if pet is None:
+            return []
+        return list(self.owner.iter_tasks(status=completion_status, pet=pet))
 
     def __str__(self) -> str:
         """Return string representation of the scheduler."""
         return f"Scheduler(owner='{self.owner.name}')"
 
+def find_overlaps(tasks: List[Task]) -> List[Tuple[Task, Task]]:
+    """
+    Sweep-line overlap detection over task time slots in O(n log n + k).
+    Slots are half-open [start, end); tasks with invalid times are skipped.
+    """
+    intervals = []
+    for position, task in enumerate(tasks):
+        start = task.minute
+        if start is not None:
+            intervals.append((start, start + max(task.duration or 0, 1), position, task))
+    intervals.sort(key=lambda interval: (interval[0], interval[2]))
+
+    overlaps = []
+    active = []  # heap of (end, position, task) for slots still open
+    for start, end, position, task in intervals:
+        while active and active[0][0] <= start:
+            heapq.heappop(active)
+        overlaps.extend((other, task) for _, _, other in active)
+        heapq.heappush(active, (end, position, task))
+    return overlaps
+
+
 @dataclass
 class TimeSlot:
     """Represents a block of time with a start and end datetime."""
     start: datetime
-    end: datetime
\ No newline at end of file
+    end: datetime
+
+    @property
+    def duration(self) -> timedelta:
+        """Return the length of this slot."""
+        return self.end - self.start
+
+    def overlaps(self, other: "TimeSlot") -> bool:
+        """Return True if the two half-open slots share any time."""
+        return self.start < other.end and other.start < self.end
\ No newline at end of file
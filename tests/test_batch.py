@@ -0,0 +1,65 @@
+"""
+Tests for pawpal_batch
+"""
+
+import unittest
+from datetime import datetime, timedelta
+from pawpal_system import Task, Pet, Owner, Scheduler
+from pawpal_batch import BatchScheduler
+
+
+class TestBatchScheduler(unittest.TestCase):
+    """
+    The vectorized path agrees with the per-owner Scheduler.
+    """
+    def setUp(self):
+        self.owners = []
+        for owner_number in range(3):
+            owner = Owner(name=f"Owner {owner_number}")
+            for pet_number in range(2):
+                pet = Pet(name=f"Pet {pet_number}", species="dog", age=2)
+                owner.add_pet(pet)
+                for time, frequency in [("18:00", "daily"), ("07:00", "daily"),
+                                        ("09:30", "weekly"), ("07:00", "monthly")]:
+                    pet.add_task(Task(description="Task", time=time, frequency=frequency))
+            owner.pets[0].add_task(Task(description="Done", time="12:00", frequency="once",
+                                        completion_status=True))
+            self.owners.append(owner)
+        self.batch = BatchScheduler(self.owners)
+
+    def test_filters_match_scheduler(self):
+        """Frequency and status filters return the same tasks as Scheduler."""
+        scheduler = Scheduler(self.owners[1])
+        batch_weekly = [t for t in self.batch.get_tasks_by_frequency("weekly")
+                        if t.parent_pet.owner is self.owners[1]]
+        self.assertEqual(batch_weekly, scheduler.get_tasks_by_frequency("weekly"))
+        self.assertEqual(len(self.batch.filter_tasks(completion_status=True)), 3)
+        self.assertEqual(len(self.batch.filter_tasks(pet_name="Pet 1")), 12)
+        self.assertEqual(self.batch.get_tasks_by_frequency("hourly"), [])
+
+    def test_schedule_overdue_and_conflicts(self):
+        """Daily schedule, overdue scan and conflict counts are computed per owner."""
+        schedule = self.batch.generate_daily_schedule()
+        expected = Scheduler(self.owners[0]).generate_daily_schedule()
+        self.assertEqual(schedule["Owner 0"], expected)
+        overdue = self.batch.get_overdue_tasks(now=datetime(2024, 1, 1, 8, 0))
+        self.assertEqual(len(overdue), 12)
+        self.assertTrue(all(t.time == "07:00" for t in overdue))
+        self.assertEqual(self.batch.conflict_counts()["Owner 2"], {"07:00": 4, "09:30": 2, "18:00": 2})
+
+    def test_overdue_uses_due_dates(self):
+        """Next occurrences due tomorrow are not overdue; earlier dates come first."""
+        owner = self.owners[0]
+        now = datetime.now().replace(hour=12, minute=0)
+        rex = owner.pets[0]
+        rex.tasks[1].mark_complete()  # daily 07:00: the next one is due tomorrow
+        rex.add_task(Task(description="Late", time="20:00", frequency="once",
+                          due_date=now.date() - timedelta(days=1)))
+        batch = BatchScheduler([owner])
+        expected = Scheduler(owner).get_overdue_tasks(now=now)
+        self.assertEqual(batch.get_overdue_tasks(now=now), expected)
+        self.assertEqual(expected[0].description, "Late")
+        self.assertNotIn(rex.tasks[-2], expected)
+
+if __name__ == "__main__":
+    unittest.main()
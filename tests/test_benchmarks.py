@@ -0,0 +1,46 @@
+"""
+Tests for benchmarks.bench_pawpal
+"""
+
+import unittest
+from benchmarks.bench_pawpal import compare, make_fleet, run_benchmarks
+from benchmarks.load_service import run_load_test
+
+
+class TestBenchmarks(unittest.TestCase):
+    """
+    The synthetic fleet is reproducible and the harness reports every hot path.
+    """
+    def test_make_fleet_is_seeded(self):
+        """The same seed builds the same tasks."""
+        first = make_fleet(seed=3, owners=2, pets=3, tasks=4)
+        second = make_fleet(seed=3, owners=2, pets=3, tasks=4)
+        describe = lambda fleet: [
+            (t.description, t.time, t.frequency, t.completion_status)
+            for owner in fleet for t in owner.get_all_tasks()
+        ]
+        self.assertEqual(describe(first), describe(second))
+        self.assertEqual(len(first[1].get_all_tasks()), 12)
+
+    def test_run_and_compare(self):
+        """A small run covers the scheduler methods and compare flags slowdowns."""
+        report = run_benchmarks(pets=5, tasks=5, repeat=1, owners=2)
+        self.assertEqual(report["meta"]["owners"], 2)
+        for name in ("detect_conflicts", "filter_tasks", "generate_daily_schedule",
+                     "mark_complete_chain_200", "plan_day", "fleet_reports"):
+            self.assertIn(name, report["results"])
+        slower = {"results": {name: dict(stats, best_s=stats["best_s"] * 2 + 1)
+                              for name, stats in report["results"].items()}}
+        self.assertEqual(compare(report, report), [])
+        self.assertEqual(len(compare(report, slower)), len(report["results"]))
+
+    def test_service_load_test(self):
+        """The threaded load test runs every operation and leaves the indexes consistent."""
+        report = run_load_test(threads=4, pets=5, tasks=5, operations=100)
+        self.assertTrue(report["consistent"])
+        for name in ("snapshot", "add_task", "complete_task"):
+            self.assertGreater(report["counts"].get(name, 0), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
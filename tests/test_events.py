@@ -0,0 +1,91 @@
+"""
+Tests for pawpal_events
+"""
+
+import os
+import tempfile
+import unittest
+from datetime import date, datetime
+from pawpal_system import Task, Pet, Owner, Scheduler
+from pawpal_events import (
+    EventLog, OccurrenceCreated, PetAdded, PetUpdated, TaskAdded, TaskCompleted, TaskRemoved,
+    read_events, recover,
+)
+
+
+class TestEventLog(unittest.TestCase):
+    """
+    Mutations become domain events that can be replayed to rebuild the owner.
+    """
+    def setUp(self):
+        """An owner with one pet, logging into a temporary directory."""
+        self.directory = tempfile.mkdtemp()
+        self.owner = Owner(name="Events")
+        self.rex = Pet(name="Rex", species="Dog", age=3)
+        self.owner.add_pet(self.rex)
+        self.log = EventLog(self.owner, self.directory, segment_bytes=256)
+        self.received = []
+        self.log.subscribe(lambda seq, event: self.received.append(event))
+
+    def tearDown(self):
+        """Close the log."""
+        self.log.close()
+
+    def test_mutations_emit_domain_events(self):
+        """Adding, completing a recurring task and removing are classified correctly."""
+        tom = Pet(name="Tom", species="Cat", age=2)
+        self.owner.add_pet(tom)
+        walk = Task(description="Walk", time="07:00", frequency="daily", due_date=date(2024, 5, 1))
+        self.rex.add_task(walk)
+        summary = Scheduler(self.owner).complete_tasks([walk], now=datetime(2024, 5, 1, 9, 0))
+        self.rex.remove_task(walk)
+        kinds = [type(event) for event in self.received]
+        self.assertEqual(kinds, [PetAdded, TaskAdded, TaskCompleted, OccurrenceCreated, TaskRemoved])
+        self.assertEqual(self.received[3].source_id, walk.task_id)
+        self.assertEqual(self.received[3].task.task_id, summary.created[0].task_id)
+        logged = [event for _, _, event in read_events(self.directory)]
+        self.assertEqual(logged, self.received)
+
+    def test_recover_from_snapshot_and_tail(self):
+        """Recovery loads the latest checkpoint and replays the events after it."""
+        for hour in range(6, 12):
+            self.rex.add_task(Task(description=f"Task {hour}", time=f"{hour:02d}:00", frequency="once"))
+        self.log.checkpoint()
+        feed = Task(description="Feed", time="18:30", frequency="weekly", priority=2)
+        self.rex.add_task(feed)
+        Scheduler(self.owner).complete_tasks([feed], now=datetime(2024, 5, 1, 19, 0))
+        self.assertEqual(len([p for p in os.listdir(self.directory) if p.startswith("snapshot-")]), 1)
+
+        owner, last_seq = recover(self.directory)
+        self.assertEqual(last_seq, self.log.last_seq)
+        rebuilt = owner.get_pet_by_id(self.rex.pet_id)
+        self.assertEqual(
+            [(t.task_id, t.description, t.time, t.completion_status, t.due_date, t.priority)
+             for t in rebuilt.tasks],
+            [(t.task_id, t.description, t.time, t.completion_status, t.due_date, t.priority)
+             for t in self.rex.tasks],
+        )
+
+    def test_pet_edits_are_logged_and_recovered(self):
+        """Renames and age changes become PetUpdated events that replay on recovery."""
+        self.rex.name = "Max"
+        self.rex.age = 4.5
+        self.rex.species = "Wolf"
+        self.assertEqual([type(event) for event in self.received], [PetUpdated] * 3)
+        owner, _ = recover(self.directory)
+        pet = owner.get_pet_by_id(self.rex.pet_id)
+        self.assertEqual((pet.name, pet.age, pet.species), ("Max", 4.5, "Wolf"))
+        self.rex.age = -1
+        self.assertEqual(recover(self.directory)[0].get_pet("Max").age, -1)
+
+    def test_torn_tail_is_ignored(self):
+        """A partially written last record does not break replay."""
+        self.rex.add_task(Task(description="Walk", time="07:00", frequency="once"))
+        segment = sorted(p for p in os.listdir(self.directory) if p.startswith("events-"))[-1]
+        with open(os.path.join(self.directory, segment), 'ab') as handle:
+            handle.write(b'\x07\x00\x00')
+        self.assertEqual(len(list(read_events(self.directory))), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+"""
+Tests for pawpal_fleet
+"""
+
+import os
+import tempfile
+import unittest
+from datetime import date, datetime
+from pawpal_system import Task, Pet, Owner, Scheduler
+from pawpal_storage import SQLiteStore
+from pawpal_fleet import FleetScheduler, build_report
+
+
+def make_owner(number):
+    """Owner with two pets whose breakfasts collide."""
+    owner = Owner(name=f"Owner {number}")
+    for pet_name in ("Rex", "Tom"):
+        pet = Pet(name=pet_name, species="dog", age=3)
+        owner.add_pet(pet)
+        pet.add_task(Task(description="Breakfast", time="07:00", frequency="daily"))
+        pet.add_task(Task(description="Dinner", time="18:00", frequency="daily"))
+    return owner
+
+
+class TestFleetScheduler(unittest.TestCase):
+    """
+    Sharded runs produce the same reports as a serial loop.
+    """
+    NOW = datetime(2024, 1, 1, 12, 0)
+
+    def test_sharded_reports_match_serial(self):
+        """Every owner is reported once with the serial results."""
+        owners = [make_owner(number) for number in range(7)]
+        fleet = FleetScheduler(iter(owners), shard_size=3, max_workers=2)
+        reports = {report.owner: report for report in fleet.run(now=self.NOW)}
+        self.assertEqual(len(reports), 7)
+        self.assertEqual(reports["Owner 4"], build_report(owners[4], self.NOW))
+        self.assertEqual(reports["Owner 4"].overdue,
+                         [("Rex", "07:00", "Breakfast"), ("Tom", "07:00", "Breakfast")])
+
+    def test_report_matches_scheduler(self):
+        """The row kernel agrees with Scheduler, including invalid times and past due dates."""
+        owner = make_owner(0)
+        rex, tom = owner.pets
+        tom.add_tasks([
+            Task(description="Pills", time="07:00", frequency="daily"),
+            Task(description="Typo", time="25:00", frequency="daily", due_date=date(2023, 12, 30)),
+            Task(description="Bath", time="09:00", frequency="weekly", due_date=date(2023, 12, 30)),
+        ])
+        rex.tasks[1].mark_complete()
+        scheduler = Scheduler(owner)
+        report = build_report(owner, self.NOW)
+        self.assertEqual(report.daily_schedule, {
+            pet: [(task.time, task.description) for task in tasks]
+            for pet, tasks in scheduler.generate_daily_schedule().items()
+        })
+        self.assertEqual(report.conflicts, {
+            time: [[(task.parent_pet.name, task.description) for task in group] for group in groups]
+            for time, groups in scheduler.detect_conflicts().items()
+        })
+        self.assertEqual(report.overdue, [
+            (task.parent_pet.name, task.time, task.description)
+            for task in scheduler.get_overdue_tasks(now=self.NOW)
+        ])
+        fleet = FleetScheduler([owner], max_workers=1)
+        self.assertEqual(list(fleet.run(now=self.NOW)), [report])
+
+        # Tom's clashing tasks come first although Rex is the first pet
+        late = Owner(name="Late")
+        rex, tom = Pet(name="Rex", species="dog", age=3), Pet(name="Tom", species="cat", age=2)
+        late.add_pet(rex)
+        late.add_pet(tom)
+        tom.add_tasks([Task(description=d, time="07:00", frequency="daily") for d in "ab"])
+        rex.add_tasks([Task(description=d, time="07:00", frequency="daily") for d in "cd"])
+        expected = {
+            time: [[(task.parent_pet.name, task.description) for task in group] for group in groups]
+            for time, groups in Scheduler(late).detect_conflicts().items()
+        }
+        self.assertEqual([group[0][0] for group in expected["07:00"]], ["Tom", "Rex", "Tom"])
+        self.assertEqual(build_report(late, self.NOW).conflicts, expected)
+
+    def test_reports_from_store(self):
+        """Workers can load their owners from a SQLite store."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "fleet.db")
+            store = SQLiteStore(path)
+            for number in range(3):
+                store.save(make_owner(number))
+            store.close()
+            fleet = FleetScheduler.from_store(path, ["Owner 0", "Owner 2"], shard_size=1,
+                                              max_workers=2)
+            reports = sorted(fleet.run(now=self.NOW))
+            self.assertEqual([report.owner for report in reports], ["Owner 0", "Owner 2"])
+            self.assertEqual(list(reports[0].conflicts), ["07:00", "18:00"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+"""
+Tests for pawpal_history
+"""
+
+import unittest
+from datetime import date, datetime
+from pawpal_system import Task, Pet, Owner, Scheduler
+from pawpal_history import SnapshotHistory, diff
+
+
+class TestSnapshotHistory(unittest.TestCase):
+    """
+    Snapshots share unchanged pets, diff between versions and undo restores state.
+    """
+    def setUp(self):
+        """An owner with two pets and a recording history."""
+        self.owner = Owner(name="History")
+        self.rex = Pet(name="Rex", species="Dog", age=3)
+        self.tom = Pet(name="Tom", species="Cat", age=2)
+        self.owner.add_pet(self.rex)
+        self.owner.add_pet(self.tom)
+        self.walk = Task(description="Walk", time="07:00", frequency="daily",
+                         due_date=date(2024, 5, 1))
+        self.rex.add_task(self.walk)
+        self.history = SnapshotHistory(self.owner)
+
+    def test_structural_sharing_and_diff(self):
+        """Only the touched pet is re-copied, and diff reports just that change."""
+        before = self.history.current
+        self.tom.add_task(Task(description="Feed", time="08:00", frequency="once"))
+        after = self.history.commit()
+        self.assertIs(after.pets[0], before.pets[0])
+        self.assertIsNot(after.pets[1], before.pets[1])
+        self.assertEqual([(c.kind, c.after.description) for c in diff(before, after)],
+                         [("task_added", "Feed")])
+        self.assertIs(self.history.current, after)
+
+    def test_undo_reverts_completion_and_removal(self):
+        """Undo puts back completion status, drops the new occurrence and restores pets."""
+        Scheduler(self.owner).complete_tasks([self.walk], now=datetime(2024, 5, 1, 9, 0))
+        self.history.commit()
+        self.owner.remove_pet(self.tom)
+        self.history.commit()
+
+        restored = self.history.undo()
+        self.assertEqual([pet.name for pet in restored.pets], ["Rex", "Tom"])
+        self.assertIsNotNone(self.owner.get_pet("Tom"))
+        self.history.undo()
+        self.assertFalse(self.walk.completion_status)
+        self.assertEqual(self.rex.tasks, (self.walk,))
+        self.assertEqual(self.owner.task_index.lookup("status", False), [self.walk])
+        self.assertEqual(self.history.current.pets[0].version, self.rex.version)
+        with self.assertRaises(ValueError):
+            self.history.undo()
+
+
+if __name__ == "__main__":
+    unittest.main()
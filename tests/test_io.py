@@ -0,0 +1,75 @@
+"""
+Tests for pawpal_io
+"""
+
+import io
+import unittest
+from datetime import date
+from pawpal_system import Task, Pet, Owner, Scheduler
+from pawpal_io import export_csv, export_jsonl, import_csv, import_jsonl
+
+
+class TestBulkIO(unittest.TestCase):
+    """
+    Round trips through the CSV and JSONL formats.
+    """
+    def _owner(self):
+        """Build an owner with one busy pet and one pet without tasks."""
+        owner = Owner(name="Clinic")
+        rex = Pet(name="Rex", species="dog", age=7)
+        owner.add_pet(rex)
+        owner.add_pet(Pet(name="Nibbles", species="other", age=1))
+        rex.add_task(Task(description="Walk", time="07:30", frequency="daily", duration=45,
+                          priority=2, window=("07:00", "09:00")))
+        rex.add_task(Task(description="Meds, with food", time="08:00", frequency="weekly",
+                          due_date=date(2024, 5, 6)))
+        rex.get_all_tasks()[1].completion_status = True
+        return owner
+
+    def _check(self, owners):
+        """Verify a re-imported owner matches _owner."""
+        owner = owners["Clinic"]
+        self.assertEqual([pet.name for pet in owner.pets], ["Rex", "Nibbles"])
+        walk, meds = owner.pets[0].tasks
+        self.assertEqual((walk.time, walk.duration, walk.frequency), ("07:30", 45, "daily"))
+        self.assertEqual((walk.priority, walk.window, meds.priority, meds.window),
+                         (2, (420, 540), 0, None))
+        self.assertEqual((meds.description, meds.due_date), ("Meds, with food", date(2024, 5, 6)))
+        self.assertTrue(meds.completion_status)
+        self.assertEqual(Scheduler(owner).get_tasks_by_frequency("daily"), [walk])
+
+    def test_csv_round_trip(self):
+        """Export then import CSV in small chunks."""
+        buffer = io.StringIO()
+        self.assertEqual(export_csv([self._owner()], buffer), 3)
+        buffer.seek(0)
+        self._check(import_csv(buffer, chunk_size=1))
+
+    def test_jsonl_round_trip_and_validation(self):
+        """JSONL round trips; bad times are reported with their row number."""
+        buffer = io.StringIO()
+        export_jsonl([self._owner()], buffer)
+        self._check(import_jsonl(io.StringIO(buffer.getvalue())))
+        broken = buffer.getvalue().replace('"08:00"', '"8am"')
+        with self.assertRaisesRegex(ValueError, "Row 2"):
+            import_jsonl(io.StringIO(broken), chunk_size=2)
+
+    def test_every_column_is_validated_by_row(self):
+        """Bad dates, durations, ages and flags name their row before anything loads."""
+        buffer = io.StringIO()
+        export_csv([self._owner()], buffer)
+        good = buffer.getvalue()
+        for old, new, message in [
+            ("2024-05-06", "2024-13-06", "Row 2: invalid due date"),
+            (",45,", ",soon,", "Row 1: invalid duration"),
+            (",7,", ",seven,", "Row 1: invalid age"),
+            ("Nibbles,other,1", "Nibbles,other,-1", "Row 3: invalid age"),
+            (",1,,2024-05-06", ",yes,,2024-05-06", "Row 2: invalid completed flag"),
+        ]:
+            self.assertIn(old, good)
+            with self.assertRaisesRegex(ValueError, message):
+                import_csv(io.StringIO(good.replace(old, new)), chunk_size=2)
+
+
+if __name__ == "__main__":
+    unittest.main()
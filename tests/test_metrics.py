@@ -0,0 +1,64 @@
+"""
+Tests for pawpal_metrics
+"""
+
+import json
+import unittest
+from pawpal_system import Task, Pet, Owner, Scheduler
+from pawpal_metrics import Instrumentation, profile
+
+
+class TestInstrumentation(unittest.TestCase):
+    """
+    Instrumentation records calls only while enabled.
+    """
+    def test_records_and_exports(self):
+        """Calls, tasks returned, cache hits and histograms show up in both export formats."""
+        original = Scheduler.detect_conflicts
+        metrics = Instrumentation()
+        owner = Owner(name="Metrics")
+        pet = Pet(name="Rex", species="dog", age=3)
+        with metrics:
+            owner.add_pet(pet)
+            pet.add_task(Task(description="Walk", time="07:00", frequency="daily"))
+            pet.add_task(Task(description="Feed", time="07:00", frequency="daily"))
+            scheduler = Scheduler(owner)
+            scheduler.filter_tasks(completion_status=False)
+            scheduler.detect_conflicts()
+            scheduler.detect_conflicts()  # memoized
+        scheduler.detect_conflicts()  # disabled again: not recorded
+        self.assertIs(Scheduler.detect_conflicts, original)
+
+        snapshot = metrics.snapshot()
+        self.assertEqual(snapshot["Pet.add_task"]["calls"], 2)
+        self.assertEqual(snapshot["Scheduler.filter_tasks"]["tasks_returned"], 2)
+        self.assertEqual(snapshot["Scheduler.filter_tasks"]["cache_hits"], 0)
+        self.assertEqual(snapshot["Scheduler.detect_conflicts"]["calls"], 2)
+        self.assertEqual(snapshot["Scheduler.detect_conflicts"]["cache_hits"], 1)
+        self.assertEqual(json.loads(metrics.to_json()), snapshot)
+        text = metrics.prometheus()
+        self.assertIn('pawpal_calls_total{method="Pet.add_task"} 2', text)
+        self.assertIn('pawpal_latency_seconds_bucket{method="Owner.add_pet",le="+Inf"} 1', text)
+        # one block per family, each opened by its TYPE line
+        families = []
+        for line in text.splitlines():
+            if line.startswith("# TYPE "):
+                families.append(line.split()[2])
+            else:
+                self.assertTrue(line.startswith(families[-1]), line)
+        self.assertEqual(
+            families,
+            ["pawpal_calls_total", "pawpal_tasks_returned_total", "pawpal_cache_hits_total",
+             "pawpal_latency_seconds"]
+        )
+
+    def test_profile_single_call(self):
+        """profile returns the call's result plus a cProfile report."""
+        owner = Owner(name="Profiled")
+        result, report = profile(Scheduler(owner).generate_daily_schedule)
+        self.assertEqual(result, {})
+        self.assertIn("generate_daily_schedule", report)
+
+
+if __name__ == "__main__":
+    unittest.main()
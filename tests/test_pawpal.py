@@ -2,8 +2,15 @@
 Docstring for tests.test_pawpal
 """
 
+import os
+import tempfile
+import itertools
 import unittest
-from pawpal_system import Task, Pet, Owner, Scheduler
+from datetime import date, datetime, timedelta
+from pawpal_system import (
+    Task, Pet, Owner, Scheduler, Frequency, TaskColumns,
+    RetentionPolicy, FileTaskArchive,
+)
 
 
 class TestPawPal(unittest.TestCase):
@@ -154,5 +161,364 @@ class TestPawPal(unittest.TestCase):
         # Should not crash, and task should be present
         self.assertIn(task, scheduler.get_tasks_by_frequency("yearly"))
 
+    def test_task_index_tracks_mutations(self):
+        """Owner index follows add, complete, reset and remove."""
+        owner = Owner(name="Robin")
+        pet = Pet(name="Pip", species="Bird", age=1)
+        early = Task(description="Seed", time="07:00", frequency="weekly")
+        pet.add_task(early)
+        owner.add_pet(pet)
+        late = Task(description="Water", time="19:00", frequency="weekly")
+        pet.add_task(late)
+        scheduler = Scheduler(owner)
+        self.assertEqual(scheduler.get_tasks_by_frequency("weekly"), [early, late])
+
+        late.mark_complete()
+        self.assertIn(late, scheduler.filter_tasks(completion_status=True, pet_name="Pip"))
+        self.assertEqual(len(scheduler.filter_tasks(completion_status=False)), 2)
+
+        late.reset_status()
+        pet.remove_task(late)
+        self.assertNotIn(late, scheduler.get_tasks_by_frequency("weekly"))
+        self.assertNotIn(late, owner.task_index)
+
+        owner.remove_pet(pet)
+        self.assertEqual(len(owner.task_index), 0)
+
+    def test_tasks_between_and_overdue_use_time_index(self):
+        """Range and overdue queries return pending tasks in time order."""
+        owner = Owner(name="Casey")
+        pet = Pet(name="Rex", species="Dog", age=6)
+        owner.add_pet(pet)
+        for time in ["12:00", "06:30", "09:15", "bad"]:
+            pet.add_task(Task(description=f"At {time}", time=time, frequency="once"))
+        scheduler = Scheduler(owner)
+        self.assertEqual(
+            [t.time for t in scheduler.tasks_between("06:00", "12:00")],
+            ["06:30", "09:15"],
+        )
+        pet.get_all_tasks()[2].mark_complete()
+        overdue = scheduler.get_overdue_tasks(now=datetime(2024, 1, 1, 12, 1))
+        self.assertEqual([t.time for t in overdue], ["06:30", "12:00"])
+        with self.assertRaises(ValueError):
+            scheduler.tasks_between("noon", "13:00")
+
+    def test_conflict_engine_change_feed(self):
+        """Conflicts appear and resolve incrementally as tasks change."""
+        owner = Owner(name="Drew")
+        cat = Pet(name="Tom", species="Cat", age=2)
+        dog = Pet(name="Spike", species="Dog", age=4)
+        owner.add_pet(cat)
+        owner.add_pet(dog)
+        scheduler = Scheduler(owner)
+        feed = Task(description="Feed", time="08:00", frequency="once")
+        walk = Task(description="Walk", time="08:00", frequency="once")
+        cat.add_task(feed)
+        self.assertEqual(scheduler.detect_conflicts(), {})
+        dog.add_task(walk)
+        self.assertEqual(scheduler.detect_conflicts(), {"08:00": [[feed, walk]]})
+        self.assertEqual(
+            [(c.status, c.time, c.pet) for c in scheduler.conflict_changes()],
+            [("added", "08:00", None)],
+        )
+        walk.mark_complete()
+        self.assertEqual(scheduler.detect_conflicts(), {})
+        self.assertEqual(
+            [c.status for c in scheduler.conflict_changes()], ["resolved"]
+        )
+
+    def test_overlap_detection_with_durations(self):
+        """A 45-minute walk at 07:30 overlaps a feeding at 08:00."""
+        owner = Owner(name="Lee")
+        dog = Pet(name="Scout", species="Dog", age=3)
+        cat = Pet(name="Nala", species="Cat", age=5)
+        owner.add_pet(dog)
+        owner.add_pet(cat)
+        walk = Task(description="Walk", time="07:30", frequency="daily", duration=45)
+        feed = Task(description="Feed", time="08:00", frequency="daily", duration=10)
+        brush = Task(description="Brush", time="08:15", frequency="daily", duration=5)
+        dog.add_task(walk)
+        cat.add_task(feed)
+        dog.add_task(brush)
+        scheduler = Scheduler(owner)
+        self.assertEqual(scheduler.detect_overlaps(), [(walk, feed)])
+        self.assertEqual(scheduler.detect_overlaps(per_pet=True), [])
+        self.assertTrue(walk.time_slot().overlaps(feed.time_slot()))
+        self.assertFalse(walk.time_slot().overlaps(brush.time_slot()))
+
+    def test_compact_task_representation(self):
+        """Tasks use slots and shared minute/frequency values but keep the string API."""
+        task = Task(description="Feed", time="08:05", frequency="daily")
+        self.assertFalse(hasattr(task, "__dict__"))
+        self.assertEqual(task.time, "08:05")
+        self.assertEqual(task.minute, 485)
+        self.assertIs(task.frequency, Frequency.DAILY)
+        self.assertEqual(task.frequency, "daily")
+        self.assertEqual(f"{task.frequency}", "daily")
+        odd = Task(description="Odd", time="late", frequency="yearly")
+        self.assertEqual((odd.time, odd.minute, odd.frequency), ("late", None, "yearly"))
+
+        pet = Pet(name="Col", species="Dog", age=1)
+        pet.add_task(task)
+        pet.add_task(odd)
+        columns = TaskColumns()
+        columns.extend(pet.get_all_tasks())
+        restored = list(columns)
+        self.assertEqual([t.time for t in restored], ["08:05", "late"])
+        self.assertEqual([t.frequency for t in restored], ["daily", "yearly"])
+        self.assertIs(restored[0].parent_pet, pet)
+
+    def test_retention_archives_completed_occurrences(self):
+        """keep_last bounds the live list; history still sees archived tasks."""
+        owner = Owner(name="Kai", retention=RetentionPolicy(keep_last=1))
+        pet = Pet(name="Olive", species="Dog", age=2)
+        owner.add_pet(pet)
+        pet.add_task(Task(description="Feed", time="07:00", frequency="daily"))
+        for _ in range(3):
+            pet.get_pending_tasks()[0].mark_complete()
+        self.assertEqual(len(pet.get_all_tasks()), 2)
+        self.assertEqual(len(owner.archive), 2)
+        history = Scheduler(owner).completion_history(pet_name="Olive")
+        self.assertEqual(len(history), 3)
+        self.assertTrue(all(h.description == "Feed" for h in history))
+
+    def test_keep_days_with_file_archive(self):
+        """Old completions move to an on-disk archive that can be re-read."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "history.bin")
+            archive = FileTaskArchive(path)
+            owner = Owner(name="Ash", retention=RetentionPolicy(keep_days=7), archive=archive)
+            pet = Pet(name="Bean", species="Cat", age=9)
+            owner.add_pet(pet)
+            old = Task(description="Vet", time="10:00", frequency="once")
+            pet.add_task(old)
+            old.mark_complete()
+            self.assertEqual(len(pet.get_all_tasks()), 1)
+            archived = owner.apply_retention(now=datetime.now() + timedelta(days=8))
+            self.assertEqual(archived, 1)
+            self.assertEqual(pet.get_all_tasks(), [])
+            archive.close()
+            reopened = FileTaskArchive(path)
+            records = list(reopened.history(pet_name="Bean"))
+            reopened.close()
+            self.assertEqual([(r.description, r.time) for r in records], [("Vet", "10:00")])
+
+    def test_monthly_recurrence_keeps_calendar_dates(self):
+        """Monthly tasks move by calendar month, clamping to month end."""
+        pet = Pet(name="Moon", species="Cat", age=4)
+        task = Task(description="Flea meds", time="09:00", frequency="monthly",
+                    due_date=date(2024, 1, 31))
+        pet.add_task(task)
+        task.mark_complete()
+        self.assertEqual(pet.get_all_tasks()[-1].due_date, date(2024, 2, 29))
+        self.assertEqual(
+            list(task.occurrence_dates(date(2024, 1, 1), date(2024, 4, 30))),
+            [date(2024, 1, 31), date(2024, 2, 29), date(2024, 3, 31), date(2024, 4, 30)],
+        )
+
+    def test_occurrences_stream_lazily_in_order(self):
+        """Scheduler.occurrences merges daily and weekly rules by date and time."""
+        owner = Owner(name="Vic")
+        pet = Pet(name="Dot", species="Dog", age=2)
+        owner.add_pet(pet)
+        start = date(2024, 3, 4)
+        pet.add_task(Task(description="Walk", time="18:00", frequency="daily", due_date=start))
+        pet.add_task(Task(description="Bath", time="08:00", frequency="weekly", due_date=start))
+        scheduler = Scheduler(owner)
+        first = list(itertools.islice(
+            scheduler.occurrences(start, date(2100, 1, 1)), 3
+        ))
+        self.assertEqual(
+            [(o.date.day, o.task.description) for o in first],
+            [(4, "Bath"), (4, "Walk"), (5, "Walk")],
+        )
+        week = list(scheduler.occurrences(date(2024, 3, 5), date(2024, 3, 11)))
+        self.assertEqual(sum(o.task.description == "Bath" for o in week), 1)
+        self.assertEqual(week[-2:][0].date, date(2024, 3, 11))
+
+    def test_scheduler_cache_invalidated_by_version(self):
+        """Cached queries are reused until the relevant owner or pet changes."""
+        owner = Owner(name="Quinn")
+        rex, tom = Pet(name="Rex", species="Dog", age=3), Pet(name="Tom", species="Cat", age=2)
+        owner.add_pet(rex)
+        owner.add_pet(tom)
+        rex.add_task(Task(description="Walk", time="07:00", frequency="daily"))
+        scheduler = Scheduler(owner, cache_size=2)
+        first = scheduler.filter_tasks(pet_name="Rex")
+        first.clear()  # callers get copies
+        self.assertEqual(len(scheduler.filter_tasks(pet_name="Rex")), 1)
+        self.assertEqual(scheduler.cache_hits, 1)
+
+        tom.add_task(Task(description="Feed", time="08:00", frequency="daily"))
+        scheduler.filter_tasks(pet_name="Rex")
+        self.assertEqual(scheduler.cache_hits, 2)  # Tom's change does not touch Rex
+        rex.get_all_tasks()[0].mark_complete()
+        self.assertEqual(scheduler.pet_task_counts(), {"Rex": (1, 1), "Tom": (1, 0)})
+        self.assertEqual(len(scheduler.filter_tasks(completion_status=False, pet_name="Rex")), 1)
+        self.assertEqual(scheduler.cache_hits, 2)
+        self.assertLessEqual(len(scheduler._cache), 2)
+
+    def test_task_page_cursor_walks_grouped_sorted_tasks(self):
+        """Pages follow pet order then time, and cursors survive edits to earlier pages."""
+        owner = Owner(name="Paige")
+        rex, tom = Pet(name="Rex", species="Dog", age=3), Pet(name="Tom", species="Cat", age=2)
+        owner.add_pet(rex)
+        owner.add_pet(tom)
+        for time in ("09:00", "07:00", "08:00"):
+            rex.add_task(Task(description=f"Rex {time}", time=time, frequency="daily"))
+        tom.add_task(Task(description="Tom 06:00", time="06:00", frequency="daily"))
+        scheduler = Scheduler(owner)
+
+        first = scheduler.task_page(limit=2)
+        self.assertEqual([t.time for t in first.tasks], ["07:00", "08:00"])
+        rex.add_task(Task(description="Early", time="05:00", frequency="once"))
+        second = scheduler.task_page(limit=2, cursor=first.next_cursor)
+        self.assertEqual([(pet.name, [t.time for t in tasks]) for pet, tasks in second.groups],
+                         [("Rex", ["09:00"]), ("Tom", ["06:00"])])
+        self.assertIsNone(second.next_cursor)
+        pending = scheduler.task_page(limit=10, completion_status=False, pet_name="Tom")
+        self.assertEqual(len(pending.tasks), 1)
+        with self.assertRaises(ValueError):
+            scheduler.task_page(limit=0)
+
+        # per-pet page lists are bounded like the query cache
+        small = Scheduler(owner, cache_size=1)
+        small.task_page(limit=10)
+        owner.remove_pet(rex)
+        small.task_page(limit=10)
+        self.assertEqual(list(small._page_lists), [(tom.pet_id, None)])
+
+    def test_complete_tasks_in_bulk(self):
+        """Bulk completion shares one clock reading and reports created occurrences."""
+        owner = Owner(name="Bulk", retention=RetentionPolicy(keep_last=1))
+        pet = Pet(name="Rex", species="Dog", age=3)
+        owner.add_pet(pet)
+        walk = Task(description="Walk", time="07:00", frequency="daily", due_date=date(2024, 5, 1))
+        vet = Task(description="Vet", time="10:00", frequency="once")
+        pet.add_tasks([walk, vet])
+        scheduler = Scheduler(owner)
+        version = owner.version
+        now = datetime(2024, 5, 1, 18, 0)
+
+        summary = scheduler.complete_tasks([walk, vet, walk], now=now)
+        self.assertEqual(summary.completed, [walk, vet])
+        self.assertEqual(summary.skipped, [walk])
+        self.assertEqual([t.due_date for t in summary.created], [date(2024, 5, 2)])
+        self.assertEqual(summary.archived, 1)  # keep_last=1 archives the older completion
+        self.assertEqual({t.completed_at for t in summary.completed}, {now})
+        self.assertEqual(scheduler.filter_tasks(completion_status=False), summary.created)
+        self.assertEqual(owner.version, version + 3)  # completions, creations, archive
+
+    def test_pet_and_task_registries(self):
+        """Pets are found by name or id, names stay unique, and tasks are keyed by id."""
+        owner = Owner(name="Reg")
+        rex = Pet(name="Rex", species="Dog", age=3)
+        owner.add_pet(rex)
+        with self.assertRaises(ValueError):
+            owner.add_pet(Pet(name="Rex", species="Cat", age=1))
+        self.assertIs(owner.get_pet("Rex"), rex)
+        self.assertIs(owner.get_pet_by_id(rex.pet_id), rex)
+
+        walk = Task(description="Walk", time="07:00", frequency="daily")
+        rex.add_task(walk)
+        self.assertIs(rex.get_task(walk.task_id), walk)
+        with self.assertRaises(ValueError):
+            rex.add_task(walk)
+        scheduler = Scheduler(owner)
+        self.assertEqual(scheduler.get_tasks_for_pet("Rex"), [walk])
+
+        rex.name = "Max"
+        self.assertIsNone(owner.get_pet("Rex"))
+        self.assertEqual(scheduler.filter_tasks(pet_name="Max"), [walk])
+        rex.remove_task(walk)
+        self.assertIsNone(rex.get_task(walk.task_id))
+        owner.remove_pet(rex)
+        self.assertIsNone(owner.get_pet("Max"))
+        with self.assertRaises(ValueError):
+            owner.remove_pet(rex)
+
+    def test_task_views_are_shared_until_membership_changes(self):
+        """tasks views are reused across reads and stay stable while the pet changes."""
+        owner = Owner(name="Views")
+        pet = Pet(name="Rex", species="Dog", age=3)
+        owner.add_pet(pet)
+        walk = Task(description="Walk", time="07:00", frequency="daily")
+        feed = Task(description="Feed", time="08:00", frequency="weekly")
+        pet.add_tasks([walk, feed])
+        view = owner.tasks
+        self.assertIs(owner.tasks, view)
+        walk.mark_complete()  # adds the next occurrence while we hold the old view
+        self.assertEqual(view, (walk, feed))
+        self.assertEqual(len(owner.tasks), 3)
+        self.assertIs(pet.tasks, pet.tasks)
+
+        self.assertEqual(list(owner.iter_tasks(status=True)), [walk])
+        self.assertEqual(list(owner.iter_tasks(frequency="weekly")), [feed])
+        self.assertEqual(len(list(owner.iter_tasks(status=False, pet=pet))), 2)
+        self.assertEqual(list(owner.iter_tasks(status=False, frequency="weekly", pet=pet)), [feed])
+
+        # bucket views are shared tuples, so completing tasks while iterating is safe
+        pending = owner.iter_tasks(status=False)
+        first = next(pending)
+        first.mark_complete()
+        self.assertEqual(len(list(pending)), 1)  # the rest of the view taken at the start
+        self.assertIs(owner.task_index.view("status", True), owner.task_index.view("status", True))
+
+    def test_schedule_for_range_and_dated_overdue(self):
+        """Day buckets expand every frequency; overdue looks at due dates, not just times."""
+        owner = Owner(name="Cal")
+        pet = Pet(name="Rex", species="Dog", age=3)
+        owner.add_pet(pet)
+        start = date(2024, 3, 4)  # a Monday
+        pet.add_tasks([
+            Task(description="Walk", time="09:00", frequency="daily", due_date=date(2024, 3, 1)),
+            Task(description="Bath", time="08:00", frequency="weekly", due_date=date(2024, 2, 28)),
+            Task(description="Pills", time="07:00", frequency="monthly", due_date=date(2024, 2, 5)),
+            Task(description="Vet", time="10:00", frequency="once", due_date=date(2024, 3, 10)),
+        ])
+        scheduler = Scheduler(owner)
+        week = scheduler.week_view(date(2024, 3, 7))
+        self.assertEqual(list(week), [start + timedelta(days=n) for n in range(7)])
+        self.assertEqual([t.description for t in week[date(2024, 3, 5)]], ["Pills", "Walk"])
+        self.assertEqual([t.description for t in week[date(2024, 3, 6)]], ["Bath", "Walk"])
+        self.assertEqual([t.description for t in week[date(2024, 3, 10)]], ["Walk", "Vet"])
+        self.assertEqual(len(scheduler.month_view(2024, 2)), 29)
+        with self.assertRaises(ValueError):
+            scheduler.schedule_for_range(start, date(2024, 3, 1))
+
+        overdue = scheduler.get_overdue_tasks(now=datetime(2024, 3, 3, 8, 30))
+        self.assertEqual([t.description for t in overdue], ["Pills", "Bath", "Walk"])
+
+    def test_task_stats_counters_and_completion_window(self):
+        """Counters follow adds, completions, resets and removals; the window rolls."""
+        owner = Owner(name="Stats")
+        rex = Pet(name="Rex", species="Dog", age=3)
+        tom = Pet(name="Tom", species="Cat", age=2)
+        owner.add_pet(rex)
+        owner.add_pet(tom)
+        walk = Task(description="Walk", time="07:00", frequency="daily")
+        vet = Task(description="Vet", time="10:00", frequency="once")
+        rex.add_tasks([walk, vet])
+        tom.add_task(Task(description="Brush", time="08:00", frequency="weekly"))
+        scheduler = Scheduler(owner)
+        stats = scheduler.stats()
+        self.assertEqual((stats.total, stats.pending, stats.completed), (3, 3, 0))
+
+        scheduler.complete_tasks([walk, vet], now=datetime(2024, 5, 1, 9, 0))
+        self.assertEqual((stats.total, stats.pending, stats.completed), (4, 2, 2))
+        self.assertEqual(stats.pet_counts(rex), (1, 2))
+        self.assertEqual(stats.count(frequency="daily"), 2)
+        self.assertEqual(stats.count(status=True, frequency="once", pet=rex), 1)
+        self.assertEqual(scheduler.pet_task_counts(), {"Rex": (1, 2), "Tom": (1, 0)})
+        self.assertEqual(stats.recent_completions(rex, now=datetime(2024, 5, 3)), 2)
+
+        vet.reset_status()
+        rex.remove_task(walk)
+        self.assertEqual(stats.pet_counts(rex), (2, 0))
+        self.assertEqual(stats.count(frequency="daily", status=True), 0)
+        self.assertEqual(stats.recent_completions(rex, now=datetime(2024, 5, 3)), 1)
+        self.assertEqual(stats.completion_rate(rex, now=datetime(2024, 5, 20)), 0.0)
+        self.assertEqual(len(stats), len(owner.tasks))
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,97 @@
+"""
+Tests for pawpal_planner
+"""
+
+import random
+import time
+import unittest
+from datetime import date, datetime
+from pawpal_system import Task, Pet, Owner, Scheduler, TimeSlot
+from pawpal_planner import DailyPlanner
+
+
+class TestDailyPlanner(unittest.TestCase):
+    """
+    Planner respects availability, windows and priorities.
+    """
+    DAY = date(2024, 4, 2)
+
+    def _owner(self, *blocks):
+        """Owner available in the given ('HH:MM', 'HH:MM') blocks on DAY."""
+        slots = [
+            TimeSlot(datetime.combine(self.DAY, datetime.strptime(start, "%H:%M").time()),
+                     datetime.combine(self.DAY, datetime.strptime(end, "%H:%M").time()))
+            for start, end in blocks
+        ]
+        owner = Owner(name="Planner", availability=slots)
+        owner.add_pet(Pet(name="Rex", species="dog", age=4))
+        return owner
+
+    def test_conflicting_tasks_are_separated(self):
+        """The higher-priority feed keeps its time; the walk moves earlier."""
+        owner = self._owner(("07:00", "09:00"))
+        pet = owner.pets[0]
+        walk = Task(description="Walk", time="07:30", frequency="daily", duration=45,
+                    due_date=self.DAY)
+        feed = Task(description="Feed", time="08:00", frequency="daily", duration=10,
+                    due_date=self.DAY, priority=2)
+        pet.add_task(walk)
+        pet.add_task(feed)
+        plan = Scheduler(owner).plan_day(day=self.DAY)
+        self.assertEqual([(p.task.description, p.start) for p in plan.assignments],
+                         [("Walk", "07:15"), ("Feed", "08:00")])
+        self.assertEqual(plan.unscheduled, [])
+        self.assertEqual(plan.total_lateness, 0)
+
+    def test_window_and_unschedulable(self):
+        """Windows bound the start; tasks that cannot fit are reported."""
+        owner = self._owner(("09:00", "10:00"))
+        pet = owner.pets[0]
+        pet.add_task(Task(description="Meds", time="09:00", frequency="once", duration=20,
+                          due_date=self.DAY, window=("09:30", "10:00")))
+        pet.add_task(Task(description="Groom", time="09:00", frequency="once", duration=90,
+                          due_date=self.DAY))
+        plan = DailyPlanner(owner).plan(day=self.DAY, refine=True)
+        self.assertEqual([(p.task.description, p.start, p.delay) for p in plan.assignments],
+                         [("Meds", "09:30", 30)])
+        self.assertEqual([t.description for t in plan.unscheduled], ["Groom"])
+        with self.assertRaises(ValueError):
+            Task(description="Bad", time="09:00", frequency="once", window=("10:00", "09:00"))
+
+    def test_short_window_and_availability_on_any_day(self):
+        """A task longer than its window is unscheduled; availability repeats every day."""
+        owner = self._owner(("07:00", "09:00"))
+        pet = owner.pets[0]
+        other_day = date(2024, 4, 9)
+        pet.add_task(Task(description="Brush", time="08:00", frequency="once", duration=15,
+                          due_date=other_day, window=("08:00", "08:10")))
+        pet.add_task(Task(description="Feed", time="08:00", frequency="once", duration=10,
+                          due_date=other_day))
+        plan = DailyPlanner(owner).plan(day=other_day)
+        self.assertEqual([(p.task.description, p.start) for p in plan.assignments],
+                         [("Feed", "08:00")])
+        self.assertEqual([t.description for t in plan.unscheduled], ["Brush"])
+        self.assertEqual(Owner(name="Pairs", availability=[("07:00", "09:00")]).availability,
+                         owner.availability)
+
+    def test_two_hundred_tasks_plan_quickly(self):
+        """A 200-task day is planned well under 100 ms."""
+        owner = self._owner(("06:00", "12:00"), ("13:00", "22:00"))
+        rng = random.Random(7)
+        for number in range(200):
+            owner.pets[0].add_task(Task(
+                description=f"Task {number}", time=f"{rng.randrange(6, 22):02d}:{rng.randrange(60):02d}",
+                frequency="daily", duration=rng.choice([2, 3, 5]), due_date=self.DAY,
+                priority=rng.randrange(3),
+            ))
+        started = time.perf_counter()
+        plan = DailyPlanner(owner).plan(day=self.DAY, refine=True, time_limit=0.03)
+        elapsed = time.perf_counter() - started
+        self.assertLess(elapsed, 0.1)
+        self.assertEqual(len(plan.assignments) + len(plan.unscheduled), 200)
+        slots = [p.slot for p in plan.assignments]
+        self.assertTrue(all(a.end <= b.start for a, b in zip(slots, slots[1:])))
+
+
+if __name__ == "__main__":
+    unittest.main()
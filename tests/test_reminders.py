@@ -0,0 +1,69 @@
+"""
+Tests for pawpal_reminders
+"""
+
+import asyncio
+import unittest
+from datetime import date, datetime
+from pawpal_system import Task, Pet, Owner
+from pawpal_reminders import ListSink, ReminderDispatcher, ReminderSink
+
+
+class TestReminderDispatcher(unittest.TestCase):
+    """
+    Reminders fire from the heap without polling.
+    """
+    NOW = datetime(2024, 6, 1, 12, 0)
+
+    def _owner(self, name):
+        """Owner with one pet."""
+        owner = Owner(name=name)
+        owner.add_pet(Pet(name="Rex", species="dog", age=3))
+        return owner
+
+    def test_due_reminders_fire_and_recurrences_rearm(self):
+        """Past-due tasks fire in time order; completing one arms the next occurrence."""
+        sink = ListSink()
+        dispatcher = ReminderDispatcher([sink], clock=lambda: self.NOW)
+        home, clinic = self._owner("Home"), self._owner("Clinic")
+        today = self.NOW.date()
+        home.pets[0].add_task(Task(description="Meds", time="09:00", frequency="once",
+                                   due_date=today))
+        clinic.pets[0].add_task(Task(description="Walk", time="08:00", frequency="once",
+                                     due_date=today))
+        later = Task(description="Dinner", time="18:00", frequency="daily", due_date=today)
+        home.pets[0].add_task(later)
+        dispatcher.watch(home)
+        dispatcher.watch(clinic)
+
+        async def scenario():
+            runner = asyncio.create_task(dispatcher.run())
+            while len(sink.reminders) < 2:
+                await asyncio.sleep(0)
+            # added while run() is sleeping until 18:00: must wake it up
+            clinic.pets[0].add_task(Task(description="Late", time="10:00", frequency="once",
+                                         due_date=today))
+            while len(sink.reminders) < 3:
+                await asyncio.sleep(0)
+            dispatcher.stop()
+            await asyncio.wait_for(runner, timeout=1)
+
+        asyncio.run(scenario())
+        self.assertEqual([(r.owner, r.description) for r in sink.reminders],
+                         [("Clinic", "Walk"), ("Home", "Meds"), ("Clinic", "Late")])
+        self.assertEqual(dispatcher.next_due(), datetime(2024, 6, 1, 18, 0))
+        later.mark_complete()
+        self.assertEqual(dispatcher.next_due().date(), date(2024, 6, 2))
+        self.assertEqual(len(dispatcher), 1)
+
+    def test_sink_must_implement_send(self):
+        """ReminderSink is abstract: a sink without send cannot be created."""
+        class Silent(ReminderSink):
+            pass
+
+        with self.assertRaises(TypeError):
+            Silent()
+
+
+if __name__ == "__main__":
+    unittest.main()
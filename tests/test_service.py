@@ -0,0 +1,104 @@
+"""
+Tests for pawpal_service
+"""
+
+import sys
+import threading
+import unittest
+from pawpal_system import Owner
+from pawpal_service import ScheduleService, StaleVersionError
+
+
+class TestScheduleService(unittest.TestCase):
+    """
+    Concurrent mutations through the service keep the owner graph consistent.
+    """
+    def test_concurrent_mutations_and_snapshots(self):
+        """Threads adding and completing tasks lose no updates; snapshots reuse unchanged pets."""
+        service = ScheduleService(Owner(name="Shelter"), history_limit=1000)
+        rex = service.add_pet("Rex", "dog", 3)
+        tom = service.add_pet("Tom", "cat", 2)
+
+        def add_many(pet_id):
+            for number in range(50):
+                task = service.add_task(pet_id, f"Task {number}", "08:00", "daily")
+                service.complete_task(pet_id, task.task_id)
+
+        writers = [threading.Thread(target=add_many, args=(pet.pet_id,))
+                   for pet in (rex, tom, rex, tom)]
+        done = threading.Event()
+
+        def read_snapshots():
+            while not done.is_set():
+                service.snapshot()
+
+        readers = [threading.Thread(target=read_snapshots) for _ in range(3)]
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            for thread in writers + readers:
+                thread.start()
+            for thread in writers:
+                thread.join()
+            done.set()
+            for thread in readers:
+                thread.join()
+        finally:
+            sys.setswitchinterval(interval)
+
+        owner = service.owner
+        # one state per mutation: readers never commit a half-done change
+        self.assertEqual(len(service.history.states), 2 + 400 + 1)
+        # every completion of a daily task adds its next occurrence
+        self.assertEqual(len(rex.tasks), 200)
+        self.assertEqual(len(owner.task_index), len(owner.tasks))
+        self.assertEqual(service.read(service.scheduler.pet_task_counts),
+                         {"Rex": (100, 100), "Tom": (100, 100)})
+
+        before = service.snapshot()
+        self.assertIs(service.snapshot(), before)
+        service.add_task(tom.pet_id, "Brush", "09:00", "weekly")
+        after = service.snapshot()
+        self.assertIs(after.pet("Rex"), before.pet("Rex"))
+        self.assertEqual(len(after.pet("Tom").tasks), 201)
+
+    def test_expected_version_rejects_stale_writes(self):
+        """A mutation based on an old read fails instead of overwriting."""
+        service = ScheduleService(Owner(name="Clinic"))
+        pet = service.add_pet("Rex", "dog", 3)
+        seen = service.snapshot().pet("Rex").version
+        task = service.add_task(pet.pet_id, "Walk", "07:00", "daily", expected_version=seen)
+        with self.assertRaises(StaleVersionError):
+            service.complete_task(pet.pet_id, task.task_id, expected_version=seen)
+        self.assertFalse(task.completion_status)
+        with self.assertRaises(ValueError):
+            service.add_pet("Rex", "cat", 1)
+        service.undo()
+        self.assertEqual(service.snapshot().pet("Rex").tasks, ())
+        self.assertIsNone(pet.get_task(task.task_id))
+
+    def test_undo_between_check_and_commit_is_not_lost(self):
+        """An undo that lands after a mutation checked its pet makes the mutation fail."""
+        service = ScheduleService(Owner(name="Clinic"))
+        pet = service.add_pet("Rex", "dog", 3)
+        walk = service.add_task(pet.pet_id, "Walk", "07:00", "daily")
+        checked = service._pet
+
+        def undo_after_check(pet_id, expected_version):
+            found = checked(pet_id, expected_version)
+            service.undo()
+            return found
+
+        service._pet = undo_after_check
+        with self.assertRaises(StaleVersionError):
+            service.add_task(pet.pet_id, "Feed", "08:00", "daily")  # undo removed Walk
+        self.assertIsNone(pet.get_task(walk.task_id))
+        with self.assertRaises(ValueError):
+            service.add_task(pet.pet_id, "Feed", "08:00", "daily")  # undo removed Rex
+        del service._pet
+        self.assertEqual(service.snapshot().pets, ())
+        self.assertEqual(service.owner.pets, ())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,144 @@
+"""
+Tests for pawpal_storage
+"""
+
+import multiprocessing
+import os
+import tempfile
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from pawpal_system import Task, Pet, Owner, Scheduler, ids
+from pawpal_service import ScheduleService
+from pawpal_storage import SQLiteStore
+
+
+def allocate_ids(path, count):
+    """Process entry point: open the shared store and allocate count ids."""
+    store = SQLiteStore(path)
+    allocated = [ids.allocate() for _ in range(count)]
+    store.close()
+    return allocated
+
+
+class TestSQLiteStore(unittest.TestCase):
+    """
+    Round trips through the SQLite backend.
+    """
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "pawpal.db")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _saved_owner(self):
+        """Save an owner with two pets and return the store."""
+        store = SQLiteStore(self.path)
+        owner = Owner(name="Jordan")
+        buddy = Pet(name="Buddy", species="dog", age=5)
+        mittens = Pet(name="Mittens", species="cat", age=3)
+        owner.add_pet(buddy)
+        owner.add_pet(mittens)
+        buddy.add_task(Task(description="Walk", time="07:30", frequency="daily", duration=30,
+                            priority=3, window=("07:00", "08:00")))
+        buddy.add_task(Task(description="Vet", time="14:00", frequency="monthly"))
+        mittens.add_task(Task(description="Feed", time="08:00", frequency="daily"))
+        self.assertEqual(store.save(owner), 5)
+        return store, owner
+
+    def test_round_trip_with_lazy_pets(self):
+        """Loaded pets fetch their tasks only when first accessed."""
+        store, _ = self._saved_owner()
+        store.close()
+        store = SQLiteStore(self.path)
+        owner = store.load_owner("Jordan")
+        self.assertEqual([pet.name for pet in owner.pets], ["Buddy", "Mittens"])
+        self.assertFalse(any(pet.is_loaded for pet in owner.pets))
+        buddy = owner.pets[0]
+        self.assertEqual([t.time for t in buddy.tasks], ["07:30", "14:00"])
+        self.assertEqual((buddy.tasks[0].duration, buddy.tasks[0].priority, buddy.tasks[0].window),
+                         (30, 3, (420, 480)))
+        self.assertFalse(owner.pets[1].is_loaded)
+        self.assertEqual(store.flush(), 0)
+        self.assertIsNone(store.load_owner("Nobody"))
+        store.close()
+
+    def test_owner_queries_load_lazy_pets(self):
+        """Index-backed queries on a freshly loaded owner see the stored tasks."""
+        store, _ = self._saved_owner()
+        store.close()
+        store = SQLiteStore(self.path)
+        owner = store.load_owner("Jordan")
+        service = ScheduleService(owner, store)
+        self.assertFalse(any(pet.is_loaded for pet in owner.pets))
+        self.assertIsNone(service.snapshot().pets[0].tasks)
+
+        scheduler = Scheduler(owner)
+        self.assertEqual(len(scheduler.get_tasks_by_frequency("daily")), 2)
+        self.assertEqual(len(scheduler.filter_tasks(completion_status=False)), 3)
+        self.assertEqual(scheduler.stats().total, 3)
+        self.assertEqual(len(service.snapshot().pets[0].tasks), 2)
+        self.assertEqual(store.flush(), 0)
+        store.close()
+
+    def test_task_counts_do_not_load_pets(self):
+        """Per-pet counts come from the database for lazy pets and memory for loaded ones."""
+        store, _ = self._saved_owner()
+        store.close()
+        store = SQLiteStore(self.path)
+        owner = store.load_owner("Jordan")
+        self.assertEqual(store.task_counts(owner), {"Buddy": (2, 0), "Mittens": (1, 0)})
+        self.assertFalse(any(pet.is_loaded for pet in owner.pets))
+        owner.pets[1].tasks[0].mark_complete()  # unflushed, and adds the next occurrence
+        self.assertEqual(store.task_counts(owner), {"Buddy": (2, 0), "Mittens": (1, 1)})
+        self.assertFalse(owner.pets[0].is_loaded)
+        self.assertEqual(store.task_counts(owner), Scheduler(owner).pet_task_counts())
+        store.close()
+
+    def test_processes_sharing_a_store_get_disjoint_ids(self):
+        """Id blocks are reserved through the database, so processes never collide."""
+        SQLiteStore(self.path).close()
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=2, mp_context=context) as executor:
+            first, second = executor.map(allocate_ids, [self.path] * 2, [200000] * 2)
+        self.assertEqual(len(set(first) | set(second)), 400000)
+
+    def test_one_database_serves_ids_at_a_time(self):
+        """A second database cannot take over id blocks while the first is open."""
+        first = SQLiteStore(self.path)
+        again = SQLiteStore(self.path)
+        with self.assertRaises(ValueError):
+            SQLiteStore(os.path.join(self.tmp.name, "other.db"))
+        first.close()
+        self.assertEqual(ids.block_source, again.reserve_ids)
+        allocated = ids.allocate()
+        (next_id,) = again._conn.execute("SELECT next_id FROM id_blocks").fetchone()
+        self.assertLess(allocated, next_id)
+        again.close()
+        self.assertIsNone(ids.block_source)
+        SQLiteStore(os.path.join(self.tmp.name, "other.db")).close()
+
+    def test_flush_writes_only_dirty_rows(self):
+        """Completing a daily task writes the task and its next occurrence."""
+        store, owner = self._saved_owner()
+        owner.pets[1].tasks[0].mark_complete()
+        self.assertEqual(store.flush(), 2)
+        owner.pets[0].remove_task(owner.pets[0].tasks[1])
+        self.assertEqual(store.flush(), 1)
+        owner.pets[1].name = "Whiskers"
+        owner.pets[1].age = 4
+        self.assertEqual(store.flush(), 1)
+        store.close()
+
+        store = SQLiteStore(self.path)
+        owner = store.load_owner("Jordan")
+        pending_daily = store.find_tasks(owner, frequency="daily", completion_status=False)
+        self.assertEqual([t.description for t in pending_daily], ["Walk", "Feed"])
+        self.assertFalse(owner.pets[0].tasks[0].completion_status)
+        self.assertEqual(len(owner.pets[0].tasks), 1)
+        self.assertEqual((owner.pets[1].name, owner.pets[1].age), ("Whiskers", 4))
+        store.close()
+
+
+if __name__ == "__main__":
+    unittest.main()